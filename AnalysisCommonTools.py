@@ -1,7 +1,12 @@
 import operator
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Sequence
+
+import numpy as np
 
 from analyzers.PandasWaveGliderV2OceanAnalyzer import PandasWaveGliderV2OceanAnalyzer
+from analyzers.SciPySpatialIndex import SciPySpatialIndex
+from analyzers.ShapelyGeoFeatureAnalyzer import ShapelyGeoFeatureAnalyzer
 from etl.ETL import ETL
 from etl.extractors.CSVPandasExtractor import CSVPandasExtractor
 from etl.extractors.GeoJsonGeoPandasExtractor import GeoJsonGeoPandasExtractor
@@ -11,12 +16,16 @@ from etl.loaders.PandasSpikesLoader import PandasSpikesLoader
 from etl.loaders.PandasWaveGliderV2OceanLoader import PandasWaveGliderV2OceanLoader
 from etl.loaders.PandasWaveGliderWeatherLoader import PandasWaveGliderWeatherLoader
 from etl.transformers.PandasTransformer import PandasTransformer
+from graphers.MatplotlibBasemapRasterizer import MatplotlibBasemapRasterizer
 from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
 from graphers.MatplotlibMapChartCreator import MatplotlibMapChartCreator
+from model.CSVSchema import CSVSchema
 from model.GeoPandasMap import GeoPandasMap
 from model.ocean_devices.Seabed import Seabed
 from model.Spikes import Spikes
 from model.Table import Table
+from model.TimePyramid import TimePyramid
+from model.ocean_devices.ColumnarDevice import ColumnarDevice
 from model.ocean_devices.WaveGliderV2 import WaveGliderV2
 from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
 from model.ocean_devices.WaveGliderV2Weather import WaveGliderV2Weather
@@ -29,102 +38,159 @@ from model.params.compound_params.PlotStylishSpikesParams import PlotStylishSpik
 from model.params.compound_params.ScatterColoredParams import ScatterColoredParams
 from model.params.SpikesParams import SpikesParams
 from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
+from storer.NumpyTimePyramidStore import NumpyTimePyramidStore
 
 
 class AnalysisCommonTools:
+    MAP_MARGIN = 0.01
 
-    def __init__(self, data_dir: str, results_dir: str, store_date_format: str = None):
+    def __init__(self, data_dir: str, results_dir: str, store_date_format: str = None, columnar: bool = False,
+                 cache_dir: str = None, lazy: bool = False, pyramid_dir: str = None,
+                 figure_cache_dir: str = None, basemap_dir: str = None, downcast: bool = False):
         self.data_dir = data_dir
         self.store_date_format = store_date_format
         self.results_dir = results_dir
+        self.columnar = columnar
+        self.cache_dir = cache_dir
+        self.lazy = lazy
+        self.downcast = downcast
+        self.pyramid_store = NumpyTimePyramidStore(pyramid_dir) if pyramid_dir is not None else None
+        self.figure_storer = MatplotlibFigureStorer(figure_cache_dir)
+        self.basemap_rasterizer = MatplotlibBasemapRasterizer(basemap_dir) if basemap_dir is not None else None
 
     def get_island_map(self) -> GeoPandasMap:
-        lava_map = (self.__define_map_etl()
-                    .extract(self.data_dir + '/perimetro_dron_211215.geojson')
-                    .load())
         full_map = (self.__define_map_etl()
                     .extract(self.data_dir + '/limite_insular.geojson')
-                    .concat_data(lava_map)
+                    .concat_data(self.__extract_lava_flows())
                     .add_column("label", ["La Palma", "Coladas de lava"])
                     .load())
         return full_map
 
+    def get_lava_flow_map(self) -> GeoPandasMap:
+        return self.__extract_lava_flows().load()
+
+    def add_lava_flow_features(self, etl: ETL, latitude_column: str = "Latitude_deg",
+                               longitude_column: str = "Longitude_deg") -> ETL:
+        lava_flows = ShapelyGeoFeatureAnalyzer(self.get_lava_flow_map())
+        return (etl.add_column("Inside_lava_flow", lava_flows.inside, [latitude_column, longitude_column])
+                .add_column("Lava_flow_distance_km", lava_flows.distance_to_edges_km,
+                            [latitude_column, longitude_column]))
+
+    def __extract_lava_flows(self) -> ETL:
+        return self.__define_map_etl().extract(self.data_dir + '/perimetro_dron_211215.geojson')
+
     def __define_map_etl(self) -> ETL:
-        return ETL(GeoJsonGeoPandasExtractor(), PandasTransformer(), GeoPandasMapLoader())
+        return ETL(GeoJsonGeoPandasExtractor(self.cache_dir), PandasTransformer(), GeoPandasMapLoader())
 
     def define_etl_glider(self, parse_dates: list[str], date_format: str, relevant_cols_idx: list[int],
                           delimiter: str = ",") -> ETL:
-        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter), PandasTransformer(),
-                   PandasWaveGliderV2OceanLoader())
+        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter, cache_dir=self.cache_dir,
+                                      schema=self.define_wave_glider_ocean_schema(), downcast=self.downcast),
+                   PandasTransformer(),
+                   PandasWaveGliderV2OceanLoader(self.columnar), self.lazy)
 
     def define_etl_weather(self, parse_dates: list[str] | None, date_format: str | None, relevant_col_idx: list[int]):
-        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_col_idx), PandasTransformer(),
-                   PandasWaveGliderWeatherLoader())
+        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_col_idx, cache_dir=self.cache_dir,
+                                      schema=self.define_wave_glider_weather_schema(), downcast=self.downcast),
+                   PandasTransformer(),
+                   PandasWaveGliderWeatherLoader(self.columnar), self.lazy)
 
     def define_seabed_etl(self, parse_dates: list[str] | None, date_format: str | None, relevant_cols_idx: list[int],
                           delimiter: str = ","):
-        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter=delimiter),
-                   PandasTransformer(), PandasSeabedLoader())
+        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter=delimiter,
+                                      cache_dir=self.cache_dir, schema=self.define_seabed_schema(),
+                                      downcast=self.downcast),
+                   PandasTransformer(self.cache_dir), PandasSeabedLoader(self.columnar), self.lazy)
 
     def define_etl_spikes(self, parse_dates: list[str], date_format: str, relevant_cols_idx: list[int],
                           delimiter: str = ",", index_col: list[int] = False) -> ETL:
-        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter, index_col),
+        return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter, index_col,
+                                      cache_dir=self.cache_dir, shared=True),
                    PandasTransformer(),
-                   PandasSpikesLoader())
+                   PandasSpikesLoader(self.columnar), self.lazy)
+
+    def get_time_pyramids(self, device: ColumnarDevice) -> dict[str, TimePyramid]:
+        return self.pyramid_store.get(device) if self.pyramid_store is not None else {}
 
     def create_time_series_with_spikes_plot(self, wave_glider: WaveGliderV2Ocean,
                                             analyzer: PandasWaveGliderV2OceanAnalyzer,
                                             title: str, filename: str) -> Table:
-        outliers_table = self.draw_time_series_with_spikes(wave_glider, title, analyzer)
-        MatplotlibFigureStorer().store(self.results_dir + filename)
-        return outliers_table
-
-    def draw_time_series_with_spikes(self, glider: WaveGliderV2Ocean, title: str,
-                                     analyzer: PandasWaveGliderV2OceanAnalyzer) -> Table:
-        salinity_outliers = analyzer.analyze_outliers_salinity(glider)
-        oxygen_outliers = analyzer.analyze_outliers_oxygen(glider)
-        temperature_plot_params, conductivity_plot_params, salinity_plot_params, oxygen_plot_params = (
-            self.__define_wave_glider_data_plot_params(glider, salinity_outliers, oxygen_outliers))
-        MatplotlibFigureCreator(4, 1, (15, 10)).create_timeseries_with_outliers(
+        outliers = analyzer.analyze_outliers(wave_glider, [Spikes.SpikeVariable.SALINITY_PSU,
+                                                           Spikes.SpikeVariable.OXYGEN_UMOL_L])
+        plot_params = self.__define_wave_glider_data_plot_params(
+            wave_glider,
+            outliers.filter_variable(Spikes.SpikeVariable.SALINITY_PSU,
+                                     analyzer.spike_thresholds[Spikes.SpikeVariable.SALINITY_PSU]),
+            outliers.filter_variable(Spikes.SpikeVariable.OXYGEN_UMOL_L,
+                                     analyzer.spike_thresholds[Spikes.SpikeVariable.OXYGEN_UMOL_L]),
+            self.get_time_pyramids(wave_glider))
+        fig_size = (15, 10)
+        if not self.figure_storer.is_up_to_date(self.results_dir + filename, plot_params, title, fig_size,
+                                                 wave_glider.timestamp):
+            visualizer = MatplotlibFigureCreator(4, 1, fig_size)
+            self.draw_time_series_with_spikes(visualizer, plot_params, title, wave_glider.timestamp)
+            self.figure_storer.store(self.results_dir + filename, visualizer.fig)
+        return outliers.to_table()
+
+    def draw_time_series_with_spikes(self, visualizer: MatplotlibFigureCreator,
+                                     plot_params: tuple[PlotStylishParams, PlotStylishParams,
+                                                        PlotStylishSpikesParams, PlotStylishSpikesParams],
+                                     title: str, timestamps: list) -> None:
+        temperature_plot_params, conductivity_plot_params, salinity_plot_params, oxygen_plot_params = plot_params
+        visualizer.create_timeseries_with_outliers(
             [temperature_plot_params, conductivity_plot_params],
             [salinity_plot_params, oxygen_plot_params],
             title,
-            glider.timestamp)
-        return salinity_outliers.to_table().concat_equal_tables(oxygen_outliers.to_table())
+            timestamps)
 
     def create_weather_mean_daily_plot(self, weather: WaveGliderV2Weather, title: str, filename: str) -> None:
-        visualizer = MatplotlibFigureCreator(1, 1, (14, 7))
-        visualizer.set_three_plotters_one_figure()
         wind_plot_params, temperature_plot_params, gust_wind_plot_params = self.define_daily_means_plot_params(
             weather)
+        fig_size = (14, 7)
+        if self.figure_storer.is_up_to_date(self.results_dir + filename, wind_plot_params, temperature_plot_params,
+                                            gust_wind_plot_params, title, fig_size, weather.timestamp):
+            return
+        visualizer = MatplotlibFigureCreator(1, 1, fig_size)
+        visualizer.set_three_plotters_one_figure()
         visualizer.create_daily_means([temperature_plot_params, wind_plot_params],
                                       [gust_wind_plot_params],
                                       title,
                                       weather.timestamp)
-        MatplotlibFigureStorer().store(self.results_dir + filename)
+        self.figure_storer.store(self.results_dir + filename, visualizer.fig)
 
     def define_data_colored_map_params(self, wave_glider: WaveGliderV2Ocean,
                                        area_to_plot: tuple[float, float, float, float]) \
             -> list[ScatterColoredParams]:
+        visible_samples = self.__visible_samples(wave_glider, LimitedPlotArea(*area_to_plot))
         return [
-            ScatterColoredParams(
-                BasicPlotParams(wave_glider.longitude_deg, wave_glider.latitude_deg, "Temperatura"),
-                ColorParams(wave_glider.temperature_c, "viridis", "Temperatura Cº", "white"),
-                LimitedPlotArea(*area_to_plot)),
-            ScatterColoredParams(
-                BasicPlotParams(wave_glider.longitude_deg, wave_glider.latitude_deg, "Salinidad"),
-                ColorParams(wave_glider.salinity_psu, "viridis", "Salinidad PSU", "white"),
-                LimitedPlotArea(*area_to_plot)),
-            ScatterColoredParams(
-                BasicPlotParams(wave_glider.longitude_deg, wave_glider.latitude_deg, "Oxígeno"),
-                ColorParams(wave_glider.oxygen, "viridis", "Oxígeno", "white"),
-                LimitedPlotArea(*area_to_plot)),
-            ScatterColoredParams(
-                BasicPlotParams(wave_glider.longitude_deg, wave_glider.latitude_deg, "Conductividad"),
-                ColorParams(wave_glider.conductivity_s_m, "viridis", "Conductividad S/m", "white"),
-                LimitedPlotArea(*area_to_plot))
+            self.__create_colored_map_plot_param(wave_glider, visible_samples, area_to_plot, "Temperatura",
+                                                 wave_glider.temperature_c, "Temperatura Cº"),
+            self.__create_colored_map_plot_param(wave_glider, visible_samples, area_to_plot, "Salinidad",
+                                                 wave_glider.salinity_psu, "Salinidad PSU"),
+            self.__create_colored_map_plot_param(wave_glider, visible_samples, area_to_plot, "Oxígeno",
+                                                 wave_glider.oxygen, "Oxígeno"),
+            self.__create_colored_map_plot_param(wave_glider, visible_samples, area_to_plot, "Conductividad",
+                                                 wave_glider.conductivity_s_m, "Conductividad S/m")
         ]
 
+    def __visible_samples(self, wave_glider: WaveGliderV2Ocean, area: LimitedPlotArea) -> np.ndarray:
+        x_margin = (area.x_max - area.x_min) * self.MAP_MARGIN
+        y_margin = (area.y_max - area.y_min) * self.MAP_MARGIN
+        return (SciPySpatialIndex(wave_glider.latitude_deg, wave_glider.longitude_deg)
+                .within_area(LimitedPlotArea(area.x_min - x_margin, area.x_max + x_margin,
+                                             area.y_min - y_margin, area.y_max + y_margin)))
+
+    def __create_colored_map_plot_param(self, wave_glider: WaveGliderV2Ocean, visible_samples: np.ndarray,
+                                        area_to_plot: tuple[float, float, float, float], title: str,
+                                        values: Sequence[float], colored_label: str) -> ScatterColoredParams:
+        values = np.asarray(values, dtype=float)
+        return ScatterColoredParams(
+            BasicPlotParams(np.asarray(wave_glider.longitude_deg)[visible_samples],
+                            np.asarray(wave_glider.latitude_deg)[visible_samples], title),
+            ColorParams(values[visible_samples], "viridis", colored_label, "white",
+                        (np.nanmin(values), np.nanmax(values))),
+            LimitedPlotArea(*area_to_plot))
+
     def define_daily_means_plot_params(self, weather: WaveGliderV2Weather) -> \
             tuple[PlotStylishParams, PlotStylishParams, PlotStylishParams]:
         temperature_plot_params = PlotStylishParams(
@@ -144,20 +210,23 @@ class AnalysisCommonTools:
                             self.calculate_max_lim(weather.wind_gust_speed_kt)))
         return wind_plot_params, temperature_plot_params, gust_wind_plot_params
 
-    def define_weather_plot_params(self, weather: WaveGliderV2Weather) -> \
+    def define_weather_plot_params(self, weather: WaveGliderV2Weather,
+                                   pyramids: dict[str, TimePyramid] = None) -> \
             tuple[PlotStylishParams, PlotStylishParams, PlotStylishParams]:
+        pyramids = pyramids if pyramids is not None else {}
         temperature_plot_params = PlotStylishParams(
-            BasicPlotParams(weather.index, weather.temperature_c, "Temperatura"),
+            BasicPlotParams(weather.index, weather.temperature_c, "Temperatura", pyramids.get("temperature_c")),
             MarkerParams("coral", "Temperatura", "-", 1),
             LimitedPlotArea(min(weather.index), max(weather.index), self.calculate_min_lim(weather.temperature_c),
                             self.calculate_max_lim(weather.temperature_c)))
         wind_plot_params = PlotStylishParams(
-            BasicPlotParams(weather.index, weather.wind_speed_kt, "Velocidad viento"),
+            BasicPlotParams(weather.index, weather.wind_speed_kt, "Velocidad viento", pyramids.get("wind_speed_kt")),
             MarkerParams("darkolivegreen", "Velocidad viento", "--", 1),
             LimitedPlotArea(min(weather.index), max(weather.index), self.calculate_min_lim(weather.wind_speed_kt),
                             self.calculate_max_lim(weather.wind_speed_kt)))
         gust_wind_plot_params = PlotStylishParams(
-            BasicPlotParams(weather.index, weather.wind_gust_speed_kt, "Velocidad de ráfagas de viento"),
+            BasicPlotParams(weather.index, weather.wind_gust_speed_kt, "Velocidad de ráfagas de viento",
+                            pyramids.get("wind_gust_speed_kt")),
             MarkerParams("indigo", "Ráfagas de viento", "o", 10),
             LimitedPlotArea(min(weather.index), max(weather.index), self.calculate_min_lim(weather.wind_gust_speed_kt),
                             self.calculate_max_lim(weather.wind_gust_speed_kt)))
@@ -176,20 +245,30 @@ class AnalysisCommonTools:
         return max(value_list) + 0.005 * max(value_list)
 
     def create_weather_plot(self, weather: WaveGliderV2Weather, title: str, filename) -> None:
-        visualizer = MatplotlibFigureCreator(3, 1, (14, 8))
-        wind_plot_params, temperature_plot_params, gust_wind_plot_params = self.define_weather_plot_params(weather)
+        wind_plot_params, temperature_plot_params, gust_wind_plot_params = self.define_weather_plot_params(
+            weather, self.get_time_pyramids(weather))
+        fig_size = (14, 8)
+        if self.figure_storer.is_up_to_date(self.results_dir + filename, wind_plot_params, temperature_plot_params,
+                                            gust_wind_plot_params, title, fig_size, weather.timestamp):
+            return
+        visualizer = MatplotlibFigureCreator(3, 1, fig_size)
         visualizer.create_timeseries([temperature_plot_params, wind_plot_params],
                                      [gust_wind_plot_params], title,
                                      weather.timestamp)
-        MatplotlibFigureStorer().store(self.results_dir + filename)
+        self.figure_storer.store(self.results_dir + filename, visualizer.fig)
 
     def create_travel_map(self, map: GeoPandasMap, wave_glider_22: WaveGliderV2Ocean,
                           area_to_plot: tuple[float, float, float, float]) -> None:
         plots = self.__define_travel_params(wave_glider_22, area_to_plot)
-        visualizer = MatplotlibMapChartCreator(2, 2, (20, 20))
+        filename = self.results_dir + "/recorrido_por_partes_glider_22.jpg"
+        title = "Recorrido de la misión de 2022"
+        fig_size = (20, 20)
+        if self.figure_storer.is_up_to_date(filename, plots, map, title, fig_size):
+            return
+        visualizer = MatplotlibMapChartCreator(2, 2, fig_size, self.basemap_rasterizer)
         visualizer.add_map_to_plots(map, "label", ["orangered", "darkgreen"])
-        visualizer.create_map_with_data_directions(plots, "Recorrido de la misión de 2022")
-        MatplotlibFigureStorer().store(self.results_dir + "/recorrido_por_partes_glider_22.jpg")
+        visualizer.create_map_with_data_directions(plots, title)
+        self.figure_storer.store(filename, visualizer.fig)
 
     def __define_travel_params(self, glider: WaveGliderV2Ocean, area_to_plot: tuple[float, float, float, float]) \
             -> list[ScatterColoredParams]:
@@ -222,22 +301,26 @@ class AnalysisCommonTools:
         return list(map(lambda dt: dt.timestamp() * 1000, datetime_list))
 
     def __define_wave_glider_data_plot_params(self, cleaned_22_data: WaveGliderV2Ocean, salinity_outliers: Spikes,
-                                              oxygen_outliers: Spikes) \
+                                              oxygen_outliers: Spikes, pyramids: dict[str, TimePyramid] = None) \
             -> tuple[PlotStylishParams, PlotStylishParams, PlotStylishSpikesParams, PlotStylishSpikesParams]:
+        pyramids = pyramids if pyramids is not None else {}
         temperature_plot_params = PlotStylishParams(
-            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.temperature_c, "Temperatura"),
+            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.temperature_c, "Temperatura",
+                            pyramids.get("temperature_c")),
             MarkerParams("coral", "Temperatura", "-", 1),
             LimitedPlotArea(min(cleaned_22_data.index),max(cleaned_22_data.index),
                             self.calculate_min_lim(cleaned_22_data.temperature_c),
                             self.calculate_max_lim(cleaned_22_data.temperature_c)))
         conductivity_plot_params = PlotStylishParams(
-            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.conductivity_s_m, "Conductividad"),
+            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.conductivity_s_m, "Conductividad",
+                            pyramids.get("conductivity_s_m")),
             MarkerParams("darkolivegreen", "Conductividad", "--", 1),
             LimitedPlotArea(min(cleaned_22_data.index),max(cleaned_22_data.index),
                             self.calculate_min_lim(cleaned_22_data.conductivity_s_m),
                             self.calculate_max_lim(cleaned_22_data.conductivity_s_m)))
         salinity_plot_params = PlotStylishSpikesParams(
-            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.salinity_psu, "Salinidad"),
+            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.salinity_psu, "Salinidad",
+                            pyramids.get("salinity_psu")),
             MarkerParams("indigo", "Salinidad PSU", "o", 10),
             LimitedPlotArea(min(cleaned_22_data.index), max(cleaned_22_data.index),
                             self.calculate_min_lim_salinity(cleaned_22_data.salinity_psu),
@@ -247,7 +330,7 @@ class AnalysisCommonTools:
                                "red")
         )
         oxygen_plot_params = PlotStylishSpikesParams(
-            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.oxygen, "Oxígeno"),
+            BasicPlotParams(cleaned_22_data.index, cleaned_22_data.oxygen, "Oxígeno", pyramids.get("oxygen")),
             MarkerParams("goldenrod", "Oxígeno", "o", 10),
             LimitedPlotArea(min(cleaned_22_data.index),max(cleaned_22_data.index),
                             self.calculate_min_lim(cleaned_22_data.oxygen),
@@ -280,6 +363,25 @@ class AnalysisCommonTools:
                 "Longitude" : "Longitude_deg", "Pressure(mb)" : "Pressure_d",
                 "Wind Gust Speed(kt)": "Wind_gust_speed_kt", 'Wind Direction': "Wind_direction"}
 
+    def define_wave_glider_ocean_schema(self) -> CSVSchema:
+        return CSVSchema({"Temperature": "float64", "Conductivity": "float64", "Salinity (PSU)": "float64",
+                          "Oxygen": "float64", "Pressure": "float64", "Latitude(deg)": "float64",
+                          "Longitude(deg)": "float64"},
+                         {"Temperature": 5e-5, "Conductivity": 5e-6, "Salinity (PSU)": 5e-5, "Oxygen": 5e-4,
+                          "Pressure": 5e-4, "Latitude(deg)": 5e-6, "Longitude(deg)": 5e-6})
+
+    def define_wave_glider_weather_schema(self) -> CSVSchema:
+        return CSVSchema({"Temperature(degC)": "float64", "Wind Speed(kt)": "float64", "Latitude": "float64",
+                          "Longitude": "float64", "Pressure(mb)": "float64", "Wind Gust Speed(kt)": "float64",
+                          "Wind Direction": "float64"},
+                         {"Temperature(degC)": 5e-4, "Wind Speed(kt)": 5e-3, "Pressure(mb)": 5e-3,
+                          "Wind Gust Speed(kt)": 5e-3, "Wind Direction": 5e-2})
+
+    def define_seabed_schema(self) -> CSVSchema:
+        return CSVSchema({"Temperature_C": "float64", "Conductivity_S_m": "float64", "Salinity_PSU": "float64",
+                          "Day": "Int64", "Year": "Int64", "Time": "str"},
+                         {"Temperature_C": 5e-5, "Conductivity_S_m": 5e-6, "Salinity_PSU": 5e-5})
+
     def define_variable_renames_to_spanish(self) -> dict[str, str]:
         return {"Temperature_C": "Temperatura Cº", "Conductivity_S_m": "Conductividad S/m",
                 "Salinity_PSU": "Salinidad PSU", "Oxygen_umol_L": "Oxígeno umol/L", "TimeStamp" : "TimeStamp",
@@ -351,48 +453,44 @@ class AnalysisCommonTools:
     def create_glider_obj(self, etl_ocean: ETL, etl_weather: ETL) -> WaveGliderV2:
         ocean_hour_mean = (etl_ocean
                            .compute_average_per_day_hour("TimeStamp")
-                           .remove_values_not_in("TimeStamp",
-                                                 etl_weather.compute_average_per_day_hour("TimeStamp"))
-                           .sort_values("TimeStamp")
+                           .align_with("TimeStamp", etl_weather.compute_average_per_day_hour("TimeStamp"),
+                                       tolerance=timedelta(0))
                            .load())
-        weather_hour_mean = (etl_weather.remove_values_not_in("TimeStamp", etl_ocean)
-                             .sort_values("TimeStamp")
-                             .load())
-        return WaveGliderV2(ocean_hour_mean, weather_hour_mean)
+        return WaveGliderV2(ocean_hour_mean, etl_weather.load())
 
     def get_ocean_data_22(self, cols_rename_glider, etl_drifted_22, etl_ocean_22, glider_drift_start_date,
                           spikes_22: Spikes, spikes_22_drifted: Spikes):
-        ocean_22 = (etl_ocean_22
-                    .extract(self.data_dir + "/WG_220202_220318/MERGED_CTD_withOxygenCalc.csv")
-                    .rename_columns(cols_rename_glider)
-                    .filter_column("TimeStamp", operator.lt, glider_drift_start_date)
-                    .filter_column("Pressure_d", operator.gt, 0)
-                    .interpolate_outliers(spikes_22, "TimeStamp")
-                    .sort_values("TimeStamp")
-                    .load())
-        drifted_22 = (etl_drifted_22
-                      .extract(self.data_dir + "/WG_220202_220318/MERGED_CTD_withOxygenCalc.csv")
-                      .rename_columns(cols_rename_glider)
+        (etl_ocean_22
+         .extract(self.data_dir + "/WG_220202_220318/MERGED_CTD_withOxygenCalc.csv")
+         .rename_columns(cols_rename_glider))
+        drifted_22 = (etl_ocean_22.fork(etl_drifted_22)
                       .filter_column("TimeStamp", operator.gt, glider_drift_start_date)
                       .filter_column("Pressure_d", operator.gt, 0)
                       .interpolate_outliers(spikes_22_drifted, "TimeStamp")
                       .filter_column_and_interpolate("Conductivity_S_m", operator.gt, 4.7)
                       .sort_values("TimeStamp")
                       .load())
+        ocean_22 = (etl_ocean_22
+                    .filter_column("TimeStamp", operator.lt, glider_drift_start_date)
+                    .filter_column("Pressure_d", operator.gt, 0)
+                    .interpolate_outliers(spikes_22, "TimeStamp")
+                    .sort_values("TimeStamp")
+                    .load())
         return drifted_22, ocean_22
 
     def get_weather_data_22(self, cols_rename_weather: dict[str, str], glider_drift_start_date: str,
                             weather_etl: ETL, weather_etl_drifted: ETL):
-        weather_22 = (weather_etl.extract(self.data_dir + "/WG_220202_220318/MERGED_WEATHER.csv", )
-                      .rename_columns(cols_rename_weather)
-                      .filter_column("TimeStamp", operator.lt, glider_drift_start_date)
-                      .sort_values("TimeStamp")
-                      .load())
-        weather_drifted_22 = (weather_etl_drifted.extract(self.data_dir + "/WG_220202_220318/MERGED_WEATHER.csv")
-                              .rename_columns(cols_rename_weather)
+        (weather_etl
+         .extract(self.data_dir + "/WG_220202_220318/MERGED_WEATHER.csv")
+         .rename_columns(cols_rename_weather))
+        weather_drifted_22 = (weather_etl.fork(weather_etl_drifted)
                               .filter_column("TimeStamp", operator.gt, glider_drift_start_date)
                               .sort_values("TimeStamp")
                               .load())
+        weather_22 = (weather_etl
+                      .filter_column("TimeStamp", operator.lt, glider_drift_start_date)
+                      .sort_values("TimeStamp")
+                      .load())
         return weather_22, weather_drifted_22
 
     def get_seabed_23_data(self) -> Seabed:
@@ -410,8 +508,7 @@ class AnalysisCommonTools:
         return (self.define_seabed_etl(None, None,
                                        [0, 1, 2, 3, 4, 5, 6], r"\s+")
                 .extract(self.data_dir + "/Fondeo_24/sbe37sm-rs232_03714294_2024_04_10.asc")
-                .merge_columns(["Day", "Month", "Year", "Time"], "TimeStamp", " ")
-                .parse_datetime_column("TimeStamp")
+                .assemble_datetime_column(["Day", "Month", "Year", "Time"], "TimeStamp")
                 .filter_column("Conductivity_S_m", operator=operator.ge, value=1)
                 .interpolate_outliers(spikes, "TimeStamp")
                 .sort_values("TimeStamp")
@@ -1,9 +1,13 @@
 import math
+import os
 from typing import Union
 
+import pandas as pd
+
 from AnalysisCommonTools import AnalysisCommonTools
 from analyzers.SciPyCorrelationAnalyzer import SciPyCorrelationAnalyzer
 from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
+from graphers.ProcessPoolFigureRenderer import ProcessPoolFigureRenderer
 from model.Table import Table
 from model.ocean_devices.Seabed import Seabed
 from model.ocean_devices.WaveGliderV2 import WaveGliderV2
@@ -18,9 +22,10 @@ from storer.CsvPandasStorer import CsvPandasStorer
 from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
 
 DATA_DIR = "./data"
+CACHE_DIR = os.environ.get("LA_PALMA_CACHE_DIR")
 RESULTS_DIRECTORY = "./results/correlation"
 STORE_DATE_FORMAT = "%d/%m/%Y %H:%M"
-exploratory_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIRECTORY, STORE_DATE_FORMAT)
+exploratory_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIRECTORY, STORE_DATE_FORMAT, cache_dir=CACHE_DIR)
 
 
 def main_correlation():
@@ -37,58 +42,67 @@ def main_correlation():
                        "oxigeno_salinidad.csv": ox_sal,
                        "temperatura_oc_temperatura_clima.csv": ocean_temp_weather_temp,
                        "temperatura_sal.csv": temp_sal})
-    graph_correlations(drifted_ocean_22, glider_21, glider_22, glider_drifted_22, ocean_21, ocean_22, seabed_23,
-                       seabed_24)
+    with ProcessPoolFigureRenderer() as renderer:
+        graph_correlations(renderer, drifted_ocean_22, glider_21, glider_22, glider_drifted_22, ocean_21, ocean_22,
+                           seabed_23, seabed_24)
 
 
-def graph_correlations(drifted_ocean_22, glider_21, glider_22, glider_drifted_22, ocean_21, ocean_22, seabed_23,
-                       seabed_24) -> None:
+def graph_correlations(renderer: ProcessPoolFigureRenderer, drifted_ocean_22, glider_21, glider_22,
+                       glider_drifted_22, ocean_21, ocean_22, seabed_23, seabed_24) -> None:
     cond_temp_data = [ocean_21, ocean_22, drifted_ocean_22, seabed_23, seabed_24]
-    graph(define_corr_params("Temperatura", "Conductividad", "coral", "darkolivegreen",
-                             get_index(cond_temp_data), get_temp(cond_temp_data),
-                             get_cond(cond_temp_data),
-                             ["Misión de 2021", "Misión 2022 antes de desviarse", "Misión de 2022 tras el desvío ",
-                              "Misión de 2023", "Misión de 2024"]),
-          get_timestamp(cond_temp_data),
-          "Correlación temperatura y conductividad.",
-          "/conductividad_vs_temperatura.jpg")
+    renderer.submit(graph,
+                    define_corr_params("Temperatura", "Conductividad", "coral", "darkolivegreen",
+                                       get_index(cond_temp_data), get_temp(cond_temp_data),
+                                       get_cond(cond_temp_data),
+                                       ["Misión de 2021", "Misión 2022 antes de desviarse",
+                                        "Misión de 2022 tras el desvío ", "Misión de 2023", "Misión de 2024"]),
+                    get_timestamp(cond_temp_data),
+                    "Correlación temperatura y conductividad.",
+                    "/conductividad_vs_temperatura.jpg")
     temp_sal_data = [ocean_21, ocean_22, drifted_ocean_22, seabed_23, seabed_24]
-    graph(define_corr_params_with_first_sal("Salinidad", "Temperatura", "navy", "tomato",
-                                            get_index(temp_sal_data), get_sal(temp_sal_data), get_temp(temp_sal_data),
-
-                                            ["Misión de 2021", "Misión 2022 antes de desviarse",
-                                             "Misión de 2022 tras el desvío ", "Misión de 2023", "Misión de 2024"]),
-          get_timestamp(temp_sal_data),
-          "Correlación temperatura y salinidad.",
-          "/temperatura_vs_salinidad.jpg")
+    renderer.submit(graph,
+                    define_corr_params_with_first_sal("Salinidad", "Temperatura", "navy", "tomato",
+                                                      get_index(temp_sal_data), get_sal(temp_sal_data),
+                                                      get_temp(temp_sal_data),
+                                                      ["Misión de 2021", "Misión 2022 antes de desviarse",
+                                                       "Misión de 2022 tras el desvío ", "Misión de 2023",
+                                                       "Misión de 2024"]),
+                    get_timestamp(temp_sal_data),
+                    "Correlación temperatura y salinidad.",
+                    "/temperatura_vs_salinidad.jpg")
     ox_sal_data = [ocean_21, ocean_22, drifted_ocean_22]
-    graph(define_corr_params_with_second_sal("Oxígeno", "Salinidad", "goldenrod", "indigo",
-                                             get_index(ox_sal_data), get_ox(ox_sal_data),
-                                             get_sal(ox_sal_data),
-                                             ["Misión de 2021", "Misión 2022 antes de desviarse",
-                                              "Misión de 2022 tras el desvío "]),
-          get_timestamp(ox_sal_data),
-          "Correlación oxígeno y salinidad.", "/oxigeno_vs_salinidad.jpg")
+    renderer.submit(graph,
+                    define_corr_params_with_second_sal("Oxígeno", "Salinidad", "goldenrod", "indigo",
+                                                       get_index(ox_sal_data), get_ox(ox_sal_data),
+                                                       get_sal(ox_sal_data),
+                                                       ["Misión de 2021", "Misión 2022 antes de desviarse",
+                                                        "Misión de 2022 tras el desvío "]),
+                    get_timestamp(ox_sal_data),
+                    "Correlación oxígeno y salinidad.", "/oxigeno_vs_salinidad.jpg")
     ox_temp_data = [ocean_21, ocean_22, drifted_ocean_22]
-    graph(define_corr_params("Oxígeno", "Temperatura", "goldenrod", "coral",
-                             get_index(ox_temp_data), get_ox(ox_temp_data),
-                             get_temp(ox_temp_data),
-                             ["Misión de 2021", "Misión 2022 antes de desviarse", "Misión de 2022 tras el desvío "]),
-          get_timestamp(ox_temp_data),
-          "Correlación oxígeno y temperatura.", "/oxigeno_vs_temperatura.jpg")
+    renderer.submit(graph,
+                    define_corr_params("Oxígeno", "Temperatura", "goldenrod", "coral",
+                                       get_index(ox_temp_data), get_ox(ox_temp_data),
+                                       get_temp(ox_temp_data),
+                                       ["Misión de 2021", "Misión 2022 antes de desviarse",
+                                        "Misión de 2022 tras el desvío "]),
+                    get_timestamp(ox_temp_data),
+                    "Correlación oxígeno y temperatura.", "/oxigeno_vs_temperatura.jpg")
     temp_temp_data = [glider_21, glider_22, glider_drifted_22]
-    graph(define_corr_params("Temperatura de la \n superficie  del mar", "Temperatura del clima", "darkolivegreen",
-                             "coral",
-                             get_ocean_index(temp_temp_data), get_ocean_temp(temp_temp_data),
-                             get_weather_temp(temp_temp_data),
-                             ["Misión de 2021", "Misión 2022 antes de desviarse", "Misión de 2022 tras el desvío "]),
-          get_ocean_timestamp(temp_temp_data),
-          "Correlación temperatura del océano \n y temperatura del clima", "/temp_vs_temp.jpg")
+    renderer.submit(graph,
+                    define_corr_params("Temperatura de la \n superficie  del mar", "Temperatura del clima",
+                                       "darkolivegreen", "coral",
+                                       get_ocean_index(temp_temp_data), get_ocean_temp(temp_temp_data),
+                                       get_weather_temp(temp_temp_data),
+                                       ["Misión de 2021", "Misión 2022 antes de desviarse",
+                                        "Misión de 2022 tras el desvío "]),
+                    get_ocean_timestamp(temp_temp_data),
+                    "Correlación temperatura del océano \n y temperatura del clima", "/temp_vs_temp.jpg")
 
 
 def graph(corr_graph_params, timestamp: list, title: str, filename: str) -> None:
-    graph_correlation(title, corr_graph_params, timestamp)
-    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + filename)
+    chart_creator = graph_correlation(title, corr_graph_params, timestamp)
+    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + filename, chart_creator.fig)
 
 
 def get_ocean_temp(data: list[WaveGliderV2]) -> \
@@ -135,9 +149,11 @@ def get_temp(data: list[Union[WaveGliderV2Ocean, WaveGliderV2Weather, WaveGlider
     return list(map(lambda x: x.temperature_c, data))
 
 
-def graph_correlation(title: str, params: list[tuple[PlotStylishParams, PlotStylishParams]], x_ticks: list[list]) -> None:
+def graph_correlation(title: str, params: list[tuple[PlotStylishParams, PlotStylishParams]],
+                      x_ticks: list[list]) -> MatplotlibFigureCreator:
     chart_creator = MatplotlibFigureCreator(len(params), 1, (9, math.ceil((10 / 4) * len(params))))
     chart_creator.create_correlations(params, [], title, x_ticks)
+    return chart_creator
 
 
 def get_timestamp(data: list[Union[WaveGliderV2Ocean, WaveGliderV2Weather, WaveGliderV2, Seabed]]) -> \
@@ -302,4 +318,6 @@ def create_correlation_input_cond_oxyg(label: str, data: Union[WaveGliderV2Ocean
     return CorrelationInput(data.oxygen, data.temperature_c, label)
 
 
-main_correlation()
+if __name__ == "__main__":
+    pd.set_option("mode.copy_on_write", True)
+    main_correlation()
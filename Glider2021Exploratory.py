@@ -1,4 +1,7 @@
 import operator
+import os
+
+import pandas as pd
 
 from AnalysisCommonTools import AnalysisCommonTools
 from analyzers.PandasWaveGliderV2OceanAnalyzer import PandasWaveGliderV2OceanAnalyzer
@@ -8,6 +11,7 @@ from etl.extractors.CSVPandasExtractor import CSVPandasExtractor
 from etl.loaders.PandasWaveGliderWeatherLoader import PandasWaveGliderWeatherLoader
 from etl.transformers.PandasTransformer import PandasTransformer
 from graphers.MatplotlibMapChartCreator import MatplotlibMapChartCreator
+from graphers.ProcessPoolFigureRenderer import ProcessPoolFigureRenderer
 from model.GeoPandasMap import GeoPandasMap
 from model.Table import Table
 from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
@@ -21,7 +25,11 @@ from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
 RESULTS_DIRECTORY = "./results/exploratory/glider21"
 STORE_DATE_FORMAT = "%d/%m/%Y %H:%M"
 DATA_DIR = "./data"
-common_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIRECTORY, STORE_DATE_FORMAT)
+CACHE_DIR = os.environ.get("LA_PALMA_CACHE_DIR")
+PYRAMID_DIR = os.path.join(CACHE_DIR, "pyramids") if CACHE_DIR is not None else None
+BASEMAP_DIR = os.path.join(CACHE_DIR, "basemaps") if CACHE_DIR is not None else None
+common_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIRECTORY, STORE_DATE_FORMAT, cache_dir=CACHE_DIR,
+                                   pyramid_dir=PYRAMID_DIR, basemap_dir=BASEMAP_DIR)
 
 
 def main():
@@ -30,41 +38,41 @@ def main():
         *define_21_preprocess_variables())
     glider_22_cleaned, drifted_22 = get_ctd_clean_22_data(*define_22_preprocess_variables())
     weather, daily = get_weather_data(*define_weather_preprocess_variables())
-    create_first_map(full_map, wave_glider_21_cleaned, wave_glider_21_original)
-    outliers_table = (common_tools
-                      .create_time_series_with_spikes_plot(wave_glider_21_cleaned,
-                                                           PandasWaveGliderV2OceanAnalyzer(wave_glider_21_cleaned,
-                                                                                           glider_22_cleaned,
-                                                                                           drifted_22),
-                                                           "Visualización inicial de los datos de la misión 2021",
-                                                           "/datos_glider_21.jpg"))
-    store_analyzed_data(wave_glider_21_cleaned, glider_drifted_21, weather, outliers_table)
-    create_map_with_all_data(full_map, wave_glider_21_cleaned, (-18.1, -17.9, 28.45, 28.70))
-    common_tools.create_travel_map(full_map, wave_glider_21_cleaned, (-18.1, -17.9, 28.46, 28.685))
-    common_tools.create_weather_plot(weather, "Visualización del clima de la misión de 2021",
-                                          "/weather_data_21.jpg")
-    common_tools.create_weather_mean_daily_plot(daily,
-                                                     "Visualización de medias por hora en datos del clima de la misión 2021",
-                                                     "/visualización_de_media_diaria_clima_21.jpg")
+    with ProcessPoolFigureRenderer() as renderer:
+        renderer.submit(create_first_map, full_map, wave_glider_21_cleaned, wave_glider_21_original)
+        outliers_table = renderer.submit(common_tools.create_time_series_with_spikes_plot, wave_glider_21_cleaned,
+                                         PandasWaveGliderV2OceanAnalyzer(wave_glider_21_cleaned, glider_22_cleaned,
+                                                                         drifted_22),
+                                         "Visualización inicial de los datos de la misión 2021",
+                                         "/datos_glider_21.jpg")
+        renderer.submit(create_map_with_all_data, full_map, wave_glider_21_cleaned, (-18.1, -17.9, 28.45, 28.70))
+        renderer.submit(common_tools.create_travel_map, full_map, wave_glider_21_cleaned,
+                        (-18.1, -17.9, 28.46, 28.685))
+        renderer.submit(common_tools.create_weather_plot, weather, "Visualización del clima de la misión de 2021",
+                        "/weather_data_21.jpg")
+        renderer.submit(common_tools.create_weather_mean_daily_plot, daily,
+                        "Visualización de medias por hora en datos del clima de la misión 2021",
+                        "/visualización_de_media_diaria_clima_21.jpg")
+    store_analyzed_data(wave_glider_21_cleaned, glider_drifted_21, weather, outliers_table.result())
 
 
 def create_first_map(full_map: GeoPandasMap, wave_glider_21_cleaned: WaveGliderV2Ocean,
                      wave_glider_21_original: WaveGliderV2Ocean) -> None:
-    visualizer = MatplotlibMapChartCreator(1, 2, (15, 10))
+    visualizer = MatplotlibMapChartCreator(1, 2, (15, 10), common_tools.basemap_rasterizer)
     visualizer.add_map_to_plots(full_map, "label", ["orangered", "darkgreen"])
     visualizer.create_map(define_first_map_params(wave_glider_21_cleaned, wave_glider_21_original),
                           "Limpieza de datos del recorrido de la misión 2021")
-    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + "/recorrido_glider_2021.jpg")
+    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + "/recorrido_glider_2021.jpg", visualizer.fig)
 
 
 def create_map_with_all_data(full_map: GeoPandasMap, wave_glider_21_cleaned: WaveGliderV2Ocean,
                              area_to_plot: tuple[float, float, float, float]) -> None:
     plot_params = common_tools.define_data_colored_map_params(wave_glider_21_cleaned, area_to_plot)
-    visualizer = MatplotlibMapChartCreator(2, 2, (20, 20), )
+    visualizer = MatplotlibMapChartCreator(2, 2, (20, 20), common_tools.basemap_rasterizer)
     visualizer.add_map_to_plots(full_map, "label", ["orangered", "darkgreen"])
     visualizer.create_map_with_data(plot_params,
                                     "Datos en el recorrido de la misión de 2021 \n para cada una las variables consideradas")
-    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + "/recorrido_con_datos_glider_21.jpg")
+    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + "/recorrido_con_datos_glider_21.jpg", visualizer.fig)
 
 
 def get_ctd_21_data(cols_renames: dict[str, str], glider_drift_start_date: str, glider_drift_end_date: str) \
@@ -119,13 +127,15 @@ def store_analyzed_data(wave_glider_21: WaveGliderV2Ocean, drifted_21: WaveGlide
 def get_weather_data(col_renames: dict[str, str], glider_out_route_date: str) -> \
         tuple[WaveGliderV2Weather, WaveGliderV2Weather]:
     weather = (ETL(CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p",
-                                      [0, 3, 4, 5, 6, 8, 9]), PandasTransformer(), PandasWaveGliderWeatherLoader())
+                                      [0, 3, 4, 5, 6, 8, 9], cache_dir=CACHE_DIR), PandasTransformer(),
+                   PandasWaveGliderWeatherLoader())
                .extract(DATA_DIR + "/WG_211009_211124/MERGED_WEATHER.csv", )
                .rename_columns(col_renames).filter_column("TimeStamp", operator.lt, glider_out_route_date)
                .sort_values("TimeStamp")
                .load())
     daily_means = (ETL(CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p",
-                                          [0, 3, 4, 5, 6, 8, 9]), PandasTransformer(), PandasWaveGliderWeatherLoader())
+                                          [0, 3, 4, 5, 6, 8, 9], cache_dir=CACHE_DIR), PandasTransformer(),
+                       PandasWaveGliderWeatherLoader())
                    .extract(DATA_DIR + "/WG_211009_211124/MERGED_WEATHER.csv")
                    .rename_columns(col_renames).filter_column("TimeStamp", operator.lt, glider_out_route_date)
                    .compute_average_per_timestamp("TimeStamp")
@@ -183,4 +193,6 @@ def define_22_preprocess_variables() -> tuple[dict[str, str], str]:
     return common_tools.define_wave_glider_ocean_variable_renames(), '2022-03-09 15:30:00'
 
 
-main()
+if __name__ == "__main__":
+    pd.set_option("mode.copy_on_write", True)
+    main()
@@ -1,4 +1,7 @@
 import operator
+import os
+
+import pandas as pd
 
 from AnalysisCommonTools import AnalysisCommonTools
 from analyzers.PandasWaveGliderV2OceanAnalyzer import PandasWaveGliderV2OceanAnalyzer
@@ -8,6 +11,7 @@ from etl.extractors.CSVPandasExtractor import CSVPandasExtractor
 from etl.loaders.PandasWaveGliderWeatherLoader import PandasWaveGliderWeatherLoader
 from etl.transformers.PandasTransformer import PandasTransformer
 from graphers.MatplotlibMapChartCreator import MatplotlibMapChartCreator
+from graphers.ProcessPoolFigureRenderer import ProcessPoolFigureRenderer
 from model.GeoPandasMap import GeoPandasMap
 from model.Table import Table
 from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
@@ -16,12 +20,17 @@ from model.params.BasicPlotParams import BasicPlotParams
 from model.params.LimitedPlotArea import LimitedPlotArea
 from model.params.compound_params.LimitedPlotParams import LimitedPlotParams
 from storer.CsvPandasStorer import CsvPandasStorer
-from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
 
 RESULTS_DIRECTORY = "./results/exploratory/glider22"
 STORE_DATE_FORMAT = "%d/%m/%Y %H:%M"
 DATA_DIR = "data"
-common_analysis_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIRECTORY, STORE_DATE_FORMAT)
+CACHE_DIR = os.environ.get("LA_PALMA_CACHE_DIR")
+PYRAMID_DIR = os.path.join(CACHE_DIR, "pyramids") if CACHE_DIR is not None else None
+FIGURE_CACHE_DIR = os.path.join(CACHE_DIR, "figures") if CACHE_DIR is not None else None
+BASEMAP_DIR = os.path.join(CACHE_DIR, "basemaps") if CACHE_DIR is not None else None
+common_analysis_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIRECTORY, STORE_DATE_FORMAT, cache_dir=CACHE_DIR,
+                                            pyramid_dir=PYRAMID_DIR, figure_cache_dir=FIGURE_CACHE_DIR,
+                                            basemap_dir=BASEMAP_DIR)
 
 
 def main():
@@ -30,42 +39,56 @@ def main():
     wave_glider_21_cleaned = get_ctd_clean_21_data(*define_21_preprocess_variables_for_clean_data())
     weather_22, daily_22, weather_drifted_22, daily_22_drifted = get_weather_data(
         *define_weather_preprocess_variables())
-    create_first_map(full_map, glider_22_cleaned, glider_22_original)
     analyzer = PandasWaveGliderV2OceanAnalyzer(glider_22_cleaned, drifted_22, wave_glider_21_cleaned)
-    outliers_22_table = common_analysis_tools.create_time_series_with_spikes_plot(glider_22_cleaned, analyzer,
-                                                                              "Visualización inicial de los datos de la misión 2022 cercanos al evento",
-                                                                              "/datos_glider_22.jpg")
-    outliers_drifted_table = common_analysis_tools.create_time_series_with_spikes_plot(drifted_22, analyzer,
-                                                                                   "Visualización inicial de los datos de la misión 2022 lejanos al evento",
-                                                                                   "/datos_glider_desviado_22.jpg")
-
-    analyze_data(glider_22_cleaned, weather_22, drifted_22, weather_drifted_22, outliers_22_table,
-                 outliers_drifted_table)
-    create_map_with_all_data(full_map, glider_22_cleaned, area_to_plot_1=(-18.1, -17.85, 28.40, 28.70),
-                             drifted_22=drifted_22, area_to_plot_drifted=(-19, -17.85, 26.5, 28.75))
-    common_analysis_tools.create_travel_map(full_map, glider_22_cleaned, (-18.1, -17.85, 28.40, 28.70))
-    common_analysis_tools.create_weather_plot(weather_22, "Visualización del clima de los datos de la misión \n "
-                                                      "de 2022 cercanos a los deltas lávicos.", "/clima_22.jpg")
-    common_analysis_tools.create_weather_plot(weather_drifted_22, "Visualización del clima de los datos de la misión \n "
-                                                              "de 2022 alejados a los deltas lávicos.",
-                                          "/clima_desviado_22.jpg")
-    common_analysis_tools.create_weather_mean_daily_plot(daily_22,
-                                                     "Visualización de medias por hora de los datos del clima de \n"
-                                                     "la misión 2022 cercanos a los deltas lávicos.",
-                                                     "/visualización_de_media_diaria_clima_22.jpg")
-    common_analysis_tools.create_weather_mean_daily_plot(daily_22_drifted,
-                                                     "Visualización de medias por hora de los datos del clima de \n"
-                                                     "la misión 2022 lejanos a los deltas lávicos.",
-                                                     "/visualización_de_media_diaria_clima_22_alejado.jpg")
+    with ProcessPoolFigureRenderer() as renderer:
+        renderer.submit(create_first_map, full_map, glider_22_cleaned, glider_22_original)
+        outliers_22_table = renderer.submit(common_analysis_tools.create_time_series_with_spikes_plot,
+                                            glider_22_cleaned, analyzer,
+                                            "Visualización inicial de los datos de la misión 2022 cercanos al evento",
+                                            "/datos_glider_22.jpg")
+        outliers_drifted_table = renderer.submit(common_analysis_tools.create_time_series_with_spikes_plot,
+                                                 drifted_22, analyzer,
+                                                 "Visualización inicial de los datos de la misión 2022 lejanos al "
+                                                 "evento",
+                                                 "/datos_glider_desviado_22.jpg")
+        create_map_with_all_data(renderer, full_map, glider_22_cleaned,
+                                 area_to_plot_1=(-18.1, -17.85, 28.40, 28.70), drifted_22=drifted_22,
+                                 area_to_plot_drifted=(-19, -17.85, 26.5, 28.75))
+        renderer.submit(common_analysis_tools.create_travel_map, full_map, glider_22_cleaned,
+                        (-18.1, -17.85, 28.40, 28.70))
+        renderer.submit(common_analysis_tools.create_weather_plot, weather_22,
+                        "Visualización del clima de los datos de la misión \n "
+                        "de 2022 cercanos a los deltas lávicos.",
+                        "/clima_22.jpg")
+        renderer.submit(common_analysis_tools.create_weather_plot, weather_drifted_22,
+                        "Visualización del clima de los datos de la misión \n "
+                        "de 2022 alejados a los deltas lávicos.",
+                        "/clima_desviado_22.jpg")
+        renderer.submit(common_analysis_tools.create_weather_mean_daily_plot, daily_22,
+                        "Visualización de medias por hora de los datos del clima de \n"
+                        "la misión 2022 cercanos a los deltas lávicos.",
+                        "/visualización_de_media_diaria_clima_22.jpg")
+        renderer.submit(common_analysis_tools.create_weather_mean_daily_plot, daily_22_drifted,
+                        "Visualización de medias por hora de los datos del clima de \n"
+                        "la misión 2022 lejanos a los deltas lávicos.",
+                        "/visualización_de_media_diaria_clima_22_alejado.jpg")
+    analyze_data(glider_22_cleaned, weather_22, drifted_22, weather_drifted_22, outliers_22_table.result(),
+                 outliers_drifted_table.result())
 
 
 def create_first_map(full_map: GeoPandasMap, glider_22_cleaned: WaveGliderV2Ocean,
                      glider_22_original: WaveGliderV2Ocean) -> None:
-    visualizer = MatplotlibMapChartCreator(1, 2, (15, 10))
     coord_params = define_first_map_params(glider_22_cleaned, glider_22_original)
+    filename = RESULTS_DIRECTORY + "/recorrido_glider_2022.jpg"
+    title = "Limpieza de datos del recorrido Wave Glider SV2 de 2022"
+    fig_size = (15, 10)
+    figure_storer = common_analysis_tools.figure_storer
+    if figure_storer.is_up_to_date(filename, coord_params, full_map, title, fig_size):
+        return
+    visualizer = MatplotlibMapChartCreator(1, 2, fig_size, common_analysis_tools.basemap_rasterizer)
     visualizer.add_map_to_plots(full_map, "label", ["orangered", "darkgreen"])
-    visualizer.create_map(coord_params, "Limpieza de datos del recorrido Wave Glider SV2 de 2022")
-    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + "/recorrido_glider_2022.jpg")
+    visualizer.create_map(coord_params, title)
+    figure_storer.store(filename, visualizer.fig)
 
 
 def get_weather_data(col_renames: dict[str, str], glider_out_route_date: str):
@@ -101,7 +124,7 @@ def extract_weather_data(etl: ETL) -> ETL:
 
 
 def define_weather_etl(parse_dates: list[str], date_format: str, relevant_cols_idx: list[int]) -> ETL:
-    return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx), PandasTransformer(),
+    return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, cache_dir=CACHE_DIR), PandasTransformer(),
                PandasWaveGliderWeatherLoader())
 
 
@@ -171,23 +194,29 @@ def define_weather_preprocess_variables() -> tuple[dict[str, str], str]:
     return common_analysis_tools.define_wave_glider_weather_variable_renames(), '2022-03-09 15:30:00'
 
 
-def create_map_with_all_data(full_map: GeoPandasMap, glider_22_cleaned: WaveGliderV2Ocean,
-                             area_to_plot_1: tuple[float, float, float, float], drifted_22: WaveGliderV2Ocean,
+def create_map_with_all_data(renderer: ProcessPoolFigureRenderer, full_map: GeoPandasMap,
+                             glider_22_cleaned: WaveGliderV2Ocean, area_to_plot_1: tuple[float, float, float, float],
+                             drifted_22: WaveGliderV2Ocean,
                              area_to_plot_drifted: tuple[float, float, float, float]) -> None:
-    create_full_data_map(area_to_plot_1, full_map, glider_22_cleaned,
-                         "Datos en el recorrido de la misión de 2022 \n para cada una las variables consideradas",
-                         "recorrido_con_datos_glider_22")
-    create_full_data_map(area_to_plot_drifted, full_map, drifted_22,
-                         "Datos en el recorrido de la misión de 2022 \n para cada una las variables consideradas",
-                         "recorrido_desviado_con_datos_glider_22")
+    renderer.submit(create_full_data_map, area_to_plot_1, full_map, glider_22_cleaned,
+                    "Datos en el recorrido de la misión de 2022 \n para cada una las variables consideradas",
+                    "recorrido_con_datos_glider_22")
+    renderer.submit(create_full_data_map, area_to_plot_drifted, full_map, drifted_22,
+                    "Datos en el recorrido de la misión de 2022 \n para cada una las variables consideradas",
+                    "recorrido_desviado_con_datos_glider_22")
 
 
 def create_full_data_map(area_to_plot, full_map, glider_22, title: str, store_name: str) -> None:
     plot_params = common_analysis_tools.define_data_colored_map_params(glider_22, area_to_plot)
-    visualizer = MatplotlibMapChartCreator(2, 2, (20, 20))
+    filename = RESULTS_DIRECTORY + "/" + store_name + ".jpg"
+    fig_size = (20, 20)
+    figure_storer = common_analysis_tools.figure_storer
+    if figure_storer.is_up_to_date(filename, plot_params, full_map, title, fig_size):
+        return
+    visualizer = MatplotlibMapChartCreator(2, 2, fig_size, common_analysis_tools.basemap_rasterizer)
     visualizer.add_map_to_plots(full_map, "label", ["orangered", "darkgreen"])
     visualizer.create_map_with_data(plot_params, title)
-    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + "/" + store_name + ".jpg")
+    figure_storer.store(filename, visualizer.fig)
 
 def define_22_preprocess_variables() -> tuple[dict[str, str], str]:
     return common_analysis_tools.define_wave_glider_ocean_variable_renames(), '2022-03-09 15:30:00'
@@ -219,4 +248,6 @@ def define_21_preprocess_variables_for_clean_data() -> tuple[dict[str, str], str
     return common_analysis_tools.define_wave_glider_ocean_variable_renames(), '2021-11-09 15:30:00'
 
 
-main()
+if __name__ == "__main__":
+    pd.set_option("mode.copy_on_write", True)
+    main()
@@ -1,3 +1,7 @@
+import os
+
+import pandas as pd
+
 from AnalysisCommonTools import AnalysisCommonTools
 from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
 from machine_learning.ModelManager import ModelManager
@@ -18,7 +22,8 @@ from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
 
 DATA_DIR = "./data"
 RESULT_DIR = "./results/predictive"
-common_analysis_tools = AnalysisCommonTools(DATA_DIR, RESULT_DIR)
+CACHE_DIR = os.environ.get("LA_PALMA_CACHE_DIR")
+common_analysis_tools = AnalysisCommonTools(DATA_DIR, RESULT_DIR, cache_dir=CACHE_DIR)
 
 def main():
     (ocean_21, weather_21, glider_21,
@@ -275,7 +280,7 @@ def graph_model_results(results: dict[str, PredictorResult], title: str, x_ticks
     params = create_predicted_params(results, list(range(len(x_ticks[0]))))
     chart_creator = MatplotlibFigureCreator(len(params), 1, (10, 10), 12, 12)
     chart_creator.create_correlations(params, [], title, x_ticks)
-    MatplotlibFigureStorer().store(RESULT_DIR + filename)
+    MatplotlibFigureStorer().store(RESULT_DIR + filename, chart_creator.fig)
 
 
 def calculate_min_lim(value_list: list[float]) -> float:
@@ -296,4 +301,5 @@ def get_table_results(results, row_idx: str) -> Table:
 
 
 
+pd.set_option("mode.copy_on_write", True)
 main()
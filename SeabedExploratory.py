@@ -1,15 +1,20 @@
 import operator
+import os
 from datetime import timedelta
 
+import pandas as pd
+
 from AnalysisCommonTools import AnalysisCommonTools
 from etl.ETL import ETL
 from model.ocean_devices.Seabed import Seabed
 from analyzers.PandasSeabedAnalyzer import PandasSeabedAnalyzer
 from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
+from graphers.ProcessPoolFigureRenderer import ProcessPoolFigureRenderer
 from etl.loaders.PandasSeabedLoader import PandasSeabedLoader
 from model.Spikes import Spikes
 from model.Table import Table
 from model.params.BasicPlotParams import BasicPlotParams
+from model.params.DownsamplingParams import DownsamplingParams
 from model.params.LimitedPlotArea import LimitedPlotArea
 from model.params.MarkerParams import MarkerParams
 from model.params.compound_params.PlotStylishParams import PlotStylishParams
@@ -23,23 +28,27 @@ from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
 RESULTS_DIRECTORY = "./results/exploratory/seabed"
 DATA_DIR = "./data"
 STORE_DATE_FORMAT = "%d/%m/%Y %H:%M"
-common_analysis_tools = AnalysisCommonTools(DATA_DIR,RESULTS_DIRECTORY,STORE_DATE_FORMAT)
+CACHE_DIR = os.environ.get("LA_PALMA_CACHE_DIR")
+common_analysis_tools = AnalysisCommonTools(DATA_DIR,RESULTS_DIRECTORY,STORE_DATE_FORMAT, cache_dir=CACHE_DIR)
 
 def seabed_main():
     seabed_23_cleaned, daily_means_seabed_23, seabed_24_cleaned, daily_means_seabed_24 = get_data()
     analyzer = PandasSeabedAnalyzer(seabed_23_cleaned, seabed_24_cleaned)
-    salinity_outliers_23 = timeseries_plot(seabed_23_cleaned,
-                                           "Visualización inicial de datos de fondeo de la misión de 2023",
-                                           "/visualización_inicial_fondeo_23.jpg", analyzer)
-    salinity_outliers_24 = timeseries_plot(seabed_24_cleaned,
-                                           "Visualización inicial de datos de fondeo de la misión de 2024",
-                                           "/visualización_inicial_fondeo_24.jpg", analyzer)
-    daily_means_plot(daily_means_seabed_23, "Visualización de medias por hora en datos de fondeo de la misión de 2023",
-                     "/visualización_de_media_diaria_fondeo_23.jpg")
-    daily_means_plot(daily_means_seabed_24, "Visualización de medias por hora en datos de fondeo de la misión de 2024",
-                     "/visualización_de_media_diaria_fondeo_24.jpg")
-    analyze_data(seabed_23_cleaned, "23", salinity_outliers_23.to_table())
-    analyze_data(seabed_24_cleaned, "24", salinity_outliers_24.to_table())
+    with ProcessPoolFigureRenderer() as renderer:
+        salinity_outliers_23 = renderer.submit(timeseries_plot, seabed_23_cleaned,
+                                               "Visualización inicial de datos de fondeo de la misión de 2023",
+                                               "/visualización_inicial_fondeo_23.jpg", analyzer)
+        salinity_outliers_24 = renderer.submit(timeseries_plot, seabed_24_cleaned,
+                                               "Visualización inicial de datos de fondeo de la misión de 2024",
+                                               "/visualización_inicial_fondeo_24.jpg", analyzer)
+        renderer.submit(daily_means_plot, daily_means_seabed_23,
+                        "Visualización de medias por hora en datos de fondeo de la misión de 2023",
+                        "/visualización_de_media_diaria_fondeo_23.jpg")
+        renderer.submit(daily_means_plot, daily_means_seabed_24,
+                        "Visualización de medias por hora en datos de fondeo de la misión de 2024",
+                        "/visualización_de_media_diaria_fondeo_24.jpg")
+    analyze_data(seabed_23_cleaned, "23", salinity_outliers_23.result().to_table())
+    analyze_data(seabed_24_cleaned, "24", salinity_outliers_24.result().to_table())
 
 
 def timeseries_plot(seabed: Seabed, graph_title: str, file_name: str, analyzer: PandasSeabedAnalyzer):
@@ -50,7 +59,7 @@ def timeseries_plot(seabed: Seabed, graph_title: str, file_name: str, analyzer:
     visualizer.create_timeseries_with_outliers([temperature_plot_params, conductivity_plot_params],
                                                [salinity_plot_params], graph_title,
                                                seabed.timestamp)
-    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + file_name)
+    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + file_name, visualizer.fig)
     return salinity_outliers
 
 
@@ -62,7 +71,7 @@ def daily_means_plot(seabed: Seabed, graph_title: str, file_name: str):
                                   [salinity_plot_params],
                                   graph_title,
                                   seabed.timestamp)
-    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + file_name)
+    MatplotlibFigureStorer().store(RESULTS_DIRECTORY + file_name, visualizer.fig)
 
 
 def analyze_data(seabed: Seabed, year: str, outliers: Table):
@@ -100,16 +109,14 @@ def get_data():
     seabed_cleaned_24 = (define_seabed_etl(None, None,
                                            [0, 1, 2, 3, 4, 5, 6], r"\s+")
                          .extract(DATA_DIR + "/Fondeo_24/sbe37sm-rs232_03714294_2024_04_10.asc")
-                         .merge_columns(["Day", "Month", "Year", "Time"], "TimeStamp", " ")
-                         .parse_datetime_column("TimeStamp")
+                         .assemble_datetime_column(["Day", "Month", "Year", "Time"], "TimeStamp")
                          .filter_column("Conductivity_S_m", operator=operator.ge, value=1)
                          .sort_values("TimeStamp")
                          .load())
     daily_means_seabed_24 = (define_seabed_etl(None, None,
                                                [0, 1, 2, 3, 4, 5, 6], r"\s+")
                              .extract(DATA_DIR + "/Fondeo_24/sbe37sm-rs232_03714294_2024_04_10.asc")
-                             .merge_columns(["Day", "Month", "Year", "Time"], "TimeStamp", " ")
-                             .parse_datetime_column("TimeStamp")
+                             .assemble_datetime_column(["Day", "Month", "Year", "Time"], "TimeStamp")
                              .filter_column("Conductivity_S_m", operator=operator.ge, value=1)
                              .compute_average_per_timestamp("TimeStamp")
                              .sort_values("TimeStamp")
@@ -118,8 +125,9 @@ def get_data():
 
 
 def define_seabed_etl(parse_dates: list[str] | None, date_format: str | None, relevant_cols_idx: list[int], delimiter: str = ","):
-    return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter=delimiter),
-               PandasTransformer(), PandasSeabedLoader())
+    return ETL(CSVPandasExtractor(parse_dates, date_format, relevant_cols_idx, delimiter=delimiter,
+                                  cache_dir=CACHE_DIR),
+               PandasTransformer(CACHE_DIR), PandasSeabedLoader())
 
 
 def define_daily_means_plot_params(seabed: Seabed):
@@ -142,11 +150,13 @@ def define_timeseries_plot_params(seabed: Seabed, salinity_outliers: Spikes):
     temperature_plot_params = PlotStylishParams(
         BasicPlotParams(seabed.index, seabed.temperature_c, "Temperatura"),
         MarkerParams("coral", "Temperatura", "-", 1),
-        LimitedPlotArea(None, None, 19.5, 24))
+        LimitedPlotArea(None, None, 19.5, 24),
+        DownsamplingParams(DownsamplingParams.Method.LTTB))
     conductivity_plot_params = PlotStylishParams(
         BasicPlotParams(seabed.index, seabed.conductivity_s_m, "Conductividad"),
         MarkerParams("darkolivegreen", "Conductividad", "--", 1),
-        LimitedPlotArea(None, None, 4.9, 5.5))
+        LimitedPlotArea(None, None, 4.9, 5.5),
+        DownsamplingParams(DownsamplingParams.Method.LTTB))
     salinity_plot_params = PlotStylishSpikesParams(
         BasicPlotParams(seabed.index, seabed.salinity_psu, "Salinidad"),
         MarkerParams("indigo", "Salinidad", "o", 10),
@@ -154,7 +164,8 @@ def define_timeseries_plot_params(seabed: Seabed, salinity_outliers: Spikes):
                         calculate_max_lim(seabed.salinity_psu)),
         SpikesParams(salinity_outliers.indexes,
                      salinity_outliers.values,
-                           "red")
+                           "red"),
+        DownsamplingParams(DownsamplingParams.Method.MIN_MAX)
     )
     return conductivity_plot_params, salinity_plot_params, temperature_plot_params
 
@@ -173,4 +184,6 @@ def get_column_from_table(table: Table, label: str) -> list:
             return column.values
 
 
-seabed_main()
+if __name__ == "__main__":
+    pd.set_option("mode.copy_on_write", True)
+    seabed_main()
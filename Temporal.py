@@ -1,6 +1,11 @@
+import os
+
+import pandas as pd
+
 from AnalysisCommonTools import AnalysisCommonTools
 from analyzers.NumpyPrimitiveDataAnalyzer import NumpyPrimitiveDataAnalyzer
 from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
+from graphers.ProcessPoolFigureRenderer import ProcessPoolFigureRenderer
 from model.ocean_devices.Seabed import Seabed
 from model.Table import Table
 from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
@@ -13,24 +18,27 @@ from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
 
 DATA_DIR = "./data"
 RESULTS_DIR = "./results/temporal"
-common_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIR, None)
+CACHE_DIR = os.environ.get("LA_PALMA_CACHE_DIR")
+common_tools = AnalysisCommonTools(DATA_DIR, RESULTS_DIR, None, cache_dir=CACHE_DIR)
 
 
 def main():
     (ocean_21, weather_21, glider_21, ocean_22, weather_22, glider_22,
      drifted_ocean_22, glider_drifted_22, seabed_23, seabed_24) = common_tools.get_data()
 
-    salinity_data = ocean_21, ocean_22, drifted_ocean_22, seabed_23, seabed_24
-    limits_sal = graph(salinity_data, create_salinity_plot_params(*salinity_data), "Evolución de los niveles de salinidad.",
-          "/salinidad.jpg", (9, 14), "Salinity_PSU")
+    with ProcessPoolFigureRenderer() as renderer:
+        salinity_data = ocean_21, ocean_22, drifted_ocean_22, seabed_23, seabed_24
+        renderer.submit(graph, salinity_data, create_salinity_plot_params(*salinity_data),
+                        "Evolución de los niveles de salinidad.", "/salinidad.jpg", (9, 14), "Salinity_PSU")
 
-    oxygen_data = ocean_21, ocean_22, drifted_ocean_22
-    limits_ox = graph(oxygen_data, create_oxygen_plot_params(*oxygen_data),
-          "Evolución de los niveles de oxígeno.", "/oxígeno.jpg", (10, 10), "Oxygen_umol_L")
+        oxygen_data = ocean_21, ocean_22, drifted_ocean_22
+        renderer.submit(graph, oxygen_data, create_oxygen_plot_params(*oxygen_data),
+                        "Evolución de los niveles de oxígeno.", "/oxígeno.jpg", (10, 10), "Oxygen_umol_L")
 
-    temp_data = ocean_21, ocean_22, drifted_ocean_22, seabed_23, seabed_24
-    limits_temp = graph(temp_data, create_temp_plot_params(*temp_data),
-          "Evolución de los niveles de temperatura.", "/temperatura.jpg", (9, 14), "Temperature_C")
+        temp_data = ocean_21, ocean_22, drifted_ocean_22, seabed_23, seabed_24
+        renderer.submit(graph, temp_data, create_temp_plot_params(*temp_data),
+                        "Evolución de los niveles de temperatura.", "/temperatura.jpg", (9, 14), "Temperature_C")
+        limits_sal, limits_ox, limits_temp = renderer.wait()
     limits_table = limits_sal.concat_equal_tables(limits_ox).concat_equal_tables(limits_temp)
     (CsvPandasStorer(format_dict=common_tools.define_variable_renames_to_spanish())
      .store(limits_table,
@@ -54,7 +62,7 @@ def graph(object_data, params: list[PlotStylishParams],
     (figure_creator
      .create_timeseries_different_x_ticks(params, [], title, get_timestamp(object_data)))
     lower_limit, upper_limit = add_intercuartilic_thresholds(figure_creator, params)
-    MatplotlibFigureStorer().store(RESULTS_DIR + filename)
+    MatplotlibFigureStorer().store(RESULTS_DIR + filename, figure_creator.fig)
     return Table([Table.Column("Variable", [variable]),
                   Table.Column("Límite inferior", [lower_limit]),
                   Table.Column("límite superior", [upper_limit])], None)
@@ -143,4 +151,6 @@ def get_timestamp(salinity_data):
     return list(map(lambda x: x.timestamp, salinity_data))
 
 
-main()
+if __name__ == "__main__":
+    pd.set_option("mode.copy_on_write", True)
+    main()
@@ -0,0 +1,96 @@
+import math
+from typing import Self, Iterable
+
+import numpy as np
+
+
+class KllQuantileSketch:
+    # Normalized rank error of KLL sketches at 99% confidence, constants from Apache DataSketches
+    RANK_ERROR_CONSTANT = 2.296
+    RANK_ERROR_EXPONENT = 0.9723
+    CAPACITY_DECAY = 2 / 3
+    DEFAULT_K = 200
+
+    def __init__(self, k: int | None = DEFAULT_K, seed: int = 0):
+        self.k = k
+        self.count = 0
+        self.is_exact = True
+        self.compactors = [np.empty(0)]
+        self.__rng = np.random.default_rng(seed)
+
+    def update(self, values: Iterable[float]) -> Self:
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self.compactors[0] = np.concatenate([self.compactors[0], values])
+        self.count += len(values)
+        self.__compress()
+        return self
+
+    def merge(self, other: "KllQuantileSketch") -> Self:
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append(np.empty(0))
+        for level, items in enumerate(other.compactors):
+            self.compactors[level] = np.concatenate([self.compactors[level], items])
+        self.count += other.count
+        self.is_exact = self.is_exact and other.is_exact
+        if self.k is None or (other.k is not None and other.k < self.k):
+            self.k = other.k
+        self.__compress()
+        return self
+
+    def quantiles(self, q: list[float]) -> list[float]:
+        if self.is_exact:
+            return list(np.percentile(self.compactors[0], [quantile * 100 for quantile in q]))
+        items, weights = self.__weighted_items()
+        cumulative_weights = np.cumsum(weights)
+        ranks = np.array(q) * (self.count - 1)
+        lower_ranks = np.floor(ranks)
+        lower = items[np.searchsorted(cumulative_weights, lower_ranks, side='right')]
+        upper = items[np.minimum(np.searchsorted(cumulative_weights, lower_ranks + 1, side='right'), len(items) - 1)]
+        return list(lower + (upper - lower) * (ranks - lower_ranks))
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles([q])[0]
+
+    def rank_error(self) -> float:
+        if self.is_exact:
+            return 0.0
+        return self.RANK_ERROR_CONSTANT / self.k ** self.RANK_ERROR_EXPONENT
+
+    def retained_items(self) -> int:
+        return sum(len(items) for items in self.compactors)
+
+    def __weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.compactors)
+        weights = np.concatenate([np.full(len(level_items), 2 ** level, dtype=np.int64)
+                                  for level, level_items in enumerate(self.compactors)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    def __compress(self) -> None:
+        if self.k is None:
+            return
+        self.__drop_missing()
+        while self.retained_items() > sum(map(self.__capacity, range(len(self.compactors)))):
+            level = next(level for level, items in enumerate(self.compactors) if len(items) >= self.__capacity(level))
+            self.__compact(level)
+
+    def __drop_missing(self) -> None:
+        missing = np.isnan(self.compactors[0])
+        if missing.any():
+            self.compactors[0] = self.compactors[0][~missing]
+            self.count -= int(missing.sum())
+
+    def __compact(self, level: int) -> None:
+        if level + 1 == len(self.compactors):
+            self.compactors.append(np.empty(0))
+        items = np.sort(self.compactors[level])
+        kept = items[:len(items) % 2]
+        pairs = items[len(items) % 2:]
+        promoted = pairs[self.__rng.integers(0, 2)::2]
+        self.compactors[level] = kept
+        self.compactors[level + 1] = np.concatenate([self.compactors[level + 1], promoted])
+        self.is_exact = False
+
+    def __capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, math.ceil(self.k * self.CAPACITY_DECAY ** depth))
@@ -0,0 +1,41 @@
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from model.Spikes import Spikes
+
+
+class NumpySpikeTestAnalyzer:
+
+    def calculate_test_values(self, values: Sequence[float]) -> np.ndarray:
+        values = np.asarray(values, dtype=np.float64)
+        test_values = np.full(values.shape, np.nan)
+        if len(values) < 3:
+            return test_values
+        v1, v2, v3 = values[:-2], values[1:-1], values[2:]
+        test_values[1:-1] = np.abs(v2 - (v3 + v1) / 2) - np.abs((v3 - v1) / 2)
+        return test_values
+
+    def find_spikes(self, values: Sequence[float], spike_threshold: float) -> np.ndarray:
+        return np.flatnonzero(self.calculate_test_values(values) > spike_threshold)
+
+    def analyze(self, timestamps: Sequence, values: Sequence[float], variable: Spikes.SpikeVariable,
+                spike_threshold: float) -> Spikes:
+        values = np.asarray(values, dtype=np.float64)
+        spikes_idx = self.find_spikes(values, spike_threshold)
+        return Spikes([variable] * len(spikes_idx), spike_threshold, self.__select_timestamps(timestamps, spikes_idx),
+                      values[spikes_idx].tolist(), spikes_idx.tolist())
+
+    def analyze_many(self, timestamps: Sequence, values: np.ndarray, variables: list[Spikes.SpikeVariable],
+                     spike_thresholds: list[float]) -> Spikes:
+        values = np.asarray(values, dtype=np.float64)
+        variables_idx, spikes_idx = np.nonzero((self.calculate_test_values(values) > spike_thresholds).T)
+        return Spikes([variables[i] for i in variables_idx], [spike_thresholds[i] for i in variables_idx],
+                      self.__select_timestamps(timestamps, spikes_idx), values[spikes_idx, variables_idx].tolist(),
+                      spikes_idx.tolist())
+
+    def __select_timestamps(self, timestamps: Sequence, idx: np.ndarray) -> list:
+        if isinstance(timestamps, list):
+            return list(pd.DatetimeIndex([timestamps[i] for i in idx]).to_pydatetime())
+        return list(pd.DatetimeIndex(timestamps[idx]).to_pydatetime())
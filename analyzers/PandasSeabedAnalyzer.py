@@ -1,6 +1,7 @@
-import numpy as np
 import pandas as pd
 
+from analyzers.NumpySpikeTestAnalyzer import NumpySpikeTestAnalyzer
+from analyzers.SpikeThresholdEstimator import SpikeThresholdEstimator
 from model.ocean_devices.Seabed import Seabed
 from model.Table import Table
 from model.Spikes import Spikes
@@ -8,12 +9,13 @@ from model.Spikes import Spikes
 
 class PandasSeabedAnalyzer:
 
-    def __init__(self, *seabeds: Seabed):
-        self.all_salinity = []
+    def __init__(self, *seabeds: Seabed, sketch_size: int | None = None):
+        self.salinity_threshold_estimator = SpikeThresholdEstimator(sketch_size)
+        self.spike_test_analyzer = NumpySpikeTestAnalyzer()
         if seabeds is not ():
             for seabed in seabeds:
-                self.all_salinity.extend(seabed.salinity_psu)
-            self.spike_threshold = self.__calculate_spike_threshold(self.all_salinity)
+                self.salinity_threshold_estimator.update(seabed.salinity_psu)
+            self.spike_threshold = self.salinity_threshold_estimator.calculate_threshold()
 
     def describe(self, seabed: Seabed) -> Table:
         described = self.__create_df(seabed).describe()
@@ -41,31 +43,8 @@ class PandasSeabedAnalyzer:
         return diff[diff["TimeStamp"].isin(value_counts[value_counts["count"] < count_threshold]["TimeStamp"])]
 
     def analyze_outliers_salinity(self, seabed: Seabed) -> Spikes:
-        return self.__spike_test(self.__create_df(seabed), Spikes.SpikeVariable.SALINITY_PSU)
-
-    def __spike_test(self, df: pd.DataFrame, variable_name: Spikes.SpikeVariable) -> Spikes:
-        spike_threshold = self.spike_threshold
-        df.loc[0, 'test value'] = None
-        for i in range(1, len(df) - 1):
-            self.__calculate_test_value_from_df_index(df, i, variable_name.value)
-        outliers = self.__filter_values_by_spike_test(df, spike_threshold)
-        return Spikes([variable_name] * len(outliers.index), spike_threshold, list(outliers["TimeStamp"].dt.to_pydatetime()),
-                      list(outliers[variable_name.value]), list(outliers.index))
-
-    def __filter_values_by_spike_test(self, df, spike_threshold):
-        return df[df['test value'] > spike_threshold]
-
-    def __calculate_test_value_from_df_index(self, df: pd.DataFrame, i: int, variable_name: str):
-        V1 = df.loc[i - 1, variable_name]
-        V2 = df.loc[i, variable_name]
-        V3 = df.loc[i + 1, variable_name]
-        df.loc[i, 'test value'] = abs(V2 - (V3 + V1) / 2) - abs((V3 - V1) / 2)
-
-    def __calculate_spike_threshold(self, variable: list[float]) -> float:
-        q75, q25 = np.percentile(variable, [75, 25])
-        iqr = q75 - q25
-        spike_threshold = iqr * 1.5
-        return spike_threshold
+        return self.spike_test_analyzer.analyze(seabed.timestamp, seabed.salinity_psu,
+                                                Spikes.SpikeVariable.SALINITY_PSU, self.spike_threshold)
 
     def __create_df(self, seabed: Seabed) -> pd.DataFrame:
         return pd.DataFrame({
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from analyzers.NumpySpikeTestAnalyzer import NumpySpikeTestAnalyzer
+from analyzers.SpikeThresholdEstimator import SpikeThresholdEstimator
 from model.Spikes import Spikes
 from model.Table import Table
 from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
@@ -8,15 +10,18 @@ from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
 
 class PandasWaveGliderV2OceanAnalyzer:
 
-    def __init__(self, *wave_gliders: WaveGliderV2Ocean):
-        self.all_salinity = []
-        self.all_oxygen = []
+    def __init__(self, *wave_gliders: WaveGliderV2Ocean, sketch_size: int | None = None):
+        self.salinity_threshold_estimator = SpikeThresholdEstimator(sketch_size)
+        self.oxygen_threshold_estimator = SpikeThresholdEstimator(sketch_size)
+        self.spike_test_analyzer = NumpySpikeTestAnalyzer()
         if wave_gliders is not ():
             for wave_glider in wave_gliders:
-                self.all_salinity.extend(wave_glider.salinity_psu)
-                self.all_oxygen.extend(wave_glider.oxygen)
-            self.spike_threshold_sal = self.__calculate_spike_threshold(self.all_salinity)
-            self.spike_threshold_ox = self.__calculate_spike_threshold(self.all_oxygen)
+                self.salinity_threshold_estimator.update(wave_glider.salinity_psu)
+                self.oxygen_threshold_estimator.update(wave_glider.oxygen)
+            self.spike_threshold_sal = self.salinity_threshold_estimator.calculate_threshold()
+            self.spike_threshold_ox = self.oxygen_threshold_estimator.calculate_threshold()
+            self.spike_thresholds = {Spikes.SpikeVariable.SALINITY_PSU: self.spike_threshold_sal,
+                                     Spikes.SpikeVariable.OXYGEN_UMOL_L: self.spike_threshold_ox}
 
     def describe(self, glider: WaveGliderV2Ocean) -> Table:
         described = self.__create_df(glider).describe()
@@ -39,35 +44,24 @@ class PandasWaveGliderV2OceanAnalyzer:
              "Next TimeStamp": df.loc[diff.index, "TimeStamp"].reset_index(drop=True)}))
 
     def analyze_outliers_salinity(self, wave_glider: WaveGliderV2Ocean) -> Spikes:
-        return self.__spike_test(self.__create_df(wave_glider),
-                                 Spikes.SpikeVariable.SALINITY_PSU,self.spike_threshold_sal)
+        return self.spike_test_analyzer.analyze(wave_glider.timestamp, wave_glider.salinity_psu,
+                                                Spikes.SpikeVariable.SALINITY_PSU, self.spike_threshold_sal)
 
     def analyze_outliers_oxygen(self, wave_glider: WaveGliderV2Ocean) -> Spikes:
-        return self.__spike_test(self.__create_df(wave_glider),
-                                 Spikes.SpikeVariable.OXYGEN_UMOL_L, self.spike_threshold_ox)
-
-    def __spike_test(self, df: pd.DataFrame,  variable_enum: Spikes.SpikeVariable, spike_threshold: float) -> Spikes:
-        df.loc[0, 'test value'] = None
-        for i in range(1, len(df) - 1):
-            self.__calculate_test_value_from_df_index(df, i, variable_enum.value)
-        outliers = self.__filter_values_by_spike_test(df, spike_threshold)
-        return Spikes([variable_enum] * len(outliers.index), spike_threshold, list(outliers["TimeStamp"].dt.to_pydatetime()),
-                      list(outliers[variable_enum.value]), list(outliers.index))
-
-    def __filter_values_by_spike_test(self, df: pd.DataFrame, spike_threshold: float) -> pd.DataFrame:
-        return df[df['test value'] > spike_threshold]
-
-    def __calculate_test_value_from_df_index(self, df: pd.DataFrame, i: int, variable_name: str) -> None:
-        V1 = df.loc[i - 1, variable_name]
-        V2 = df.loc[i, variable_name]
-        V3 = df.loc[i + 1, variable_name]
-        df.loc[i, 'test value'] = abs(V2 - (V3 + V1) / 2) - abs((V3 - V1) / 2)
-
-    def __calculate_spike_threshold(self, variable: list[float]) -> float:
-        q75, q25 = np.percentile(variable, [75, 25])
-        iqr = q75 - q25
-        spike_threshold = iqr * 1.5
-        return spike_threshold
+        return self.spike_test_analyzer.analyze(wave_glider.timestamp, wave_glider.oxygen,
+                                                Spikes.SpikeVariable.OXYGEN_UMOL_L, self.spike_threshold_ox)
+
+    def analyze_outliers(self, wave_glider: WaveGliderV2Ocean, variables: list[Spikes.SpikeVariable]) -> Spikes:
+        return self.spike_test_analyzer.analyze_many(
+            wave_glider.timestamp,
+            np.column_stack([self.__get_spike_variable_values(wave_glider, variable) for variable in variables]),
+            variables,
+            [self.spike_thresholds[variable] for variable in variables])
+
+    def __get_spike_variable_values(self, wave_glider: WaveGliderV2Ocean, variable: Spikes.SpikeVariable) -> list[float]:
+        if variable == Spikes.SpikeVariable.SALINITY_PSU:
+            return wave_glider.salinity_psu
+        return wave_glider.oxygen
 
     def __calculate_time_anomalies(self, df: pd.DataFrame, count_threshold: int) -> pd.DataFrame:
         diff = df.diff(periods=1)
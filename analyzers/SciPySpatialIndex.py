@@ -0,0 +1,62 @@
+from typing import Sequence
+
+import numpy as np
+import shapely
+from scipy.spatial import cKDTree
+from shapely.geometry.base import BaseGeometry
+
+from model.params.LimitedPlotArea import LimitedPlotArea
+
+
+class SciPySpatialIndex:
+    EARTH_RADIUS_KM = 6371.0088
+
+    def __init__(self, latitude_deg: Sequence[float], longitude_deg: Sequence[float]):
+        self.latitude_deg = np.asarray(latitude_deg, dtype=float)
+        self.longitude_deg = np.asarray(longitude_deg, dtype=float)
+        self.__positions = np.flatnonzero(~np.isnan(self.latitude_deg) & ~np.isnan(self.longitude_deg))
+        self.__longitude_order = self.__positions[np.argsort(self.longitude_deg[self.__positions], kind="stable")]
+        self.__sorted_longitudes = self.longitude_deg[self.__longitude_order]
+        self.__tree = None
+
+    def within_area(self, area: LimitedPlotArea) -> np.ndarray:
+        start = 0 if area.x_min is None else np.searchsorted(self.__sorted_longitudes, area.x_min, side="left")
+        end = (len(self.__sorted_longitudes) if area.x_max is None
+               else np.searchsorted(self.__sorted_longitudes, area.x_max, side="right"))
+        candidates = self.__longitude_order[start:end]
+        latitudes = self.latitude_deg[candidates]
+        inside = np.ones(len(candidates), dtype=bool)
+        if area.y_min is not None:
+            inside &= latitudes >= area.y_min
+        if area.y_max is not None:
+            inside &= latitudes <= area.y_max
+        return np.sort(candidates[inside])
+
+    def within_radius(self, latitude_deg: float, longitude_deg: float, radius_km: float) -> np.ndarray:
+        chord = 2 * np.sin(min(radius_km / self.EARTH_RADIUS_KM, np.pi) / 2)
+        center = self.__to_unit_sphere(np.array([latitude_deg]), np.array([longitude_deg]))[0]
+        return np.sort(self.__positions[self.__get_tree().query_ball_point(center, chord)])
+
+    def within_polygon(self, polygon: BaseGeometry) -> np.ndarray:
+        candidates = self.within_area(LimitedPlotArea(*np.asarray(polygon.bounds)[[0, 2, 1, 3]]))
+        shapely.prepare(polygon)
+        return candidates[shapely.intersects_xy(polygon, self.longitude_deg[candidates],
+                                                self.latitude_deg[candidates])]
+
+    def distances_km(self, latitude_deg: float, longitude_deg: float) -> np.ndarray:
+        latitudes, longitudes = np.radians(self.latitude_deg), np.radians(self.longitude_deg)
+        latitude, longitude = np.radians(latitude_deg), np.radians(longitude_deg)
+        haversine = (np.sin((latitudes - latitude) / 2) ** 2 +
+                     np.cos(latitudes) * np.cos(latitude) * np.sin((longitudes - longitude) / 2) ** 2)
+        return 2 * self.EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(haversine, 1)))
+
+    def __get_tree(self) -> cKDTree:
+        if self.__tree is None:
+            self.__tree = cKDTree(self.__to_unit_sphere(self.latitude_deg[self.__positions],
+                                                        self.longitude_deg[self.__positions]))
+        return self.__tree
+
+    def __to_unit_sphere(self, latitude_deg: np.ndarray, longitude_deg: np.ndarray) -> np.ndarray:
+        latitudes, longitudes = np.radians(latitude_deg), np.radians(longitude_deg)
+        return np.column_stack((np.cos(latitudes) * np.cos(longitudes), np.cos(latitudes) * np.sin(longitudes),
+                                np.sin(latitudes)))
@@ -0,0 +1,44 @@
+from typing import Sequence
+
+import numpy as np
+import shapely
+
+from model.GeoPandasMap import GeoPandasMap
+
+
+class ShapelyGeoFeatureAnalyzer:
+    EARTH_RADIUS_KM = 6371.0088
+
+    def __init__(self, geo_pandas_map: GeoPandasMap):
+        geometries = geo_pandas_map.data.geometry.to_numpy()
+        min_longitude, min_latitude, max_longitude, max_latitude = shapely.total_bounds(geometries)
+        self.origin = ((min_latitude + max_latitude) / 2, (min_longitude + max_longitude) / 2)
+        self.__area = shapely.union_all(geometries)
+        shapely.prepare(self.__area)
+        self.__edges = shapely.STRtree(self.__edge_segments(geometries))
+
+    def inside(self, latitude_deg: Sequence[float], longitude_deg: Sequence[float]) -> np.ndarray:
+        return shapely.intersects_xy(self.__area, np.asarray(longitude_deg, dtype=float),
+                                     np.asarray(latitude_deg, dtype=float))
+
+    def distance_to_edges_km(self, latitude_deg: Sequence[float], longitude_deg: Sequence[float]) -> np.ndarray:
+        coordinates = np.column_stack((np.asarray(longitude_deg, dtype=float), np.asarray(latitude_deg, dtype=float)))
+        points = shapely.points(self.__to_local_km(coordinates))
+        distances = np.full(len(points), np.nan)
+        (positions, _), nearest_distances = self.__edges.query_nearest(points, return_distance=True,
+                                                                       all_matches=False)
+        distances[positions] = nearest_distances
+        return distances
+
+    def __edge_segments(self, geometries: np.ndarray) -> np.ndarray:
+        rings = shapely.get_rings(shapely.get_parts(geometries))
+        coordinates, ring_indexes = shapely.get_coordinates(rings, return_index=True)
+        coordinates = self.__to_local_km(coordinates)
+        same_ring = ring_indexes[1:] == ring_indexes[:-1]
+        return shapely.linestrings(np.stack((coordinates[:-1][same_ring], coordinates[1:][same_ring]), axis=1))
+
+    def __to_local_km(self, coordinates: np.ndarray) -> np.ndarray:
+        origin_latitude, origin_longitude = np.radians(self.origin)
+        longitudes, latitudes = np.radians(coordinates[:, 0]), np.radians(coordinates[:, 1])
+        return np.column_stack(((longitudes - origin_longitude) * np.cos(origin_latitude) * self.EARTH_RADIUS_KM,
+                                (latitudes - origin_latitude) * self.EARTH_RADIUS_KM))
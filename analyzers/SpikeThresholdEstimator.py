@@ -0,0 +1,33 @@
+from typing import Self, Iterable
+
+from analyzers.KllQuantileSketch import KllQuantileSketch
+
+
+class SpikeThresholdEstimator:
+
+    def __init__(self, sketch_size: int | None = None, iqr_factor: float = 1.5):
+        self.sketch = KllQuantileSketch(sketch_size)
+        self.iqr_factor = iqr_factor
+
+    def update(self, values: Iterable[float]) -> Self:
+        self.sketch.update(values)
+        return self
+
+    def merge(self, other: "SpikeThresholdEstimator") -> Self:
+        self.sketch.merge(other.sketch)
+        return self
+
+    def calculate_threshold(self) -> float:
+        return self.calculate_iqr() * self.iqr_factor
+
+    def calculate_iqr(self) -> float:
+        q75, q25 = self.sketch.quantiles([0.75, 0.25])
+        return q75 - q25
+
+    def calculate_iqr_error_bound(self) -> float:
+        rank_error = self.sketch.rank_error()
+        iqr = self.calculate_iqr()
+        q75_low, q75_high, q25_low, q25_high = self.sketch.quantiles(
+            [max(0.75 - rank_error, 0), min(0.75 + rank_error, 1), max(0.25 - rank_error, 0),
+             min(0.25 + rank_error, 1)])
+        return max((q75_high - q25_low) - iqr, iqr - (q75_low - q25_high))
@@ -0,0 +1,41 @@
+from collections import deque
+from datetime import datetime
+from typing import Sequence
+
+from analyzers.NumpySpikeTestAnalyzer import NumpySpikeTestAnalyzer
+from model.Spikes import Spikes
+
+
+class StreamingSpikeAnalyzer:
+
+    def __init__(self, spike_thresholds: dict[Spikes.SpikeVariable, float]):
+        self.spike_thresholds = spike_thresholds
+        self.samples_count = 0
+        self.spike_test_analyzer = NumpySpikeTestAnalyzer()
+        self.__timestamps = deque(maxlen=3)
+        self.__values = {variable: deque(maxlen=3) for variable in spike_thresholds}
+
+    def update(self, timestamp: datetime, record: dict[Spikes.SpikeVariable, float]) -> Spikes:
+        return self.update_batch([timestamp], {variable: [value] for variable, value in record.items()})
+
+    def update_batch(self, timestamps: Sequence[datetime],
+                     records: dict[Spikes.SpikeVariable, Sequence[float]]) -> Spikes:
+        # Variable-major like NumpySpikeTestAnalyzer.analyze_many: the spikes of each variable, in the order of
+        # spike_thresholds, sorted by sample index.
+        spikes = Spikes([], [], [], [], [])
+        window_timestamps = [*self.__timestamps, *timestamps]
+        first_index = self.samples_count - len(self.__timestamps)
+        first_untested = len(self.__timestamps) - 1
+        for variable, spike_threshold in self.spike_thresholds.items():
+            window_values = [*self.__values[variable], *records[variable]]
+            for i in self.spike_test_analyzer.find_spikes(window_values, spike_threshold):
+                if i >= first_untested:
+                    spikes.variable.append(variable)
+                    spikes.threshold.append(spike_threshold)
+                    spikes.timestamp.append(window_timestamps[i])
+                    spikes.values.append(window_values[i])
+                    spikes.indexes.append(first_index + int(i))
+            self.__values[variable].extend(records[variable])
+        self.__timestamps.extend(timestamps)
+        self.samples_count += len(timestamps)
+        return spikes
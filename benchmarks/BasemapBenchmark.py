@@ -0,0 +1,69 @@
+import tempfile
+import time
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+import geopandas as gpd
+from shapely.geometry import Polygon
+
+from graphers.MatplotlibBasemapRasterizer import MatplotlibBasemapRasterizer
+from graphers.MatplotlibMapChartCreator import MatplotlibMapChartCreator
+from model.GeoPandasMap import GeoPandasMap
+from model.params.BasicPlotParams import BasicPlotParams
+from model.params.LimitedPlotArea import LimitedPlotArea
+from model.params.compound_params.LimitedPlotParams import LimitedPlotParams
+
+N_VERTICES = 400_000
+N_RENDERS = 3
+
+
+def main():
+    geo_map = create_synthetic_island_map(N_VERTICES)
+    coord_params = [LimitedPlotParams(BasicPlotParams([-17.9], [28.6], "Recorrido"),
+                                      LimitedPlotArea(-18.1, -17.7, 28.4, 28.8))] * 4
+    with tempfile.TemporaryDirectory() as basemap_dir:
+        vector_time = measure(lambda: render(geo_map, coord_params, None))
+        rasterizer = MatplotlibBasemapRasterizer(basemap_dir)
+        first_raster_time = measure(lambda: render(geo_map, coord_params, rasterizer), 1)
+        cached_raster_time = measure(lambda: render(geo_map, coord_params, rasterizer))
+        simplified_time = measure(lambda: render(geo_map, coord_params,
+                                                 MatplotlibBasemapRasterizer(basemap_dir, simplify_pixels=0.5)), 1)
+    print(f"{N_VERTICES} vertices, 2x2 map figure")
+    print(f"Vector polygons on every axis: {vector_time:.2f} s")
+    print(f"Rasterized basemap, first render: {first_raster_time:.2f} s")
+    print(f"Rasterized basemap, simplified first render: {simplified_time:.2f} s")
+    print(f"Rasterized basemap, cached: {cached_raster_time:.2f} s")
+    print(f"Speed-up: x{vector_time / cached_raster_time:.1f}")
+
+
+def create_synthetic_island_map(n_vertices: int) -> GeoPandasMap:
+    rng = np.random.default_rng(0)
+    angles = np.linspace(0, 2 * np.pi, n_vertices, endpoint=False)
+    island_radius = 0.15 + np.cumsum(rng.normal(0, 0.0005, n_vertices)) * np.sin(angles / 2)
+    lava_radius = 0.03 + np.cumsum(rng.normal(0, 0.0002, n_vertices // 4)) * np.sin(angles[::4] / 2)
+    island = Polygon(np.column_stack((-17.9 + island_radius * np.cos(angles), 28.6 + island_radius * np.sin(angles))))
+    lava = Polygon(np.column_stack((-17.82 + lava_radius * np.cos(angles[::4]),
+                                    28.6 + lava_radius * np.sin(angles[::4]))))
+    return GeoPandasMap(gpd.GeoDataFrame({"label": ["La Palma", "Coladas de lava"]}, geometry=[island, lava],
+                                         crs="EPSG:4326"))
+
+
+def render(geo_map: GeoPandasMap, coord_params: list[LimitedPlotParams],
+           rasterizer: MatplotlibBasemapRasterizer | None) -> None:
+    visualizer = MatplotlibMapChartCreator(2, 2, (20, 20), rasterizer)
+    visualizer.add_map_to_plots(geo_map, "label", ["orangered", "darkgreen"])
+    visualizer.create_map(coord_params, "Recorrido")
+    visualizer.fig.canvas.draw()
+
+
+def measure(function, repeat: int = N_RENDERS) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    main()
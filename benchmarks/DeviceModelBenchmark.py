@@ -0,0 +1,56 @@
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from etl.loaders.PandasWaveGliderV2OceanLoader import PandasWaveGliderV2OceanLoader
+from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
+
+N_SAMPLES = 1_000_000
+
+
+def main():
+    df = create_synthetic_ctd(N_SAMPLES)
+    for label, loader in [("List-backed", PandasWaveGliderV2OceanLoader()),
+                          ("Columnar", PandasWaveGliderV2OceanLoader(columnar=True))]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        glider = loader.load(df)
+        load_time = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        round_trip = to_df(glider)
+        round_trip_time = time.perf_counter() - start
+        pd.testing.assert_series_equal(df["Salinity_PSU"], round_trip["Salinity_PSU"])
+        print(f"{label}: {memory / 2 ** 20:.1f} MiB allocated on top of the DataFrame, load {load_time:.3f} s, "
+              f"back to DataFrame {round_trip_time:.3f} s")
+
+
+def create_synthetic_ctd(n_samples: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "TimeStamp": pd.date_range("2022-02-02", periods=n_samples, freq="1min"),
+        "Temperature_C": rng.normal(21, 0.5, n_samples),
+        "Conductivity_S_m": rng.normal(5.2, 0.05, n_samples),
+        "Salinity_PSU": rng.normal(36.8, 0.1, n_samples),
+        "Pressure_d": rng.normal(0.2, 0.01, n_samples),
+        "Oxygen_umol_L": rng.normal(210, 5, n_samples),
+        "Latitude_deg": rng.normal(28.6, 0.05, n_samples),
+        "Longitude_deg": rng.normal(-17.9, 0.05, n_samples)
+    })
+
+
+def to_df(glider: WaveGliderV2Ocean) -> pd.DataFrame:
+    return pd.DataFrame({
+        "TimeStamp": glider.timestamp,
+        "Temperature_C": glider.temperature_c,
+        "Conductivity_S_m": glider.conductivity_s_m,
+        "Salinity_PSU": glider.salinity_psu,
+        "Pressure_d": glider.pressure_d,
+        "Oxygen_umol_L": glider.oxygen
+    })
+
+
+main()
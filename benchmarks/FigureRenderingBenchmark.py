@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
+from graphers.ProcessPoolFigureRenderer import ProcessPoolFigureRenderer
+from model.params.BasicPlotParams import BasicPlotParams
+from model.params.LimitedPlotArea import LimitedPlotArea
+from model.params.MarkerParams import MarkerParams
+from model.params.compound_params.PlotStylishParams import PlotStylishParams
+from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
+
+N_FIGURES = 16
+N_SAMPLES = 20_000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        for figure in range(N_FIGURES):
+            render_figure(figure, os.path.join(tmp_dir, f"serial_{figure}.jpg"))
+        serial_time = time.perf_counter() - start
+        start = time.perf_counter()
+        with ProcessPoolFigureRenderer() as renderer:
+            for figure in range(N_FIGURES):
+                renderer.submit(render_figure, figure, os.path.join(tmp_dir, f"parallel_{figure}.jpg"))
+        parallel_time = time.perf_counter() - start
+    print(f"{N_FIGURES} figures of {N_SAMPLES} samples on {os.cpu_count()} cores")
+    print(f"Serial pyplot-free rendering: {serial_time:.2f} s")
+    print(f"Process pool rendering: {parallel_time:.2f} s")
+    print(f"Speed-up: x{serial_time / parallel_time:.1f}")
+
+
+def render_figure(seed: int, filename: str) -> None:
+    values = np.cumsum(np.random.default_rng(seed).normal(0, 0.01, N_SAMPLES))
+    visualizer = MatplotlibFigureCreator(2, 1, (14, 8))
+    params = PlotStylishParams(BasicPlotParams(np.arange(N_SAMPLES), values, "Temperatura"),
+                               MarkerParams("coral", "Temperatura", "-", 1),
+                               LimitedPlotArea(0, N_SAMPLES, values.min(), values.max()))
+    visualizer.create_timeseries([params], [params], "Figura " + str(seed), [])
+    MatplotlibFigureStorer().store(filename, visualizer.fig)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from etl.transformers.PandasTransformer import PandasTransformer
+
+MISSION_DAYS = 120
+SAMPLE_PERIOD = "1min"
+MISSING_HOURS_FRACTION = 0.1
+VARIABLES = ["Temperature_C", "Conductivity_S_m", "Salinity_PSU", "Pressure_d", "Oxygen_umol_L", "Latitude_deg",
+             "Longitude_deg"]
+
+
+def main():
+    mission = create_synthetic_mission(MISSION_DAYS)
+    legacy_time, legacy_means = measure(lambda: legacy_average_per_day_hour(mission.copy(), "TimeStamp"))
+    vectorized_time, vectorized_means = measure(
+        lambda: PandasTransformer().compute_average_per_day_hour(mission.copy(), "TimeStamp"))
+    pdt.assert_frame_equal(legacy_means, vectorized_means, check_exact=True)
+    print(f"{MISSION_DAYS} days, {len(mission)} samples, {len(vectorized_means)} hours")
+    print(f"Legacy strftime + per-hour loop: {legacy_time:.2f} s")
+    print(f"Vectorized hourly buckets + grouped fill: {vectorized_time:.3f} s")
+    print(f"Speed-up: x{legacy_time / vectorized_time:.0f}")
+
+
+def create_synthetic_mission(days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    timestamps = pd.date_range("2022-02-02", periods=days * 24 * 60, freq=SAMPLE_PERIOD)
+    hours = timestamps.floor('h')
+    missing_hours = rng.choice(hours.unique(), int(days * 24 * MISSING_HOURS_FRACTION), replace=False)
+    timestamps = timestamps[~hours.isin(missing_hours)]
+    df = pd.DataFrame({variable: np.cumsum(rng.normal(0, 0.01, len(timestamps))) for variable in VARIABLES})
+    df.insert(0, "TimeStamp", timestamps)
+    return df
+
+
+def legacy_average_per_day_hour(df: pd.DataFrame, date_column: str) -> pd.DataFrame:
+    df[date_column] = df[date_column].dt.strftime('%d/%m/%Y %H')
+    df = df.groupby(date_column).mean()
+    df.index = pd.to_datetime(df.index, format='%d/%m/%Y %H')
+    df = df.reindex(pd.date_range(min(df.index), end=max(df.index), freq='1h'))
+    df["Hora del día"] = df.index.strftime('%H')
+    df.index.name = date_column
+    df.reset_index(inplace=True)
+    for day_hour in df["Hora del día"].unique():
+        if df.loc[df["Hora del día"] == day_hour, :].isnull().values.any():
+            df.loc[df["Hora del día"] == day_hour, :] = (df.loc[df["Hora del día"] == day_hour, :]
+                                                         .sort_values([date_column], ascending=True)
+                                                         .ffill(inplace=False))
+            df.loc[df["Hora del día"] == day_hour, :] = (df.loc[df["Hora del día"] == day_hour, :]
+                                                         .sort_values([date_column], ascending=False)
+                                                         .ffill(inplace=False))
+    return df.drop(["Hora del día"], axis=1)
+
+
+def measure(function) -> tuple[float, any]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+main()
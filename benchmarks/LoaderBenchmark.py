@@ -0,0 +1,65 @@
+import multiprocessing
+import operator
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from AnalysisCommonTools import AnalysisCommonTools
+from analyzers.PandasWaveGliderV2OceanAnalyzer import PandasWaveGliderV2OceanAnalyzer
+from model.Spikes import Spikes
+
+DATA_DIR = "data"
+CTD_22_FILE = "/WG_220202_220318/MERGED_CTD_withOxygenCalc.csv"
+N_SYNTHETIC_SAMPLES = 500_000
+
+
+def main():
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    if not os.path.isfile(data_dir + CTD_22_FILE):
+        data_dir = tempfile.mkdtemp()
+        create_synthetic_ctd_file(data_dir + CTD_22_FILE, N_SYNTHETIC_SAMPLES)
+        print(f"{DATA_DIR + CTD_22_FILE} not found, using {N_SYNTHETIC_SAMPLES} synthetic samples")
+    context = multiprocessing.get_context("spawn")
+    for columnar in [False, True]:
+        with context.Pool(1) as pool:
+            wall_time, peak_rss_kib = pool.apply(load_and_analyze, (data_dir, columnar))
+        print(f"{'Columnar' if columnar else 'List-backed'}: {wall_time:.2f} s, peak RSS {peak_rss_kib / 1024:.0f} MiB")
+
+
+def load_and_analyze(data_dir: str, columnar: bool) -> tuple[float, int]:
+    tools = AnalysisCommonTools(data_dir, "", columnar=columnar)
+    start = time.perf_counter()
+    ocean_22 = (tools.define_etl_glider(["TimeStamp"], "%m/%d/%Y %I:%M %p", [0, 2, 3, 4, 5, 6, 7, 8])
+                .extract(data_dir + CTD_22_FILE)
+                .rename_columns(tools.define_wave_glider_ocean_variable_renames())
+                .filter_column("Pressure_d", operator.gt, 0)
+                .sort_values("TimeStamp")
+                .load())
+    PandasWaveGliderV2OceanAnalyzer(ocean_22).analyze_outliers(ocean_22, list(Spikes.SpikeVariable))
+    [date.date() for date in ocean_22.timestamp[::300]]
+    return time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def create_synthetic_ctd_file(filename: str, n_samples: int) -> None:
+    rng = np.random.default_rng(0)
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    pd.DataFrame({
+        "TimeStamp": pd.date_range("2022-02-02", periods=n_samples, freq="1min").strftime("%m/%d/%Y %I:%M %p"),
+        "Vehicle": "PLOCAN (SO 4089)",
+        "Latitude(deg)": rng.normal(28.6, 0.05, n_samples),
+        "Longitude(deg)": rng.normal(-17.9, 0.05, n_samples),
+        "Pressure": rng.uniform(0.1, 0.3, n_samples),
+        "Temperature": rng.normal(21, 0.5, n_samples),
+        "Conductivity": rng.normal(5.2, 0.05, n_samples),
+        "Oxygen": rng.normal(210, 5, n_samples),
+        "Salinity (PSU)": rng.normal(36.8, 0.1, n_samples),
+    }).to_csv(filename, index=False)
+
+
+if __name__ == "__main__":
+    main()
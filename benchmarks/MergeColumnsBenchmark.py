@@ -0,0 +1,62 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from etl.extractors.CSVPandasExtractor import CSVPandasExtractor
+from etl.transformers.PandasTransformer import PandasTransformer
+
+N_SAMPLES = 1_000_000
+DATE_COLUMNS = ["Day", "Month", "Year", "Time"]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asc_file = os.path.join(tmp_dir, "sbe37sm.asc")
+        create_synthetic_asc_file(asc_file, N_SAMPLES)
+        seabed = CSVPandasExtractor(None, None, [0, 1, 2, 3, 4, 5, 6], r"\s+").extract(asc_file)
+    transformer = PandasTransformer()
+    legacy_time, legacy_result = measure(lambda: legacy_merge_columns(seabed.copy(), DATE_COLUMNS, "TimeStamp", " "))
+    vectorized_time, vectorized_result = measure(
+        lambda: transformer.merge_columns(seabed.copy(), DATE_COLUMNS, "TimeStamp", " "))
+    pdt.assert_frame_equal(legacy_result, vectorized_result)
+    parsed_time, parsed_result = measure(
+        lambda: transformer.parse_datetime_column(transformer.merge_columns(seabed.copy(), DATE_COLUMNS,
+                                                                            "TimeStamp", " "), "TimeStamp"))
+    assembled_time, assembled_result = measure(
+        lambda: transformer.assemble_datetime_column(seabed.copy(), DATE_COLUMNS, "TimeStamp"))
+    pdt.assert_frame_equal(parsed_result, assembled_result)
+    print(f"{N_SAMPLES} samples")
+    print(f"Legacy row-wise astype(str).agg(join): {legacy_time:.2f} s")
+    print(f"Vectorized per-column text + element-wise join: {vectorized_time:.2f} s")
+    print(f"Speed-up: x{legacy_time / vectorized_time:.1f}")
+    print(f"Vectorized merge + parse_datetime_column: {parsed_time:.2f} s")
+    print(f"Typed assemble_datetime_column: {assembled_time:.2f} s")
+
+
+def create_synthetic_asc_file(path: str, n_samples: int) -> None:
+    rng = np.random.default_rng(0)
+    timestamps = pd.date_range("2024-04-10 09:00:00", periods=n_samples, freq="10s")
+    pd.DataFrame({"Temperature_C": np.round(18 + np.cumsum(rng.normal(0, 0.001, n_samples)), 4),
+                  "Conductivity_S_m": np.round(4.8 + np.cumsum(rng.normal(0, 0.0001, n_samples)), 5),
+                  "Salinity_PSU": np.round(36.6 + np.cumsum(rng.normal(0, 0.0001, n_samples)), 4),
+                  "Day": timestamps.day, "Month": timestamps.strftime("%b"), "Year": timestamps.year,
+                  "Time": timestamps.strftime("%H:%M:%S")}).to_csv(path, sep=" ", index=False)
+
+
+def legacy_merge_columns(df: pd.DataFrame, columns: list[str], new_column: str, sep_value: str) -> pd.DataFrame:
+    df[new_column] = df[columns].astype(str).agg(sep_value.join, axis=1)
+    return df.drop(columns, axis=1)
+
+
+def measure(function) -> tuple[float, any]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import time
+from datetime import datetime
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+from matplotlib import pyplot as plt
+
+from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
+from model.params.BasicPlotParams import BasicPlotParams
+from model.params.LimitedPlotArea import LimitedPlotArea
+from model.params.MarkerParams import MarkerParams
+from model.params.SpikesParams import SpikesParams
+from model.params.compound_params.PlotStylishSpikesParams import PlotStylishSpikesParams
+
+N_SAMPLES = 200_000
+N_SPIKES = 10_000
+SPIKE_RUN_LENGTH = 5
+
+
+def main():
+    params = create_synthetic_spikes_params(N_SAMPLES, N_SPIKES, False)
+    legacy_time = measure(lambda: render_legacy(params))
+    collection_time = measure(lambda: render(params))
+    merged_time = measure(lambda: render(create_synthetic_spikes_params(N_SAMPLES, N_SPIKES, True)))
+    print(f"{N_SAMPLES} samples, {N_SPIKES} spikes in runs of {SPIKE_RUN_LENGTH}")
+    print(f"Legacy axvline per spike: {legacy_time:.2f} s")
+    print(f"One vlines collection: {collection_time:.2f} s")
+    print(f"Runs merged into spans: {merged_time:.2f} s")
+    print(f"Speed-up: x{legacy_time / collection_time:.0f}")
+
+
+def create_synthetic_spikes_params(n_samples: int, n_spikes: int, merge_runs: bool) -> PlotStylishSpikesParams:
+    rng = np.random.default_rng(0)
+    values = np.cumsum(rng.normal(0, 0.01, n_samples))
+    run_starts = rng.choice(n_samples - SPIKE_RUN_LENGTH, n_spikes // SPIKE_RUN_LENGTH, replace=False)
+    spikes_indexes = np.unique((run_starts[:, None] + np.arange(SPIKE_RUN_LENGTH)).ravel())
+    return PlotStylishSpikesParams(
+        BasicPlotParams(np.arange(n_samples), values, "Salinidad"),
+        MarkerParams("indigo", "Salinidad PSU", "o", 10),
+        LimitedPlotArea(0, n_samples, values.min(), values.max()),
+        SpikesParams(spikes_indexes.tolist(), values[spikes_indexes].tolist(), "red", merge_runs))
+
+
+def render(params: PlotStylishSpikesParams) -> None:
+    visualizer = MatplotlibFigureCreator(1, 1, (14, 7))
+    visualizer.create_timeseries_with_outliers([], [params], "Spikes", [datetime(2023, 6, 1)])
+    visualizer.fig.canvas.draw()
+
+
+def render_legacy(params: PlotStylishSpikesParams) -> None:
+    fig, ax = plt.subplots(1, 1, figsize=(14, 7))
+    ax.scatter(x=params.basic_plot_params.x, y=params.basic_plot_params.y, color=params.marker_params.color,
+               s=params.marker_params.mark_size)
+    for index in params.spike_params.spikes_indexes:
+        ax.axvline(index, color=params.spike_params.spike_colour, alpha=0.3)
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def measure(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+main()
@@ -0,0 +1,65 @@
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from analyzers.NumpySpikeTestAnalyzer import NumpySpikeTestAnalyzer
+from model.Spikes import Spikes
+
+N_SAMPLES = 1_000_000
+N_LEGACY_SAMPLES = 20_000
+SPIKE_THRESHOLD = 0.05
+
+
+def main():
+    timestamps, salinity = create_synthetic_series(N_SAMPLES)
+    legacy_time, legacy_spikes = measure(lambda: legacy_spike_test(timestamps[:N_LEGACY_SAMPLES],
+                                                                   salinity[:N_LEGACY_SAMPLES]))
+    vectorized_time, vectorized_spikes = measure(lambda: NumpySpikeTestAnalyzer().analyze(
+        timestamps, salinity, Spikes.SpikeVariable.SALINITY_PSU, SPIKE_THRESHOLD))
+    check_same_spikes(legacy_spikes, vectorized_spikes)
+    legacy_time_extrapolated = legacy_time * N_SAMPLES / N_LEGACY_SAMPLES
+    print(f"Legacy loop: {legacy_time:.2f} s for {N_LEGACY_SAMPLES} samples "
+          f"(~{legacy_time_extrapolated:.1f} s extrapolated to {N_SAMPLES})")
+    print(f"Vectorized: {vectorized_time:.3f} s for {N_SAMPLES} samples, {len(vectorized_spikes.indexes)} spikes")
+    print(f"Speed-up: x{legacy_time_extrapolated / vectorized_time:.0f}")
+
+
+def create_synthetic_series(n_samples: int) -> tuple[list[datetime], list[float]]:
+    rng = np.random.default_rng(0)
+    salinity = 36.8 + np.cumsum(rng.normal(0, 0.002, n_samples))
+    spikes_idx = rng.choice(n_samples, n_samples // 1000, replace=False)
+    salinity[spikes_idx] += rng.choice([-1, 1], len(spikes_idx)) * rng.uniform(0.1, 0.5, len(spikes_idx))
+    start = datetime(2022, 2, 2)
+    return [start + timedelta(minutes=i) for i in range(n_samples)], salinity.tolist()
+
+
+def legacy_spike_test(timestamps: list[datetime], values: list[float]) -> Spikes:
+    variable = Spikes.SpikeVariable.SALINITY_PSU
+    df = pd.DataFrame({"TimeStamp": timestamps, variable.value: values})
+    df.loc[0, 'test value'] = None
+    for i in range(1, len(df) - 1):
+        v1 = df.loc[i - 1, variable.value]
+        v2 = df.loc[i, variable.value]
+        v3 = df.loc[i + 1, variable.value]
+        df.loc[i, 'test value'] = abs(v2 - (v3 + v1) / 2) - abs((v3 - v1) / 2)
+    outliers = df[df['test value'] > SPIKE_THRESHOLD]
+    return Spikes([variable] * len(outliers.index), SPIKE_THRESHOLD, list(outliers["TimeStamp"].dt.to_pydatetime()),
+                  list(outliers[variable.value]), list(outliers.index))
+
+
+def check_same_spikes(legacy: Spikes, vectorized: Spikes) -> None:
+    n_legacy = sum(index < N_LEGACY_SAMPLES - 1 for index in vectorized.indexes)
+    assert legacy.indexes == vectorized.indexes[:n_legacy]
+    assert legacy.values == vectorized.values[:n_legacy]
+    assert legacy.timestamp == vectorized.timestamp[:n_legacy]
+
+
+def measure(function) -> tuple[float, any]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+main()
@@ -1,73 +1,223 @@
+import functools
+import inspect
 from datetime import timedelta
 from typing import Callable, Iterable, Any, Self
 
+from etl.PlanStep import PlanStep
+from etl.QueryPlan import QueryPlan
 from model.Spikes import Spikes
 
 
+def deferrable(method: Callable) -> Callable:
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def defer_when_lazy(etl, *args, **kwargs):
+        if not etl.lazy:
+            return method(etl, *args, **kwargs)
+        arguments = signature.bind(etl, *args, **kwargs)
+        arguments.apply_defaults()
+        etl.plan.append(PlanStep(method.__name__, *arguments.args[1:]))
+        return etl
+    return defer_when_lazy
+
+
 class ETL:
 
-    def __init__(self, extractor, transformer, loader):
+    def __init__(self, extractor, transformer, loader, lazy: bool = False):
         self.data = None
+        self.chunks = None
+        self.source = None
+        self.plan = []
+        self.time_buckets = None
+        self.lazy = lazy
         self.extractor = extractor
         self.transformer = transformer
         self.loader = loader
 
-    def extract(self, path: str) -> Self:
-        self.data = self.extractor.extract(path)
+    @deferrable
+    def extract(self, path: str, columns: list[str] = None) -> Self:
+        self.data = self.extractor.extract(path) if columns is None else self.extractor.extract(path, columns)
+        self.chunks = None
+        self.source = path
+        return self
+
+    @deferrable
+    def extract_chunks(self, path: str, columns: list[str] = None) -> Self:
+        self.data = None
+        self.chunks = (self.extractor.extract_chunks(path) if columns is None
+                       else self.extractor.extract_chunks(path, columns))
+        self.source = path
+        return self
+
+    def fork(self, etl: Self = None) -> Self:
+        self.collect()
+        branch = etl if etl is not None else ETL(self.extractor, self.transformer, self.loader, self.lazy)
+        branch.data = self.transformer.share(self.data)
+        branch.time_buckets = self.time_buckets
+        branch.source = self.source
+        branch.chunks = None
+        branch.plan = []
+        return branch
+
+    def optimized_plan(self) -> QueryPlan:
+        return QueryPlan(self.plan).optimize(getattr(self.loader, "REQUIRED_COLUMNS", None))
+
+    def explain(self) -> Self:
+        print(self.optimized_plan().explain(self.__estimate_source_rows()))
+        return self
+
+    def collect(self) -> Self:
+        if self.plan:
+            self.__execute(self.optimized_plan())
+        if self.chunks is not None:
+            self.data = self.transformer.concat_chunks(self.chunks)
+            self.chunks = None
         return self
 
+    @deferrable
     def rename_columns(self, old_and_new_names: dict[str, str]) -> Self:
-        self.data = self.transformer.rename_columns(self.data, old_and_new_names)
+        self.__transform_rows(self.transformer.rename_columns, old_and_new_names)
         return self
 
+    @deferrable
     def sort_values(self, column_label: str) -> Self:
-        self.data = self.transformer.sort_values(self.data, column_label)
+        if self.chunks is None:
+            self.data = self.transformer.sort_values(self.data, column_label)
+        else:
+            self.chunks = self.transformer.sort_chunks(self.chunks, column_label)
         return self
 
+    @deferrable
     def correct_dates(self, greater_than: any, less_than: any, col_name: str,
                       time_to_subtract: timedelta) -> Self:
-        self.data = self.transformer.correct_dates(self.data, greater_than, less_than, col_name, time_to_subtract)
+        self.__transform_rows(self.transformer.correct_dates, greater_than, less_than, col_name, time_to_subtract)
         return self
 
+    @deferrable
     def filter_column(self, col_name: str, operator: Callable, value: any) -> Self:
-        self.data = self.transformer.filter_column(self.data, col_name, operator, value)
+        self.__transform_rows(self.transformer.filter_column, col_name, operator, value)
+        return self
+
+    @deferrable
+    def filter_columns(self, column_filters: list[tuple[str, Callable, Any]]) -> Self:
+        self.__transform_rows(self.transformer.filter_columns, column_filters)
         return self
 
+    @deferrable
     def filter_column_and_interpolate(self, col_name: str, operator: Callable, value: any) -> Self:
+        self.__check_not_chunked("filter_column_and_interpolate")
         self.data = self.transformer.filter_column_and_interpolate(self.data, col_name, operator, value)
         return self
 
+    @deferrable
     def concat_data(self, etl_with_data_to_concat: Self) -> Self:
-        self.data = self.transformer.concat_data(self.data, etl_with_data_to_concat.data)
+        self.__check_not_chunked("concat_data")
+        self.data = self.transformer.concat_data(self.data, etl_with_data_to_concat.collect().data)
         return self
 
-    def add_column(self, label: str, values: Iterable[Any]) -> Self:
-        self.data = self.transformer.add_column(self.data, label, values)
+    @deferrable
+    def add_column(self, label: str, values: Iterable[Any] | Callable[..., Iterable[Any]],
+                   source_columns: list[str] = None) -> Self:
+        self.__check_not_chunked("add_column")
+        self.data = self.transformer.add_column(self.data, label, values, source_columns)
         return self
 
+    @deferrable
     def compute_average_per_timestamp(self, date_col: str) -> Self:
+        self.__check_not_chunked("compute_average_per_timestamp")
         self.data = self.transformer.compute_average_per_timestamp(self.data, date_col)
         return self
 
+    @deferrable
     def compute_average_per_day_hour(self, date_column: str) -> Self:
-        self.data = self.transformer.compute_average_per_day_hour(self.data, date_column)
+        if self.chunks is None:
+            self.data = self.transformer.compute_average_per_day_hour(self.data, date_column)
+        else:
+            self.data = self.transformer.compute_average_per_day_hour_chunks(self.chunks, date_column)
+            self.chunks = None
         return self
 
+    @deferrable
+    def aggregate_time_buckets(self, date_column: str, resolutions: list[str], statistics: list[str] = None) -> Self:
+        self.__check_not_chunked("aggregate_time_buckets")
+        self.time_buckets = self.transformer.aggregate_time_buckets(self.data, date_column, resolutions, statistics)
+        return self
+
+    @deferrable
+    def select_time_bucket(self, resolution: str, statistic: str = "mean") -> Self:
+        self.data = self.transformer.select_time_bucket(self.time_buckets, resolution, statistic)
+        return self
+
+    @deferrable
     def remove_values_not_in(self, col_with_values: str, etl_with_values_to_keep: Self) -> Self:
-        self.data = self.transformer.remove_values_not_in(self.data, col_with_values, etl_with_values_to_keep.data)
+        self.__check_not_chunked("remove_values_not_in")
+        self.data = self.transformer.remove_values_not_in(self.data, col_with_values,
+                                                          etl_with_values_to_keep.collect().data)
+        return self
+
+    @deferrable
+    def align_with(self, on: str, etl_to_align: Self, tolerance: timedelta = None, direction: str = "nearest",
+                   aggregations: dict[str, str | Callable] = None) -> Self:
+        self.__check_not_chunked("align_with")
+        self.data, etl_to_align.data = self.transformer.align_asof(self.data, etl_to_align.collect().data, on,
+                                                                   tolerance, direction, aggregations)
         return self
 
+    @deferrable
     def merge_columns(self, columns: list[str], new_column: str, sep_value: str) -> Self:
-        self.data = self.transformer.merge_columns(self.data, columns, new_column, sep_value)
+        self.__transform_rows(self.transformer.merge_columns, columns, new_column, sep_value)
         return self
 
+    @deferrable
     def parse_datetime_column(self, time_column: str, date_format: str = None) -> Self:
-        self.data = self.transformer.parse_datetime_column(self.data, time_column, date_format)
+        self.__transform_rows(self.transformer.parse_datetime_column, time_column, date_format, self.source)
         return self
 
-    def interpolate_outliers(self, outliers: Spikes, timestamps_label: str) -> Self:
-        self.data = self.transformer.interpolate_outliers(self.data, outliers, timestamps_label)
+    @deferrable
+    def assemble_datetime_column(self, columns: list[str], new_column: str) -> Self:
+        self.__transform_rows(self.transformer.assemble_datetime_column, columns, new_column)
+        return self
+
+    @deferrable
+    def interpolate_outliers(self, outliers: Spikes, timestamps_label: str, method: str = "linear") -> Self:
+        self.__check_not_chunked("interpolate_outliers")
+        self.data = self.transformer.interpolate_outliers(self.data, outliers, timestamps_label, method)
+        return self
+
+    @deferrable
+    def interpolate_outliers_and_filter(self, outliers: Spikes, timestamps_label: str,
+                                        column_filters: list[tuple[str, Callable, Any]],
+                                        method: str = "linear") -> Self:
+        self.__check_not_chunked("interpolate_outliers_and_filter")
+        self.data = self.transformer.interpolate_outliers_and_filter(self.data, outliers, timestamps_label,
+                                                                     column_filters, method)
         return self
 
     def load(self):
+        self.collect()
         return self.loader.load(self.data)
+
+    def __estimate_source_rows(self) -> int | None:
+        if self.plan and self.plan[0].name in ("extract", "extract_chunks"):
+            return self.extractor.estimate_rows(self.plan[0].args[0]) \
+                if hasattr(self.extractor, "estimate_rows") else None
+        return None if self.data is None else len(self.data)
+
+    def __execute(self, plan: QueryPlan) -> None:
+        self.plan, self.lazy = [], False
+        try:
+            for step in plan.steps:
+                getattr(self, step.name)(*step.args)
+        finally:
+            self.lazy = True
+
+    def __transform_rows(self, transformation: Callable, *args) -> None:
+        if self.chunks is None:
+            self.data = transformation(self.data, *args)
+        else:
+            self.chunks = (transformation(chunk, *args) for chunk in self.chunks)
+
+    def __check_not_chunked(self, step: str) -> None:
+        if self.chunks is not None:
+            raise ValueError(f"{step} needs the whole dataset, call collect() before it when extracting in chunks")
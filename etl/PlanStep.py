@@ -0,0 +1,8 @@
+class PlanStep:
+
+    def __init__(self, name: str, *args):
+        self.name = name
+        self.args = args
+
+    def with_args(self, *args) -> "PlanStep":
+        return PlanStep(self.name, *args)
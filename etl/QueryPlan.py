@@ -0,0 +1,145 @@
+import math
+import operator
+from typing import Callable, Any
+
+from etl.PlanStep import PlanStep
+from model.Spikes import Spikes
+
+ColumnFilter = tuple[str, Callable, Any]
+
+
+class QueryPlan:
+    FILTER_SELECTIVITY = {operator.eq: 0.1, operator.ne: 0.9, operator.lt: 1 / 3, operator.le: 1 / 3,
+                          operator.gt: 1 / 3, operator.ge: 1 / 3}
+    DEFAULT_SELECTIVITY = 0.5
+    OPERATOR_SYMBOLS = {operator.eq: "==", operator.ne: "!=", operator.lt: "<", operator.le: "<=",
+                        operator.gt: ">", operator.ge: ">="}
+    MINUTES_PER_DAY = 24 * 60
+
+    def __init__(self, steps: list[PlanStep]):
+        self.steps = steps
+
+    def optimize(self, required_columns: list[str] | None = None) -> "QueryPlan":
+        steps = []
+        for step in self.steps:
+            if step.name == "filter_column":
+                self.__push_down_filter(steps, step.args)
+            else:
+                steps.append(step)
+        if required_columns is not None and steps and steps[0].name in ("extract", "extract_chunks"):
+            steps[0] = steps[0].with_args(steps[0].args[0],
+                                          self.__source_columns(steps[1:], set(required_columns)))
+        return QueryPlan(steps)
+
+    def __push_down_filter(self, steps: list[PlanStep], column_filter: ColumnFilter) -> None:
+        position = len(steps)
+        while position > 0:
+            previous = steps[position - 1]
+            if previous.name == "filter_columns":
+                steps[position - 1] = previous.with_args(previous.args[0] + [column_filter])
+                return
+            if previous.name == "interpolate_outliers" and column_filter[0] not in previous.args[0].variable:
+                steps[position - 1] = PlanStep("interpolate_outliers_and_filter", *previous.args[:2], [column_filter],
+                                               *previous.args[2:])
+                return
+            if previous.name == "interpolate_outliers_and_filter":
+                steps[position - 1] = previous.with_args(*previous.args[:2], previous.args[2] + [column_filter],
+                                                         *previous.args[3:])
+                return
+            moved_filter = self.__filter_before(previous, column_filter)
+            if moved_filter is None:
+                break
+            column_filter = moved_filter
+            position -= 1
+        steps.insert(position, PlanStep("filter_columns", [column_filter]))
+
+    def __filter_before(self, step: PlanStep, column_filter: ColumnFilter) -> ColumnFilter | None:
+        column = column_filter[0]
+        if step.name == "rename_columns":
+            renamed_from = [old for old, new in step.args[0].items() if new == column]
+            if renamed_from:
+                return renamed_from[0], *column_filter[1:]
+            return None if column in step.args[0] else column_filter
+        if step.name == "correct_dates" and column != step.args[2]:
+            return column_filter
+        if step.name == "parse_datetime_column" and column != step.args[0]:
+            return column_filter
+        if (step.name in ("merge_columns", "assemble_datetime_column") and
+                column not in [*step.args[0], step.args[1]]):
+            return column_filter
+        return None
+
+    def __source_columns(self, steps: list[PlanStep], required: set[str]) -> list[str]:
+        for step in reversed(steps):
+            required = self.__columns_before(step, required)
+        return sorted(map(str, required))
+
+    def __columns_before(self, step: PlanStep, required: set[str]) -> set[str]:
+        if step.name == "rename_columns":
+            return ({old for old, new in step.args[0].items() if new in required} |
+                    {column for column in required if column not in step.args[0].values()})
+        if step.name in ("merge_columns", "assemble_datetime_column"):
+            return (required - {step.args[1]}) | set(step.args[0])
+        if step.name == "add_column":
+            return (required - {step.args[0]}) | set(step.args[2] if len(step.args) > 2 and step.args[2] else ())
+        return required | self.__read_columns(step)
+
+    def __read_columns(self, step: PlanStep) -> set[str]:
+        if step.name == "filter_columns":
+            return self.__filter_columns(step.args[0])
+        if step.name == "interpolate_outliers":
+            return {step.args[1], *map(str, step.args[0].variable)}
+        if step.name == "interpolate_outliers_and_filter":
+            return {step.args[1], *map(str, step.args[0].variable)} | self.__filter_columns(step.args[2])
+        if step.name == "correct_dates":
+            return {step.args[2]}
+        if step.name in ("filter_column_and_interpolate", "sort_values", "parse_datetime_column",
+                         "compute_average_per_timestamp", "compute_average_per_day_hour", "remove_values_not_in",
+                         "align_with", "aggregate_time_buckets"):
+            return {step.args[0]}
+        return set()
+
+    def __filter_columns(self, column_filters: list[ColumnFilter]) -> set[str]:
+        return {column for column, _, _ in column_filters}
+
+    def estimate_rows(self, source_rows: int | None) -> list[int | None]:
+        rows, estimates = source_rows, []
+        for step in self.steps:
+            rows = None if rows is None else self.__estimate_step_rows(step, rows)
+            estimates.append(rows)
+        return estimates
+
+    def __estimate_step_rows(self, step: PlanStep, rows: int) -> int:
+        if step.name == "filter_columns":
+            return round(rows * self.__selectivity(step.args[0]))
+        if step.name == "interpolate_outliers_and_filter":
+            return round(rows * self.__selectivity(step.args[2]))
+        if step.name in ("remove_values_not_in", "align_with"):
+            return round(rows * self.DEFAULT_SELECTIVITY)
+        if step.name == "compute_average_per_timestamp":
+            return min(rows, self.MINUTES_PER_DAY)
+        return rows
+
+    def __selectivity(self, column_filters: list[ColumnFilter]) -> float:
+        return math.prod(self.FILTER_SELECTIVITY.get(filter_operator, self.DEFAULT_SELECTIVITY)
+                         for _, filter_operator, _ in column_filters)
+
+    def explain(self, source_rows: int | None = None) -> str:
+        return "\n".join(f"{position}. {self.__describe_step(step)}  ~{'?' if rows is None else rows} rows"
+                         for position, (step, rows) in enumerate(zip(self.steps, self.estimate_rows(source_rows)),
+                                                                 start=1))
+
+    def __describe_step(self, step: PlanStep) -> str:
+        return f"{step.name}({', '.join(map(self.__describe_arg, step.args))})"
+
+    def __describe_arg(self, arg: Any) -> str:
+        if isinstance(arg, list) and arg and isinstance(arg[0], tuple):
+            return " & ".join(f"{column} {self.OPERATOR_SYMBOLS.get(filter_operator, filter_operator)} {value!r}"
+                              for column, filter_operator, value in arg)
+        if isinstance(arg, Spikes):
+            return f"<{len(arg.indexes)} spikes>"
+        if callable(arg) and arg in self.OPERATOR_SYMBOLS:
+            return self.OPERATOR_SYMBOLS[arg]
+        if isinstance(arg, (str, int, float, list, dict, tuple)) or arg is None:
+            return repr(arg)
+        return f"<{type(arg).__name__}>"
@@ -1,18 +1,139 @@
+import glob
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Iterator
+
+import numpy as np
 import pandas as pd
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from model.CSVSchema import CSVSchema
 
 
 class CSVPandasExtractor:
+    MAX_SHARED_EXTRACTIONS = 8
+    __shared_extractions: OrderedDict[str, tuple[list[int], pd.DataFrame]] = OrderedDict()
 
     def __init__(self, parse_dates: list[str] = None, date_format: str = None,
-                 relevant_cols_idx: list[int] = None, delimiter: str = None, index_col: list[int] = False):
+                 relevant_cols_idx: list[int] = None, delimiter: str = None, index_col: list[int] = False,
+                 cache_dir: str = None, chunk_size: int = None, shared: bool = False, schema: CSVSchema = None,
+                 downcast: bool = False):
         self.parse_dates = parse_dates
         self.date_format = date_format
         self.relevant_cols_idx = relevant_cols_idx
         self.delimiter = delimiter
         self.index_col = index_col
+        if cache_dir is not None and pa is None:
+            raise ImportError("caching extractions in cache_dir needs pyarrow, install it or pass cache_dir=None")
+        self.cache_dir = cache_dir
+        self.chunk_size = chunk_size
+        self.shared = shared
+        self.schema = schema
+        self.downcast = downcast
+
+    def extract(self, csv: str, columns: list[str] = None) -> pd.DataFrame:
+        usecols, parse_dates = self.__read_options(csv, columns)
+        if self.shared:
+            return self.__extract_shared(csv, usecols, parse_dates)
+        return self.__extract(csv, usecols, parse_dates)
+
+    def __extract(self, csv: str, usecols: list | None, parse_dates: list[str] | None) -> pd.DataFrame:
+        if self.cache_dir is None:
+            return self.__read_csv(csv, usecols, parse_dates)
+        return self.__extract_cached(csv, usecols, parse_dates)
+
+    def __extract_shared(self, csv: str, usecols: list | None, parse_dates: list[str] | None) -> pd.DataFrame:
+        source_key = self.__source_key(csv, usecols, parse_dates)
+        source = os.stat(csv)
+        stamp, df = self.__shared_extractions.get(source_key, (None, None))
+        if stamp != [source.st_mtime_ns, source.st_size]:
+            df = self.__extract(csv, usecols, parse_dates)
+            self.__shared_extractions[source_key] = ([source.st_mtime_ns, source.st_size], df)
+        self.__shared_extractions.move_to_end(source_key)
+        while len(self.__shared_extractions) > self.MAX_SHARED_EXTRACTIONS:
+            self.__shared_extractions.popitem(last=False)
+        return df.copy(deep=pd.get_option("mode.copy_on_write") is not True)
+
+    def clear_shared_extractions(self) -> None:
+        self.__shared_extractions.clear()
+
+    def extract_chunks(self, csv: str, columns: list[str] = None) -> Iterator[pd.DataFrame]:
+        if self.chunk_size is None:
+            yield self.extract(csv, columns)
+            return
+        # Chunks are never downcast: each one would check the float32 tolerance on its own values, so a column could
+        # mix rounded and full-precision chunks once they are concatenated again.
+        with self.__read_csv(csv, *self.__read_options(csv, columns), self.chunk_size) as chunks:
+            yield from chunks
+
+    def estimate_rows(self, csv: str, sample_size: int = 1 << 16) -> int:
+        with open(csv, "rb") as file:
+            sample = file.read(sample_size)
+        lines = len(sample.splitlines())
+        if len(sample) < sample_size:
+            return max(lines - 1, 0)
+        return max(round(os.path.getsize(csv) * lines / len(sample)) - 1, 0)
 
-    def extract(self, csv: str) -> pd.DataFrame:
+    def __read_options(self, csv: str, columns: list[str] | None) -> tuple[list | None, list[str] | None]:
+        if columns is None or self.index_col is not False:
+            return self.relevant_cols_idx, self.parse_dates
+        header = pd.read_csv(csv, nrows=0, usecols=self.relevant_cols_idx, delimiter=self.delimiter)
+        usecols = [column for column in header.columns if column in columns]
         if self.parse_dates is None:
-            return pd.read_csv(csv, usecols=self.relevant_cols_idx, delimiter=self.delimiter, index_col=self.index_col)
-        return (pd.read_csv(csv, parse_dates=self.parse_dates, date_format=self.date_format, delimiter=self.delimiter,
-                            usecols=self.relevant_cols_idx, index_col=self.index_col))
+            return usecols, None
+        return usecols, [column for column in self.parse_dates if column in usecols]
+
+    def __read_csv(self, csv: str, usecols: list | None, parse_dates: list[str] | None, chunk_size: int = None) \
+            -> pd.DataFrame | pd.io.parsers.TextFileReader:
+        dtypes = None if self.schema is None else {column: dtype for column, dtype in self.schema.dtypes.items()
+                                                   if parse_dates is None or column not in parse_dates}
+        if parse_dates is None:
+            df = pd.read_csv(csv, usecols=usecols, delimiter=self.delimiter, index_col=self.index_col,
+                             chunksize=chunk_size, dtype=dtypes)
+        else:
+            df = (pd.read_csv(csv, parse_dates=parse_dates, date_format=self.date_format, delimiter=self.delimiter,
+                              usecols=usecols, index_col=self.index_col, chunksize=chunk_size, dtype=dtypes))
+        return df if chunk_size is not None else self.__downcast_floats(df)
+
+    def __downcast_floats(self, df: pd.DataFrame) -> pd.DataFrame:
+        if not self.downcast or self.schema is None:
+            return df
+        for column, tolerance in self.schema.float32_tolerances.items():
+            if column in df.columns and pd.api.types.is_float_dtype(df[column]):
+                values = df[column].to_numpy()
+                downcast_values = values.astype(np.float32)
+                if np.nanmax(np.abs(downcast_values - values), initial=0) <= tolerance:
+                    df[column] = downcast_values
+        return df
+
+    def __extract_cached(self, csv: str, usecols: list | None, parse_dates: list[str] | None) -> pd.DataFrame:
+        cache_prefix = self.__cache_prefix(csv, usecols, parse_dates)
+        source = os.stat(csv)
+        cache_file = cache_prefix + self.__hash([source.st_mtime_ns, source.st_size]) + ".parquet"
+        if os.path.isfile(cache_file):
+            return pd.read_parquet(cache_file)
+        df = self.__read_csv(csv, usecols, parse_dates)
+        self.__remove_stale_cache_files(cache_prefix)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        df.to_parquet(cache_file)
+        return df
+
+    def __cache_prefix(self, csv: str, usecols: list | None, parse_dates: list[str] | None) -> str:
+        return os.path.join(self.cache_dir, self.__source_key(csv, usecols, parse_dates) + "-")
+
+    def __source_key(self, csv: str, usecols: list | None, parse_dates: list[str] | None) -> str:
+        source = [os.path.abspath(csv), usecols, parse_dates, self.date_format, self.delimiter, self.index_col]
+        if self.schema is not None:
+            source += [self.schema.dtypes, self.schema.float32_tolerances, self.downcast]
+        return self.__hash(source)
+
+    def __remove_stale_cache_files(self, cache_prefix: str) -> None:
+        for stale_file in glob.glob(glob.escape(cache_prefix) + "*.parquet"):
+            os.remove(stale_file)
+
+    def __hash(self, values: list) -> str:
+        return hashlib.sha256(repr(values).encode()).hexdigest()[:16]
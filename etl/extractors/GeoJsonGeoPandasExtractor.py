@@ -1,6 +1,38 @@
+import glob
+import hashlib
+import os
+
 import geopandas as gpd
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 
 class GeoJsonGeoPandasExtractor:
+
+    def __init__(self, cache_dir: str = None):
+        if cache_dir is not None and pa is None:
+            raise ImportError("caching extractions in cache_dir needs pyarrow, install it or pass cache_dir=None")
+        self.cache_dir = cache_dir
+
     def extract(self, geojson: str) -> gpd.GeoDataFrame:
-        return gpd.read_file(geojson)
+        if self.cache_dir is None:
+            return gpd.read_file(geojson)
+        return self.__extract_cached(geojson)
+
+    def __extract_cached(self, geojson: str) -> gpd.GeoDataFrame:
+        cache_prefix = os.path.join(self.cache_dir, self.__hash([os.path.abspath(geojson)]) + "-")
+        source = os.stat(geojson)
+        cache_file = cache_prefix + self.__hash([source.st_mtime_ns, source.st_size]) + ".geoparquet"
+        if os.path.isfile(cache_file):
+            return gpd.read_parquet(cache_file)
+        gdf = gpd.read_file(geojson)
+        for stale_file in glob.glob(glob.escape(cache_prefix) + "*.geoparquet"):
+            os.remove(stale_file)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        gdf.to_parquet(cache_file)
+        return gdf
+
+    def __hash(self, values: list) -> str:
+        return hashlib.sha256(repr(values).encode()).hexdigest()[:16]
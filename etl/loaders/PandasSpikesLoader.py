@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from model.Spikes import Spikes
@@ -6,7 +7,14 @@ from model.Table import Table
 
 class PandasSpikesLoader:
 
+    def __init__(self, columnar: bool = False):
+        self.columnar = columnar
+
     def load(self, df: pd.DataFrame) -> Spikes:
+        if self.columnar:
+            return Spikes([Spikes.SpikeVariable(value) for value in df["Variable"]], df["Threshold"].iloc[0],
+                          pd.DatetimeIndex(df["TimeStamp"]),
+                          df["Values"].to_numpy(dtype=np.float64, copy=False), df.index.to_numpy())
         return Spikes([Spikes.SpikeVariable(value) for value in df["Variable"]], df["Threshold"].iloc[0],
                       # We take first threshold of different values, because it is not used for preprocess after loading
                       list(df["TimeStamp"].dt.to_pydatetime()),
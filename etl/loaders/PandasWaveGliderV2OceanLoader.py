@@ -1,5 +1,7 @@
 from datetime import datetime
+from typing import Sequence
 
+import numpy as np
 import pandas as pd
 from pandas.core.dtypes.common import is_datetime64_any_dtype
 
@@ -7,20 +9,32 @@ from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
 
 
 class PandasWaveGliderV2OceanLoader:
+    REQUIRED_COLUMNS = ["TimeStamp", "Temperature_C", "Conductivity_S_m", "Salinity_PSU", "Pressure_d", "Oxygen_umol_L",
+                        "Latitude_deg", "Longitude_deg"]
+
+    def __init__(self, columnar: bool = False):
+        self.columnar = columnar
 
     def load(self, df: pd.DataFrame) -> WaveGliderV2Ocean:
         return WaveGliderV2Ocean(
             self.date_column_to_list(df["TimeStamp"]),
-            df["Temperature_C"].to_list(),
-            df["Conductivity_S_m"].to_list(),
-            df["Salinity_PSU"].to_list(),
-            df["Pressure_d"].to_list(),
-            df["Oxygen_umol_L"].to_list(),
-            df["Latitude_deg"].to_list(),
-            df["Longitude_deg"].to_list()
+            self.column_to_list(df["Temperature_C"]),
+            self.column_to_list(df["Conductivity_S_m"]),
+            self.column_to_list(df["Salinity_PSU"]),
+            self.column_to_list(df["Pressure_d"]),
+            self.column_to_list(df["Oxygen_umol_L"]),
+            self.column_to_list(df["Latitude_deg"]),
+            self.column_to_list(df["Longitude_deg"])
         )
 
-    def date_column_to_list(self, column: pd.Series) -> list[datetime]:
+    def date_column_to_list(self, column: pd.Series) -> Sequence[datetime]:
+        if self.columnar:
+            return pd.DatetimeIndex(column)
         if is_datetime64_any_dtype(column):
             return list(column.dt.to_pydatetime())
         return column.to_list()
+
+    def column_to_list(self, column: pd.Series) -> Sequence[float]:
+        if self.columnar:
+            return column.to_numpy(dtype=np.float64, copy=False)
+        return column.to_list()
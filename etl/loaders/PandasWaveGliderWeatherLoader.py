@@ -1,5 +1,7 @@
 from datetime import datetime
+from typing import Sequence
 
+import numpy as np
 import pandas as pd
 from pandas.core.dtypes.common import is_datetime64_any_dtype
 
@@ -7,18 +9,31 @@ from model.ocean_devices.WaveGliderV2Weather import WaveGliderV2Weather
 
 
 class PandasWaveGliderWeatherLoader:
+    REQUIRED_COLUMNS = ["TimeStamp", "Temperature_C", "Wind_speed_kt", "Wind_gust_speed_kt", "Wind_direction",
+                        "Latitude_deg", "Longitude_deg"]
+
+    def __init__(self, columnar: bool = False):
+        self.columnar = columnar
+
     def load(self, df: pd.DataFrame) -> WaveGliderV2Weather:
         return WaveGliderV2Weather(
             self.date_column_to_list(df["TimeStamp"]),
-            df["Temperature_C"].to_list(),
-            df["Wind_speed_kt"].to_list(),
-            df["Wind_gust_speed_kt"].to_list(),
-            df["Wind_direction"].to_list(),
-            df["Latitude_deg"].to_list(),
-            df["Longitude_deg"].to_list()
+            self.column_to_list(df["Temperature_C"]),
+            self.column_to_list(df["Wind_speed_kt"]),
+            self.column_to_list(df["Wind_gust_speed_kt"]),
+            self.column_to_list(df["Wind_direction"]),
+            self.column_to_list(df["Latitude_deg"]),
+            self.column_to_list(df["Longitude_deg"])
         )
 
-    def date_column_to_list(self, column: pd.Series) -> list[datetime]:
+    def date_column_to_list(self, column: pd.Series) -> Sequence[datetime]:
+        if self.columnar:
+            return pd.DatetimeIndex(column)
         if is_datetime64_any_dtype(column):
             return list(column.dt.to_pydatetime())
         return column.to_list()
+
+    def column_to_list(self, column: pd.Series) -> Sequence[float]:
+        if self.columnar:
+            return column.to_numpy(dtype=np.float64, copy=False)
+        return column.to_list()
@@ -0,0 +1,38 @@
+from typing import Sequence
+
+import numpy as np
+
+from model.TimePyramid import TimePyramid
+
+
+class NumpyTimePyramidBuilder:
+
+    def __init__(self, branching: int = 4, min_buckets: int = 256):
+        self.branching = branching
+        self.min_buckets = min_buckets
+
+    def build(self, values: Sequence[float]) -> TimePyramid:
+        values = np.asarray(values, dtype=float)
+        counts = (~np.isnan(values)).astype(np.int64)
+        level = TimePyramid.Level(1, values, values, values, counts)
+        levels = []
+        while len(level) > self.min_buckets:
+            level = self.__combine(level)
+            levels.append(level)
+        return TimePyramid(len(values), levels)
+
+    def __combine(self, level: TimePyramid.Level) -> TimePyramid.Level:
+        counts = self.__blocks(level.counts, 0).sum(axis=1)
+        weighted_sums = self.__blocks(np.where(level.counts > 0, level.means * level.counts, 0.0), 0.0).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, weighted_sums / counts, np.nan)
+        return TimePyramid.Level(level.bucket_size * self.branching,
+                                 np.fmin.reduce(self.__blocks(level.minimums, np.nan), axis=1),
+                                 np.fmax.reduce(self.__blocks(level.maximums, np.nan), axis=1),
+                                 means, counts)
+
+    def __blocks(self, values: np.ndarray, padding) -> np.ndarray:
+        missing = -len(values) % self.branching
+        if missing:
+            values = np.concatenate((values, np.full(missing, padding, dtype=values.dtype)))
+        return values.reshape(-1, self.branching)
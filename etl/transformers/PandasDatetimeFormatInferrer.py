@@ -0,0 +1,51 @@
+import json
+import os
+
+import pandas as pd
+from pandas.api.types import is_object_dtype, is_string_dtype
+from pandas.tseries.api import guess_datetime_format
+
+
+class PandasDatetimeFormatInferrer:
+    CACHE_FILE = "datetime_formats.json"
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir
+        self.__formats = None
+
+    def infer(self, values: pd.Series, source: str = None) -> str | None:
+        if not (is_object_dtype(values) or is_string_dtype(values)):
+            return None
+        key, stamp = self.__source_key(source, values.name)
+        cached = self.__cached_formats().get(key)
+        if cached is not None and cached["stamp"] == stamp:
+            return cached["format"]
+        first_valid = values.first_valid_index()
+        date_format = None if first_valid is None else guess_datetime_format(str(values[first_valid]))
+        if key is not None and date_format is not None:
+            self.__formats[key] = {"stamp": stamp, "format": date_format}
+            self.__store_formats()
+        return date_format
+
+    def __source_key(self, source: str | None, column: str) -> tuple[str | None, list[int] | None]:
+        if source is None or not os.path.isfile(source):
+            return None, None
+        stat = os.stat(source)
+        return repr([os.path.abspath(source), column]), [stat.st_mtime_ns, stat.st_size]
+
+    def __cached_formats(self) -> dict[str, dict]:
+        if self.__formats is None:
+            self.__formats = {}
+            if self.cache_dir is not None and os.path.isfile(os.path.join(self.cache_dir, self.CACHE_FILE)):
+                with open(os.path.join(self.cache_dir, self.CACHE_FILE)) as cache:
+                    self.__formats = json.load(cache)
+        return self.__formats
+
+    def __store_formats(self) -> None:
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_file = os.path.join(self.cache_dir, self.CACHE_FILE)
+        with open(cache_file + ".tmp", "w") as cache:
+            json.dump(self.__formats, cache)
+        os.replace(cache_file + ".tmp", cache_file)
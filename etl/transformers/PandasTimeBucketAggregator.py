@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+
+class PandasTimeBucketAggregator:
+    DIURNAL = "diurnal"
+    DIURNAL_BASE_RESOLUTION = "min"
+    STATISTICS = ["mean", "min", "max", "std", "count"]
+
+    def aggregate(self, df: pd.DataFrame, date_column: str, resolutions: list[str],
+                  statistics: list[str] = None) -> dict[str, dict[str, pd.DataFrame]]:
+        statistics = self.STATISTICS if statistics is None else statistics
+        regular_resolutions = sorted((resolution for resolution in resolutions if resolution != self.DIURNAL),
+                                     key=self.__nanos)
+        base_resolution = regular_resolutions[0] if regular_resolutions else self.DIURNAL_BASE_RESOLUTION
+        partials = {base_resolution: self.__partials(
+            df.drop(columns=date_column).groupby(df[date_column].dt.floor(base_resolution)), statistics)}
+        for finer, coarser in zip(regular_resolutions, regular_resolutions[1:]):
+            self.__check_nested(finer, coarser)
+            partials[coarser] = self.__combine(partials[finer], partials[finer]["count"].index.floor(coarser))
+        if self.DIURNAL in resolutions:
+            partials[self.DIURNAL] = self.__combine_diurnal(
+                partials[base_resolution] if self.__divides_day(base_resolution)
+                else self.__partials(df.drop(columns=date_column).groupby(
+                    df[date_column].dt.floor(self.DIURNAL_BASE_RESOLUTION)), statistics))
+        return {resolution: self.__statistics(partials[resolution], statistics, date_column)
+                for resolution in resolutions}
+
+    def __partials(self, buckets, statistics: list[str]) -> dict[str, pd.DataFrame]:
+        partials = {"count": buckets.count(), "mean": buckets.mean()}
+        if "std" in statistics:
+            partials["m2"] = (buckets.var() * (partials["count"] - 1)).where(partials["count"] > 1, 0.0)
+        if "min" in statistics:
+            partials["min"] = buckets.min()
+        if "max" in statistics:
+            partials["max"] = buckets.max()
+        return partials
+
+    def __combine(self, partials: dict[str, pd.DataFrame], keys: pd.Index) -> dict[str, pd.DataFrame]:
+        count = partials["count"].groupby(keys).sum()
+        mean = (partials["mean"] * partials["count"]).groupby(keys).sum() / count
+        combined = {"count": count, "mean": mean}
+        if "m2" in partials:
+            deviation = partials["mean"] - mean.reindex(keys).to_numpy()
+            combined["m2"] = (partials["m2"] + partials["count"] * deviation ** 2).groupby(keys).sum()
+        if "min" in partials:
+            combined["min"] = partials["min"].groupby(keys).min()
+        if "max" in partials:
+            combined["max"] = partials["max"].groupby(keys).max()
+        return combined
+
+    def __combine_diurnal(self, partials: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+        buckets = partials["count"].index
+        combined = self.__combine(partials, buckets - buckets.normalize())
+        labels = (pd.Timestamp(0) + combined["count"].index).strftime('%H:%M')
+        return {statistic: frame.set_axis(labels) for statistic, frame in combined.items()}
+
+    def __statistics(self, partials: dict[str, pd.DataFrame], statistics: list[str],
+                     date_column: str) -> dict[str, pd.DataFrame]:
+        computed = {}
+        for statistic in statistics:
+            if statistic == "std":
+                computed[statistic] = np.sqrt((partials["m2"] / (partials["count"] - 1)).clip(lower=0)
+                                              .where(partials["count"] > 1))
+            else:
+                computed[statistic] = partials[statistic]
+            computed[statistic] = computed[statistic].rename_axis(date_column)
+        return computed
+
+    def __check_nested(self, finer: str, coarser: str) -> None:
+        if self.__nanos(coarser) % self.__nanos(finer):
+            raise ValueError(f"Resolution {coarser} is not a multiple of {finer}")
+
+    def __divides_day(self, resolution: str) -> bool:
+        return self.__nanos(resolution) < self.__nanos("D") and self.__nanos("D") % self.__nanos(resolution) == 0
+
+    def __nanos(self, resolution: str) -> int:
+        return to_offset(resolution).nanos
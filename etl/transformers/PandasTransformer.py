@@ -1,13 +1,29 @@
+import calendar
 from datetime import timedelta, datetime
 import operator
-from typing import Callable, Iterable, Any
+import os
+import tempfile
+from typing import Callable, Iterable, Any, Iterator
 
+import numpy as np
 import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
 
+from etl.transformers.PandasDatetimeFormatInferrer import PandasDatetimeFormatInferrer
+from etl.transformers.PandasTimeBucketAggregator import PandasTimeBucketAggregator
 from model.Spikes import Spikes
 
 
 class PandasTransformer:
+    MONTH_NUMBERS = {month.lower(): number for number, month in enumerate(calendar.month_abbr) if month}
+
+    def __init__(self, cache_dir: str = None):
+        self.time_bucket_aggregator = PandasTimeBucketAggregator()
+        self.datetime_format_inferrer = PandasDatetimeFormatInferrer(cache_dir)
 
     def rename_columns(self, df: pd.DataFrame, old_and_new_names: dict[str, str]) -> pd.DataFrame:
         return df.rename(columns=old_and_new_names, inplace=False)
@@ -15,6 +31,45 @@ class PandasTransformer:
     def sort_values(self, df: pd.DataFrame, column_label: str) -> pd.DataFrame:
         return df.sort_values(column_label).reset_index(drop=True)
 
+    def sort_chunks(self, chunks: Iterable[pd.DataFrame], column_label: str, block_size: int = 100_000) \
+            -> Iterator[pd.DataFrame]:
+        with tempfile.TemporaryDirectory() as spill_dir:
+            runs = [self.__spill_sorted_run(chunk.sort_values(column_label), os.path.join(spill_dir, str(run)),
+                                            block_size)
+                    for run, chunk in enumerate(chunks)]
+            yield from self.__merge_sorted_runs(runs, column_label)
+
+    def __spill_sorted_run(self, sorted_chunk: pd.DataFrame, run_path: str, block_size: int) -> Iterator[str]:
+        blocks = []
+        for start in range(0, len(sorted_chunk), block_size):
+            blocks.append(f"{run_path}-{start}.pkl")
+            sorted_chunk.iloc[start:start + block_size].to_pickle(blocks[-1])
+        return iter(blocks)
+
+    def __merge_sorted_runs(self, runs: list[Iterator[str]], column_label: str) -> Iterator[pd.DataFrame]:
+        heads = [self.__read_next_block(run) for run in runs]
+        while any(head is not None for head in heads):
+            cutoff = min(head[column_label].iloc[-1] for head in heads if head is not None)
+            ready = [None if head is None else head[column_label] <= cutoff for head in heads]
+            yield (pd.concat([head[mask] for head, mask in zip(heads, ready) if head is not None])
+                   .sort_values(column_label, kind='stable').reset_index(drop=True))
+            heads = [self.__read_next_block(run) if head is None or mask.all() else head[~mask]
+                     for run, head, mask in zip(runs, heads, ready)]
+
+    def __read_next_block(self, run: Iterator[str]) -> pd.DataFrame | None:
+        block = next(run, None)
+        if block is None:
+            return None
+        df = pd.read_pickle(block)
+        os.remove(block)
+        return df
+
+    def share(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.copy(deep=pd.get_option("mode.copy_on_write") is not True)
+
+    def concat_chunks(self, chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+        return pd.concat(chunks, ignore_index=True)
+
     def correct_dates(self, df: pd.DataFrame, greater_than: any, less_than: any, col_name: str,
                       time_to_subtract: timedelta) -> pd.DataFrame:
         idx = self.__limit_column_idx(df, col_name, greater_than, less_than)
@@ -28,6 +83,15 @@ class PandasTransformer:
     def filter_column(self, df: pd.DataFrame, col_name: str, filter_operator: Callable, value: any) -> pd.DataFrame:
         return df[self.__filter_idx_column(df, col_name, filter_operator, value)].reset_index(drop=True)
 
+    def filter_columns(self, df: pd.DataFrame, column_filters: list[tuple[str, Callable, Any]]) -> pd.DataFrame:
+        return df[self.__filters_mask(df, column_filters)].reset_index(drop=True)
+
+    def __filters_mask(self, df: pd.DataFrame, column_filters: list[tuple[str, Callable, Any]]) -> np.ndarray:
+        mask = np.ones(len(df), dtype=bool)
+        for col_name, filter_operator, value in column_filters:
+            mask &= self.__filter_idx_column(df, col_name, filter_operator, value).to_numpy(dtype=bool)
+        return mask
+
     def filter_column_and_interpolate(self, df: pd.DataFrame, col_name: str, filter_operator: Callable,
                                       value: any) -> pd.DataFrame:
         df.loc[~self.__filter_idx_column(df, col_name, filter_operator, value), col_name] = None
@@ -36,7 +100,12 @@ class PandasTransformer:
     def concat_data(self, df_1: pd.DataFrame, df_2: pd.DataFrame) -> pd.DataFrame:
         return pd.concat([df_1, df_2])
 
-    def add_column(self, df: pd.DataFrame, label: str, values: Iterable[Any]) -> pd.DataFrame:
+    def add_column(self, df: pd.DataFrame, label: str, values: Iterable[Any] | Callable[..., Iterable[Any]],
+                   source_columns: list[str] = None) -> pd.DataFrame:
+        if callable(values):
+            if source_columns is None:
+                raise ValueError(f"add_column needs source_columns to compute {label} from a callable")
+            values = values(*(df[column].to_numpy() for column in source_columns))
         df[label] = values
         return df
 
@@ -44,17 +113,36 @@ class PandasTransformer:
         return filter_operator(df[col], value)
 
     def compute_average_per_timestamp(self, df: pd.DataFrame, date_column: str) -> pd.DataFrame:
-        df[date_column] = df[date_column].dt.strftime('%H:%M')
-        return df.groupby(date_column).mean().reset_index()
+        diurnal = self.time_bucket_aggregator.DIURNAL
+        return self.select_time_bucket(self.aggregate_time_buckets(df, date_column, [diurnal], ["mean"]), diurnal,
+                                       "mean")
 
     def compute_average_per_day_hour(self, df: pd.DataFrame, date_column: str) -> pd.DataFrame:
         return self.__mean_by_hour(date_column, df)
 
+    def compute_average_per_day_hour_chunks(self, chunks: Iterable[pd.DataFrame], date_column: str) -> pd.DataFrame:
+        sums, counts = [], []
+        for chunk in chunks:
+            hourly = chunk.drop(columns=date_column).groupby(chunk[date_column].dt.floor('h'))
+            sums.append(hourly.sum())
+            counts.append(hourly.count())
+        df = pd.concat(sums).groupby(level=0).sum() / pd.concat(counts).groupby(level=0).sum()
+        return self.__fill_missing_hours(df, date_column)
+
     def __mean_by_hour(self, date_column: str, df: pd.DataFrame) -> pd.DataFrame:
-        df[date_column] = df[date_column].dt.strftime('%d/%m/%Y %H')
-        df = df.groupby(date_column).mean()
-        df.index = pd.to_datetime(df.index, format='%d/%m/%Y %H')
-        df = df.reindex(pd.date_range(min(df.index), end=max(df.index), freq='1h'))
+        hourly = self.time_bucket_aggregator.aggregate(df, date_column, ["h"], ["mean"])
+        return self.__fill_missing_hours(hourly["h"]["mean"], date_column)
+
+    def aggregate_time_buckets(self, df: pd.DataFrame, date_column: str, resolutions: list[str],
+                               statistics: list[str] = None) -> dict[str, dict[str, pd.DataFrame]]:
+        return self.time_bucket_aggregator.aggregate(df, date_column, resolutions, statistics)
+
+    def select_time_bucket(self, time_buckets: dict[str, dict[str, pd.DataFrame]], resolution: str,
+                           statistic: str) -> pd.DataFrame:
+        return time_buckets[resolution][statistic].reset_index()
+
+    def __fill_missing_hours(self, df: pd.DataFrame, date_column: str) -> pd.DataFrame:
+        df = df.reindex(pd.date_range(df.index.min(), end=df.index.max(), freq='1h'))
         df = self.__calculate_missing_hours(df, date_column)
         return df
 
@@ -62,37 +150,168 @@ class PandasTransformer:
             -> pd.DataFrame:
         return df[df[col_with_values].isin(values_to_keep[col_with_values])]
 
+    def align_asof(self, df: pd.DataFrame, other_df: pd.DataFrame, on: str, tolerance: timedelta = None,
+                   direction: str = "nearest", aggregations: dict[str, str | Callable] = None) \
+            -> tuple[pd.DataFrame, pd.DataFrame]:
+        df, other_df = self.__sorted_keys(df, on), self.__sorted_keys(other_df, on)
+        keys = df[on].to_numpy()
+        new_key = np.empty(len(keys), dtype=bool)
+        new_key[:1] = True
+        new_key[1:] = keys[1:] != keys[:-1]
+        key_codes = np.cumsum(new_key) - 1
+        matches = pd.merge_asof(other_df[[on]], pd.DataFrame({on: keys[new_key], "code": np.arange(new_key.sum())}),
+                                on=on, direction=direction,
+                                tolerance=None if tolerance is None else pd.Timedelta(tolerance))["code"].to_numpy()
+        matched = ~np.isnan(matches)
+        aggregated = (other_df.drop(columns=on)[matched]
+                      .groupby(matches[matched].astype(np.int64), sort=False)
+                      .agg(self.__column_aggregations(other_df.drop(columns=on), aggregations)))
+        has_match = np.zeros(new_key.sum(), dtype=bool)
+        has_match[aggregated.index] = True
+        aligned = df[has_match[key_codes]].reset_index(drop=True)
+        other_aligned = aggregated.loc[key_codes[has_match[key_codes]]].reset_index(drop=True)
+        other_aligned[on] = aligned[on].to_numpy()
+        return aligned, other_aligned[other_df.columns]
+
+    def __sorted_keys(self, df: pd.DataFrame, on: str) -> pd.DataFrame:
+        df = df[df[on].notna()]
+        return df if df[on].is_monotonic_increasing else df.sort_values(on, kind="stable")
+
+    def __column_aggregations(self, df: pd.DataFrame, aggregations: dict[str, str | Callable] | None) \
+            -> dict[str, str | Callable]:
+        aggregations = aggregations or {}
+        return {column: aggregations.get(column, "mean" if pd.api.types.is_numeric_dtype(df[column]) else "first")
+                for column in df.columns}
+
     def __calculate_missing_hours(self, df: pd.DataFrame, date_column: str) -> pd.DataFrame:
-        df["Hora del día"] = df.index.strftime('%H')
+        day_hours = df.index.hour
+        df = df.groupby(day_hours).ffill().groupby(day_hours).bfill()
         df.index.name = date_column
-        df.reset_index(inplace=True)
-        for day_hour in df["Hora del día"].unique():
-            if df.loc[df["Hora del día"] == day_hour, :].isnull().values.any():
-                df.loc[df["Hora del día"] == day_hour, :] = (df.loc[df["Hora del día"] == day_hour, :]
-                                                             .sort_values([date_column], ascending=True).
-                                                             ffill(inplace=False))
-                df.loc[df["Hora del día"] == day_hour, :] = (df.loc[df["Hora del día"] == day_hour, :]
-                                                             .sort_values([date_column], ascending=False)
-                                                             .ffill(inplace=False))
-        return df.drop(["Hora del día"], axis=1)
+        return df.reset_index()
 
     def merge_columns(self, df: pd.DataFrame, columns: list[str], new_column: str, sep_value: str) -> pd.DataFrame:
-        df[new_column] = df[columns].astype(str).agg(sep_value.join, axis=1)
+        texts = [self.__column_texts(df[column]) for column in columns]
+        if pc is None:
+            df[new_column] = pd.Series(texts[0], index=df.index).str.cat(texts[1:], sep=sep_value)
+        else:
+            df[new_column] = pc.binary_join_element_wise(*(pa.array(text, type=pa.string()) for text in texts),
+                                                         sep_value).to_numpy(zero_copy_only=False)
         return df.drop(columns, axis=1)
 
-    def parse_datetime_column(self, df: pd.DataFrame, time_column: str, date_format: str = None) -> pd.DataFrame:
+    def __column_texts(self, column: pd.Series) -> np.ndarray:
+        if pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+            return column.astype(str).to_numpy()
+        return self.__decode_distinct(column, lambda values: values.astype(str).to_numpy())
+
+    def parse_datetime_column(self, df: pd.DataFrame, time_column: str, date_format: str = None,
+                              source: str = None) -> pd.DataFrame:
+        if date_format is None:
+            date_format = self.datetime_format_inferrer.infer(df[time_column], source)
         df[time_column] = pd.to_datetime(df[time_column], format=date_format)
         return df
 
-    def interpolate_outliers(self, df: pd.DataFrame, outliers: Spikes, timestamps_label: str) -> pd.DataFrame:
-        spikes_df = self.__spikes_to_df(outliers)
-        for variable in spikes_df["Variable"].unique():
-            df.loc[df[timestamps_label].isin(
-                spikes_df[spikes_df["Variable"] == variable][timestamps_label]), variable] = None
-        return df.interpolate(method='linear', axis=0)
-
-    def __spikes_to_df(self, outliers: Spikes) -> pd.DataFrame:
-        return pd.DataFrame({"Variable": [value.value for value in outliers.variable],
-                             "TimeStamp": outliers.timestamp,
-                             "Threshold": [outliers.threshold] * len(outliers.timestamp)},
-                            index=outliers.indexes)
+    def assemble_datetime_column(self, df: pd.DataFrame, columns: list[str], new_column: str) -> pd.DataFrame:
+        day, month, year, time = (df[column] for column in columns)
+        months = (year.to_numpy(dtype=np.int64, na_value=1970) - 1970) * 12 + self.__month_numbers(month) - 1
+        days = months.astype("datetime64[M]").astype("datetime64[D]") + (day.to_numpy(dtype=np.int64, na_value=1) - 1)
+        timestamps = days.astype("datetime64[ns]") + self.__time_of_day(time)
+        timestamps[df[columns].isna().any(axis=1).to_numpy()] = np.datetime64("NaT")
+        df[new_column] = timestamps
+        return df.drop(columns, axis=1)
+
+    def __month_numbers(self, month: pd.Series) -> np.ndarray:
+        if pd.api.types.is_numeric_dtype(month):
+            return month.to_numpy(dtype=np.int64, na_value=1)
+        return self.__decode_distinct(month, lambda months: months.str[:3].str.lower().map(self.MONTH_NUMBERS)
+                                      .to_numpy(dtype=np.int64, na_value=1))
+
+    def __time_of_day(self, time: pd.Series) -> np.ndarray:
+        if pd.api.types.is_timedelta64_dtype(time):
+            return time.to_numpy(dtype="timedelta64[ns]")
+        return self.__decode_distinct(time, lambda times: pd.to_timedelta(times.astype(str))
+                                      .to_numpy(dtype="timedelta64[ns]"))
+
+    def __decode_distinct(self, values: pd.Series, decode: Callable[[pd.Index], np.ndarray]) -> np.ndarray:
+        codes, distinct = pd.factorize(values, use_na_sentinel=False)
+        return decode(pd.Index(distinct))[codes]
+
+    def interpolate_outliers(self, df: pd.DataFrame, outliers: Spikes, timestamps_label: str,
+                             method: str = "linear") -> pd.DataFrame:
+        df, columns = self.__remove_outliers(df, outliers, timestamps_label)
+        return self.__interpolate(df, columns, timestamps_label, method)
+
+    def interpolate_outliers_and_filter(self, df: pd.DataFrame, outliers: Spikes, timestamps_label: str,
+                                        column_filters: list[tuple[str, Callable, Any]],
+                                        method: str = "linear") -> pd.DataFrame:
+        df, columns = self.__remove_outliers(df, outliers, timestamps_label)
+        filtered_columns = [col_name for col_name, _, _ in column_filters if col_name in columns]
+        if df[filtered_columns].isnull().values.any() or not self.__is_row_ordered(df, timestamps_label, method):
+            return self.filter_columns(self.__interpolate(df, columns, timestamps_label, method), column_filters)
+        keep = self.__filters_mask(df, column_filters)
+        needed = keep | self.__interpolation_support(df[columns].isnull().to_numpy(), keep)
+        return (self.__interpolate(df[needed].reset_index(drop=True), columns, timestamps_label, method)[keep[needed]]
+                .reset_index(drop=True))
+
+    def __interpolation_support(self, missing: np.ndarray, keep: np.ndarray) -> np.ndarray:
+        support = np.zeros(len(keep), dtype=bool)
+        for column_missing in missing.T[missing.any(axis=0)]:
+            gap = np.cumsum(~column_missing)
+            needed_gaps = np.unique(gap[column_missing & keep])
+            support |= np.isin(gap, needed_gaps) | (np.isin(gap - 1, needed_gaps) & ~column_missing)
+        return support
+
+    def __is_row_ordered(self, df: pd.DataFrame, timestamps_label: str, method: str) -> bool:
+        if method != "time":
+            return True
+        return df[timestamps_label].is_monotonic_increasing or df[timestamps_label].is_monotonic_decreasing
+
+    def __remove_outliers(self, df: pd.DataFrame, outliers: Spikes, timestamps_label: str) \
+            -> tuple[pd.DataFrame, list[str]]:
+        variable_codes, variables = pd.factorize(np.asarray(outliers.variable, dtype=object))
+        columns = [variable.value for variable in variables]
+        if not columns:
+            return df, columns
+        rows, spikes = self.__spike_rows(df[timestamps_label], outliers.timestamp)
+        values = df[columns].to_numpy(dtype=np.float64, copy=True)
+        values[rows, variable_codes[spikes]] = np.nan
+        self.__write_float_columns(df, columns, values)
+        return df, columns
+
+    def __spike_rows(self, timestamps: pd.Series, spike_timestamps: list) -> tuple[np.ndarray, np.ndarray]:
+        order = (np.arange(len(timestamps)) if timestamps.is_monotonic_increasing
+                 else np.argsort(timestamps.to_numpy(), kind="stable"))
+        sorted_timestamps = timestamps.to_numpy()[order]
+        spike_timestamps = pd.Series(spike_timestamps).astype(timestamps.dtype).to_numpy()
+        starts = np.searchsorted(sorted_timestamps, spike_timestamps, side="left")
+        counts = np.searchsorted(sorted_timestamps, spike_timestamps, side="right") - starts
+        spikes = np.repeat(np.arange(len(spike_timestamps)), counts)
+        offsets = np.arange(len(spikes)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return order[starts[spikes] + offsets], spikes
+
+    def __interpolate(self, df: pd.DataFrame, columns: list[str], timestamps_label: str, method: str) \
+            -> pd.DataFrame:
+        if not columns:
+            return df
+        if method not in ("linear", "time"):
+            raise ValueError(f"Unknown interpolation method {method}")
+        positions = (df[timestamps_label].to_numpy(dtype="datetime64[ns]").astype(np.int64) if method == "time"
+                     else np.arange(len(df)))
+        values = df[columns].to_numpy(dtype=np.float64, copy=True)
+        for column_values in values.T:
+            self.__interpolate_column(column_values, positions)
+        self.__write_float_columns(df, columns, values)
+        return df
+
+    def __write_float_columns(self, df: pd.DataFrame, columns: list[str], values: np.ndarray) -> None:
+        for column, column_values in zip(columns, values.T):
+            df[column] = column_values.astype(df[column].dtype if pd.api.types.is_float_dtype(df[column])
+                                              else np.float64, copy=False)
+
+    def __interpolate_column(self, values: np.ndarray, positions: np.ndarray) -> None:
+        valid = ~np.isnan(values)
+        if valid.all() or not valid.any():
+            return
+        missing = ~valid
+        missing[:np.argmax(valid)] = False
+        valid_order = np.argsort(positions[valid], kind="stable")
+        values[missing] = np.interp(positions[missing], positions[valid][valid_order], values[valid][valid_order])
@@ -0,0 +1,81 @@
+import hashlib
+import math
+import os
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
+from matplotlib.image import imread
+from matplotlib.patches import Patch
+
+from model.GeoPandasMap import GeoPandasMap
+from model.params.LimitedPlotArea import LimitedPlotArea
+
+
+class MatplotlibBasemapRasterizer:
+    LEGEND_FONT_SIZE = 15
+
+    def __init__(self, cache_dir: str, dpi: float = None, simplify_pixels: float = None):
+        self.cache_dir = cache_dir
+        self.dpi = dpi
+        self.simplify_pixels = simplify_pixels
+        self.__map_digests = {}
+
+    def draw(self, ax: Axes, geo_pandas_map: GeoPandasMap, legend_column: str, legend_colors: list[str],
+             area: LimitedPlotArea) -> None:
+        extent = (area.x_min, area.x_max, area.y_min, area.y_max)
+        dpi = self.dpi if self.dpi is not None else ax.figure.dpi
+        width, height = self.__raster_size(ax, extent, dpi)
+        basemap = self.__rasterize(geo_pandas_map, legend_column, legend_colors, extent, width, height, dpi)
+        ax.imshow(basemap, extent=extent, origin="upper", zorder=0)
+        categories = geo_pandas_map.categories(legend_column)
+        ax.legend(self.__legend_handles(legend_colors, len(categories)), categories,
+                  fontsize=self.LEGEND_FONT_SIZE)
+
+    def __raster_size(self, ax: Axes, extent: tuple[float, float, float, float], dpi: float) -> tuple[int, int]:
+        position = ax.get_position()
+        max_width = position.width * ax.figure.get_figwidth() * dpi
+        max_height = position.height * ax.figure.get_figheight() * dpi
+        aspect = (extent[3] - extent[2]) / (extent[1] - extent[0])
+        width = min(max_width, max_height / aspect)
+        return max(math.ceil(width), 1), max(math.ceil(width * aspect), 1)
+
+    def __rasterize(self, geo_pandas_map: GeoPandasMap, legend_column: str, legend_colors: list[str],
+                    extent: tuple[float, float, float, float], width: int, height: int, dpi: float) -> np.ndarray:
+        cache_file = os.path.join(self.cache_dir, self.__cache_key(geo_pandas_map, legend_column, legend_colors,
+                                                                   extent, width, height, dpi) + ".png")
+        if os.path.isfile(cache_file):
+            return imread(cache_file)
+        if self.simplify_pixels is not None:
+            geo_pandas_map = geo_pandas_map.simplify(self.simplify_pixels * (extent[1] - extent[0]) / width)
+        fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        ax = fig.add_axes((0, 0, 1, 1))
+        geo_pandas_map.plot(ax=ax, column=legend_column, legend=False, cmap=ListedColormap(legend_colors),
+                            legend_kwds=None)
+        ax.set_axis_off()
+        ax.set_aspect("auto")
+        ax.set_xlim(extent[0], extent[1])
+        ax.set_ylim(extent[2], extent[3])
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fig.savefig(cache_file + ".tmp.png", dpi=dpi, transparent=True)
+        os.replace(cache_file + ".tmp.png", cache_file)
+        return imread(cache_file)
+
+    def __cache_key(self, geo_pandas_map: GeoPandasMap, legend_column: str, legend_colors: list[str],
+                    extent: tuple[float, float, float, float], width: int, height: int, dpi: float) -> str:
+        digest = hashlib.sha1(self.__map_digest(geo_pandas_map))
+        digest.update(repr([geo_pandas_map.data[legend_column].tolist(), legend_column, legend_colors, extent,
+                            width, height, dpi, self.simplify_pixels]).encode())
+        return digest.hexdigest()
+
+    def __map_digest(self, geo_pandas_map: GeoPandasMap) -> bytes:
+        data, digest = self.__map_digests.get(id(geo_pandas_map.data), (None, None))
+        if data is not geo_pandas_map.data:
+            digest = hashlib.sha1(b"".join(geo_pandas_map.data.geometry.to_wkb())).digest()
+            self.__map_digests[id(geo_pandas_map.data)] = (geo_pandas_map.data, digest)
+        return digest
+
+    def __legend_handles(self, legend_colors: list[str], n_categories: int) -> list[Patch]:
+        colormap = ListedColormap(legend_colors)
+        return [Patch(facecolor=colormap(category)) for category in range(n_categories)]
@@ -1,9 +1,13 @@
 from typing import Iterable
 
 import numpy as np
-from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 
+from graphers.NumpyPlotDownsampler import NumpyPlotDownsampler
+from model.params.BasicPlotParams import BasicPlotParams
+from model.params.DownsamplingParams import DownsamplingParams
 from model.params.LimitedPlotArea import LimitedPlotArea
+from model.params.SpikesParams import SpikesParams
 from model.params.compound_params.PlotStylishParams import PlotStylishParams
 from model.params.compound_params.PlotStylishSpikesParams import PlotStylishSpikesParams
 
@@ -15,10 +19,12 @@ class MatplotlibFigureCreator:
         self.__ax_label_size = 12
         self.__ax_title = graph_title
         self.__fig_title_size = fig_title_size
-        self.fig, self.ax_list = plt.subplots(n_rows, n_cols, figsize=fig_size)
+        self.fig = Figure(figsize=fig_size)
+        self.ax_list = self.fig.subplots(n_rows, n_cols)
         self.__convert_to_only_1_array()
         self.ax_list_iterable = iter(self.ax_list)
         self.plot_horizontal_lines = []
+        self.__downsampler = NumpyPlotDownsampler()
 
     def __convert_to_only_1_array(self) -> None:
         if isinstance(self.ax_list, np.ndarray):
@@ -109,7 +115,7 @@ class MatplotlibFigureCreator:
         ax.tick_params(axis='y', labelcolor=params.marker_params.color, labelsize=self.__ax_label_size)
         self.__set_ax_lims(ax, params.limit_params)
         ax.set_title(params.basic_plot_params.title, fontsize=self.__ax_title)
-        return ax.plot(params.basic_plot_params.x, params.basic_plot_params.y,
+        return ax.plot(*self.__resolve_xy(params.basic_plot_params, params.downsampling_params),
                        color=params.marker_params.color,
                        label=params.marker_params.label,
                        linestyle=params.marker_params.style,
@@ -120,7 +126,8 @@ class MatplotlibFigureCreator:
         ax.tick_params(axis='y', labelcolor=params.marker_params.color, labelsize=self.__ax_label_size)
         self.__set_ax_lims(ax, params.limit_params)
         ax.set_title(params.basic_plot_params.title, fontsize=self.__ax_title)
-        return ax.scatter(x=params.basic_plot_params.x, y=params.basic_plot_params.y,
+        x, y = self.__resolve_xy(params.basic_plot_params, params.downsampling_params)
+        return ax.scatter(x=x, y=y,
                           color=params.marker_params.color,
                           label=params.marker_params.label,
                           s=params.marker_params.mark_size)
@@ -130,16 +137,49 @@ class MatplotlibFigureCreator:
         ax.tick_params(axis='y', labelcolor=params.marker_params.color, labelsize=self.__ax_label_size)
         self.__set_ax_lims(ax, params.limit_params)
         ax.set_title(params.basic_plot_params.title, fontsize=self.__ax_title)
-        main_plot = ax.scatter(x=params.basic_plot_params.x, y=params.basic_plot_params.y,
+        x, y = self.__resolve_xy(params.basic_plot_params, params.downsampling_params,
+                                 params.spike_params.spikes_indexes)
+        main_plot = ax.scatter(x=x, y=y,
                                color=params.marker_params.color,
                                label=params.marker_params.label,
                                s=params.marker_params.mark_size)
         ax.scatter(x=params.spike_params.spikes_indexes, y=params.spike_params.spikes_values,
                    color=params.spike_params.spike_colour, s=params.marker_params.mark_size * 2.5, edgecolors='black')
-        for index in params.spike_params.spikes_indexes:
-            ax.axvline(index, color=params.spike_params.spike_colour, alpha=0.3)
+        self.__draw_spike_markers(ax, params.spike_params)
         return main_plot
 
+    def __draw_spike_markers(self, ax, params: SpikesParams) -> None:
+        indexes = np.unique(np.asarray(params.spikes_indexes))
+        if params.merge_runs and len(indexes):
+            run_starts, run_ends = self.__spike_runs(indexes)
+            spans = run_ends > run_starts
+            ax.broken_barh(list(zip(run_starts[spans], run_ends[spans] - run_starts[spans])), (0, 1),
+                           transform=ax.get_xaxis_transform(), color=params.spike_colour, alpha=0.3)
+            indexes = run_starts[~spans]
+        ax.vlines(indexes, 0, 1, transform=ax.get_xaxis_transform(), color=params.spike_colour, alpha=0.3)
+
+    def __spike_runs(self, indexes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        breaks = np.flatnonzero(np.diff(indexes) != 1)
+        return indexes[np.r_[0, breaks + 1]], indexes[np.r_[breaks, len(indexes) - 1]]
+
+    def __resolve_xy(self, params: BasicPlotParams, downsampling_params: DownsamplingParams = None,
+                     keep_indexes: Iterable[int] = ()) -> tuple:
+        if downsampling_params is not None:
+            positions = self.__downsampler.downsample(params.y, downsampling_params.n_points or
+                                                      self.__figure_width_pixels(),
+                                                      downsampling_params.method, keep_indexes)
+            return np.asarray(params.x)[positions], np.asarray(params.y)[positions]
+        if params.pyramid is None or len(params.x) != params.pyramid.n_samples:
+            return params.x, params.y
+        level = params.pyramid.select_level(self.__figure_width_pixels())
+        if level is None:
+            return params.x, params.y
+        positions, values = level.envelope()
+        return np.asarray(params.x)[positions], values
+
+    def __figure_width_pixels(self) -> int:
+        return round(self.fig.get_size_inches()[0] * self.fig.dpi)
+
     def __set_x_ticks(self, ax, x_ticks_idx: Iterable, x_ticks_labels: Iterable, rotation: int) -> None:
         ax.set_xticks(x_ticks_idx)
         ax.set_xticklabels(x_ticks_labels, rotation=rotation)
@@ -150,7 +190,7 @@ class MatplotlibFigureCreator:
 
     def __set_timeseries_ticks(self, x) -> None:
         list(map(lambda ax: self.__set_x_ticks(ax, x_ticks_idx=(np.arange(0, len(x), 300)),
-                                               x_ticks_labels=([date.date() for date in x][::300]),
+                                               x_ticks_labels=([date.date() for date in x[::300]]),
                                                rotation=20)
                  , self.__get_axs_list()))
 
@@ -167,8 +207,8 @@ class MatplotlibFigureCreator:
         return self.__get_axs_list()[0]
 
     def __set_daily_ticks(self, timeseries_ticks: Iterable) -> None:
-        plt.xticks(ticks=np.arange(0, len(timeseries_ticks), 20),
-                   labels=[date for date in timeseries_ticks][::20], rotation=20)
+        self.__set_x_ticks(self.fig.gca(), x_ticks_idx=np.arange(0, len(timeseries_ticks), 20),
+                           x_ticks_labels=list(timeseries_ticks[::20]), rotation=20)
 
     def __correlations_ax_list(self) -> None:
         new_ax_list = []
@@ -181,13 +221,13 @@ class MatplotlibFigureCreator:
     def __set_x_ticks_for_correlations(self, x_ticks: list[list[zip]]) -> None:
         for x, ax in zip(x_ticks, self.ax_list[::2]):
             self.__set_x_ticks(ax, x_ticks_idx=(np.arange(0, len(x), round(len(x) / 20))),
-                               x_ticks_labels=([date.date() for date in x][::round(len(x) / 20)]),
+                               x_ticks_labels=([date.date() for date in x[::round(len(x) / 20)]]),
                                rotation=20)
 
     def __set_multiple_timeseries_ticks(self, timeseries_ticks) -> None:
         for x, ax in zip(timeseries_ticks, self.ax_list):
             self.__set_x_ticks(ax, x_ticks_idx=(np.arange(0, len(x), round(len(x) / 20))),
-                               x_ticks_labels=([date.date() for date in x][::round(len(x) / 20)]),
+                               x_ticks_labels=([date.date() for date in x[::round(len(x) / 20)]]),
                                rotation=20)
 
     def __get_scatter_plots_with_spikes(self, plot_scatter_params: list[PlotStylishSpikesParams]):
@@ -1,11 +1,12 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.collections import PathCollection
 from matplotlib.colors import ListedColormap, Normalize
+from matplotlib.figure import Figure
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 import matplotlib.cm as cm
 
+from graphers.MatplotlibBasemapRasterizer import MatplotlibBasemapRasterizer
 from model.GeoPandasMap import GeoPandasMap
 from model.params.LimitedPlotArea import LimitedPlotArea
 from model.params.compound_params.LimitedPlotParams import LimitedPlotParams
@@ -14,9 +15,13 @@ from model.params.compound_params.ScatterColoredParams import ScatterColoredPara
 
 class MatplotlibMapChartCreator:
 
-    def __init__(self, n_rows: int, n_cols: int, fig_size: tuple[int, int]):
+    def __init__(self, n_rows: int, n_cols: int, fig_size: tuple[int, int],
+                 basemap_rasterizer: MatplotlibBasemapRasterizer = None):
         self.norm = None
-        self.fig, self.ax_list = plt.subplots(n_rows, n_cols, figsize=fig_size, squeeze=False)
+        self.basemap_rasterizer = basemap_rasterizer
+        self.__basemap = None
+        self.fig = Figure(figsize=fig_size)
+        self.ax_list = self.fig.subplots(n_rows, n_cols, squeeze=False)
         if isinstance(self.ax_list, np.ndarray):
             self.ax_list = self.ax_list.ravel()
         else:
@@ -26,17 +31,17 @@ class MatplotlibMapChartCreator:
     def create_map(self, coord_params: list[LimitedPlotParams], title: str) -> None:
         list(map(self.__scatter_coordinate_ax, coord_params))
         self.fig.suptitle(title, fontsize=30)
-        plt.tight_layout()
+        self.fig.tight_layout()
 
     def create_map_with_data(self, plot_params: list[ScatterColoredParams], title: str) -> None:
         list(map(self.scatter_coordinate_ax_colored, plot_params))
         self.fig.suptitle(title, fontsize=30)
-        plt.tight_layout()
+        self.fig.tight_layout()
 
     def create_map_with_data_directions(self, plot_params: list[ScatterColoredParams], title: str) -> None:
         list(map(self.scatter_coordinate_ax_colored_with_direction, plot_params))
         self.fig.suptitle(title, fontsize=30)
-        plt.tight_layout()
+        self.fig.tight_layout()
 
     def __scatter_coordinate_ax(self, params: LimitedPlotParams) -> None:
         ax = next(self.ax_list_iterable)
@@ -52,10 +57,11 @@ class MatplotlibMapChartCreator:
         self.__set_plot_frame(ax)
         self.__set_ax_lims(ax, params.limited_area)
         ax.set_title(params.basic_plot_params.title, fontdict={'fontsize': 20})
+        vmin, vmax = params.colored_plot_params.color_range or (None, None)
         plot = ax.scatter(params.basic_plot_params.x,
                           params.basic_plot_params.y,
                           c=params.colored_plot_params.colour_data,
-                          cmap=params.colored_plot_params.cmap, s=10)
+                          cmap=params.colored_plot_params.cmap, s=10, vmin=vmin, vmax=vmax)
         self.__add_colorbar(ax, params, plot)
         self.__set_ax_tick_labels_size(ax)
         self.__set_ax_background(ax, params.colored_plot_params.background_color)
@@ -74,16 +80,21 @@ class MatplotlibMapChartCreator:
                          color=cm.viridis(self.norm(params.colored_plot_params.colour_data[::arrow_step])), scale=20)
         self.__add_colorbar(ax, params, plot)
         self.__set_ax_tick_labels_size(ax)
-        plt.subplots_adjust(left=0.16, bottom=0.1, right=0.8, top=0.9, wspace=0.5, hspace=0.2)
+        self.fig.subplots_adjust(left=0.16, bottom=0.1, right=0.8, top=0.9, wspace=0.5, hspace=0.2)
         self.__set_ax_background(ax, params.colored_plot_params.background_color)
         return plot
 
     def __add_colorbar(self, ax, params: ScatterColoredParams, plot) -> None:
-        if max(params.colored_plot_params.colour_data) > 1000:
+        if self.__max_colour_value(params) > 1000:
             self.__set_colorbar_scientific_notation(ax, params, plot)
         else:
             self.__set_colorbar(ax, params, plot)
 
+    def __max_colour_value(self, params: ScatterColoredParams) -> float:
+        if params.colored_plot_params.color_range is not None:
+            return params.colored_plot_params.color_range[1]
+        return max(params.colored_plot_params.colour_data)
+
     def __define_angles_for_directions(self, params: ScatterColoredParams, step: int):
         x = params.basic_plot_params.x[::step]
         y = params.basic_plot_params.y[::step]
@@ -102,14 +113,14 @@ class MatplotlibMapChartCreator:
     def __set_colorbar_scientific_notation(self, ax: Axes, params: ScatterColoredParams, plot: PathCollection) -> None:
         divider = make_axes_locatable(ax)
         cax = divider.append_axes("right", size="5%", pad=0.05)
-        col_bar = plt.colorbar(plot, ax=ax, cax=cax, label=params.colored_plot_params.colored_label, format=self.__format_number_colbar)
+        col_bar = self.fig.colorbar(plot, ax=ax, cax=cax, label=params.colored_plot_params.colored_label, format=self.__format_number_colbar)
         col_bar.ax.tick_params(labelsize=18)
         col_bar.set_label(label=params.colored_plot_params.colored_label, fontsize=18)
 
     def __set_colorbar(self, ax: Axes, params: ScatterColoredParams, plot: PathCollection) -> None:
         divider = make_axes_locatable(ax)
         cax = divider.append_axes("right", size="5%", pad=0.05)
-        col_bar = plt.colorbar(plot, ax=ax, cax=cax,
+        col_bar = self.fig.colorbar(plot, ax=ax, cax=cax,
                                label=params.colored_plot_params.colored_label
                                )
         col_bar.ax.tick_params(labelsize=18)
@@ -122,11 +133,16 @@ class MatplotlibMapChartCreator:
         return r'${}x10^{{{}}}$'.format(a, b)
 
     def add_map_to_plots(self, geo_pandas_map: GeoPandasMap, legend_column: str, legend_colors: list[str]):
+        if self.basemap_rasterizer is not None:
+            self.__basemap = (geo_pandas_map, legend_column, legend_colors)
+            return
         list(map(lambda ax: geo_pandas_map.plot(ax=ax, column=legend_column, legend=True,
                                                 cmap=ListedColormap(legend_colors),
                                                 legend_kwds={"fontsize": 15}), self.ax_list))
 
     def __set_ax_lims(self, ax, params: LimitedPlotArea) -> None:
+        if self.__basemap is not None:
+            self.basemap_rasterizer.draw(ax, *self.__basemap, params)
         ax.set_xlim(params.x_min, params.x_max)
         ax.set_ylim(params.y_min, params.y_max)
 
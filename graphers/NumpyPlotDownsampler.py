@@ -0,0 +1,46 @@
+from typing import Sequence
+
+import numpy as np
+
+from model.params.DownsamplingParams import DownsamplingParams
+
+
+class NumpyPlotDownsampler:
+    MIN_LTTB_POINTS = 3
+
+    def downsample(self, y: Sequence[float], n_points: int, method: DownsamplingParams.Method,
+                   keep_indexes: Sequence[int] = ()) -> np.ndarray:
+        values = np.asarray(y, dtype=float)
+        positions = np.flatnonzero(~np.isnan(values))
+        if len(positions) > n_points:
+            if method == DownsamplingParams.Method.LTTB:
+                positions = positions[self.__lttb(positions.astype(float), values[positions],
+                                                  max(n_points, self.MIN_LTTB_POINTS))]
+            elif method == DownsamplingParams.Method.MIN_MAX:
+                positions = positions[self.__min_max(values[positions], max(n_points // 2, 1))]
+            else:
+                raise ValueError(f"Unknown downsampling method {method}")
+        keep_indexes = np.asarray(keep_indexes, dtype=np.int64)
+        return np.union1d(positions, keep_indexes[(keep_indexes >= 0) & (keep_indexes < len(values))])
+
+    def __lttb(self, x: np.ndarray, y: np.ndarray, n_points: int) -> np.ndarray:
+        edges = np.linspace(1, len(y) - 1, n_points - 1).astype(np.int64)
+        selected = np.empty(n_points, dtype=np.int64)
+        selected[0], selected[-1] = 0, len(y) - 1
+        for bucket in range(n_points - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            next_start, next_end = (end, edges[bucket + 2]) if bucket + 2 < len(edges) else (len(y) - 1, len(y))
+            previous = selected[bucket]
+            average_x, average_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+            areas = np.abs((x[previous] - average_x) * (y[start:end] - y[previous]) -
+                           (x[previous] - x[start:end]) * (average_y - y[previous]))
+            selected[bucket + 1] = start + np.argmax(areas)
+        return selected
+
+    def __min_max(self, y: np.ndarray, n_buckets: int) -> np.ndarray:
+        bucket_size = -(-len(y) // n_buckets)
+        padding = -len(y) % bucket_size
+        offsets = np.arange(0, len(y) + padding, bucket_size)
+        minimums = np.concatenate((y, np.full(padding, np.inf))).reshape(-1, bucket_size).argmin(axis=1)
+        maximums = np.concatenate((y, np.full(padding, -np.inf))).reshape(-1, bucket_size).argmax(axis=1)
+        return np.union1d(offsets + minimums, offsets + maximums)
@@ -0,0 +1,40 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Self
+
+import matplotlib
+
+
+class ProcessPoolFigureRenderer:
+    BACKEND = "Agg"
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers
+        self.__executor = None
+        self.__jobs = []
+
+    def submit(self, render: Callable, *args) -> Future:
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(self.max_workers, initializer=matplotlib.use,
+                                                  initargs=(self.BACKEND,))
+        job = self.__executor.submit(render, *args)
+        self.__jobs.append(job)
+        return job
+
+    def wait(self) -> list[Any]:
+        jobs, self.__jobs = self.__jobs, []
+        return [job.result() for job in jobs]
+
+    def shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(cancel_futures=True)
+            self.__executor = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.wait()
+        finally:
+            self.shutdown()
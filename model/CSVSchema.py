@@ -0,0 +1,4 @@
+class CSVSchema:
+    def __init__(self, dtypes: dict[str, str], float32_tolerances: dict[str, float] = None):
+        self.dtypes = dtypes
+        self.float32_tolerances = float32_tolerances if float32_tolerances is not None else {}
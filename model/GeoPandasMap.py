@@ -9,5 +9,11 @@ class GeoPandasMap:
     def plot(self, ax, column: str, legend: True, cmap: ListedColormap, legend_kwds: dict):
         self.data.plot(ax=ax, column=column, legend=legend, cmap=cmap, legend_kwds=legend_kwds)
 
+    def simplify(self, tolerance: float) -> "GeoPandasMap":
+        return GeoPandasMap(self.data.set_geometry(self.data.geometry.simplify(tolerance, preserve_topology=True)))
+
+    def categories(self, column: str) -> list:
+        return sorted(self.data[column].unique())
+
     def __eq__(self, other):
         return self.data == other.data
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Union
 
 from model.Table import Table
 from enum import StrEnum
@@ -10,18 +11,32 @@ class Spikes:
         SALINITY_PSU = "Salinity_PSU"
         OXYGEN_UMOL_L = "Oxygen_umol_L"
 
-    def __init__(self, variable: list[SpikeVariable], threshold: float, timestamp: list[datetime], values: list[float], indexes: list[int]):
+    def __init__(self, variable: list[SpikeVariable], threshold: Union[float, list[float]], timestamp: list[datetime],
+                 values: list[float], indexes: list[int]):
         self.variable = variable
         self.threshold = threshold
         self.timestamp = timestamp
         self.values = values
         self.indexes = indexes
 
+    def get_thresholds(self) -> list[float]:
+        if isinstance(self.threshold, list):
+            return self.threshold
+        return [self.threshold] * len(self.indexes)
+
+    def filter_variable(self, variable: SpikeVariable, threshold: float) -> "Spikes":
+        positions = [i for i, spike_variable in enumerate(self.variable) if spike_variable == variable]
+        return Spikes([variable] * len(positions),
+                      threshold,
+                      [self.timestamp[i] for i in positions],
+                      [self.values[i] for i in positions],
+                      [self.indexes[i] for i in positions])
+
     def to_table(self) -> Table:
         return Table(
             [
                 Table.Column("Variable", self.variable),
-                Table.Column("Threshold", [self.threshold] * len(self.indexes)),
+                Table.Column("Threshold", self.get_thresholds()),
                 Table.Column("TimeStamp", self.timestamp),
                 Table.Column("Values", self.values),
             ],
@@ -0,0 +1,37 @@
+import numpy as np
+
+
+class TimePyramid:
+
+    class Level:
+        def __init__(self, bucket_size: int, minimums: np.ndarray, maximums: np.ndarray, means: np.ndarray,
+                     counts: np.ndarray) -> None:
+            self.bucket_size = bucket_size
+            self.minimums = minimums
+            self.maximums = maximums
+            self.means = means
+            self.counts = counts
+
+        def __len__(self) -> int:
+            return len(self.means)
+
+        def starts(self) -> np.ndarray:
+            return np.arange(len(self)) * self.bucket_size
+
+        def envelope(self) -> tuple[np.ndarray, np.ndarray]:
+            return np.repeat(self.starts(), 2), np.column_stack((self.minimums, self.maximums)).ravel()
+
+    def __init__(self, n_samples: int, levels: list[Level]) -> None:
+        self.n_samples = n_samples
+        self.levels = levels
+
+    def select_level(self, width: int) -> Level | None:
+        resolving_levels = [level for level in self.levels if len(level) >= width]
+        return resolving_levels[-1] if resolving_levels else None
+
+    def __eq__(self, other):
+        return self.n_samples == other.n_samples and len(self.levels) == len(other.levels) and all(
+            level_1.bucket_size == level_2.bucket_size and
+            all(np.array_equal(getattr(level_1, array), getattr(level_2, array), equal_nan=True)
+                for array in ("minimums", "maximums", "means", "counts"))
+            for level_1, level_2 in zip(self.levels, other.levels))
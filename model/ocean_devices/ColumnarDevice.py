@@ -0,0 +1,24 @@
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnarDevice:
+    __slots__ = ()
+
+    def is_columnar(self) -> bool:
+        return not isinstance(self.timestamp, list)
+
+    def create_index(self, timestamp: Sequence) -> Sequence[int]:
+        if isinstance(timestamp, list):
+            return list(range(len(timestamp)))
+        return np.arange(len(timestamp))
+
+    def __eq__(self, other):
+        return all(self.__equal_columns(getattr(self, column), getattr(other, column)) for column in self.__slots__)
+
+    def __equal_columns(self, column_1: Sequence, column_2: Sequence) -> bool:
+        if isinstance(column_1, list) and isinstance(column_2, list):
+            return column_1 == column_2
+        return pd.Index(column_1).equals(pd.Index(column_2))
@@ -1,17 +1,16 @@
 from datetime import datetime
+from typing import Sequence
 
+from model.ocean_devices.ColumnarDevice import ColumnarDevice
 
-class Seabed:
-    def __init__(self, timestamp: list[datetime], temperature_c: list[float], conductivity_s_m: list[float],
-                 salinity_psu: list[float]):
-        self.index = list(range(len(timestamp)))
+
+class Seabed(ColumnarDevice):
+    __slots__ = ("index", "timestamp", "temperature_c", "conductivity_s_m", "salinity_psu")
+
+    def __init__(self, timestamp: Sequence[datetime], temperature_c: Sequence[float],
+                 conductivity_s_m: Sequence[float], salinity_psu: Sequence[float]):
+        self.index = self.create_index(timestamp)
         self.timestamp = timestamp
         self.temperature_c = temperature_c
         self.conductivity_s_m = conductivity_s_m
         self.salinity_psu = salinity_psu
-
-    def __eq__(self, other):
-        return self.timestamp == other.timestamp and self.temperature_c == other.temperature_c and \
-            self.conductivity_s_m == other.conductivity_s_m and \
-            self.salinity_psu == other.salinity_psu and \
-            self.index == other.index
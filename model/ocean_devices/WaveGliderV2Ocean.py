@@ -1,12 +1,18 @@
 from datetime import datetime
+from typing import Sequence
 
+from model.ocean_devices.ColumnarDevice import ColumnarDevice
 
-class WaveGliderV2Ocean:
-    def __init__(self, timestamp: list[datetime], temperature_c: list[float], conductivity_s_m: list[float],
-                 salinity_psu: list[float],
-                 pressure_d: list[float], oxygen: list[float], latitude_deg: list[float], longitude_deg: list[float]):
+
+class WaveGliderV2Ocean(ColumnarDevice):
+    __slots__ = ("oxygen", "index", "timestamp", "temperature_c", "conductivity_s_m", "salinity_psu", "pressure_d",
+                 "latitude_deg", "longitude_deg")
+
+    def __init__(self, timestamp: Sequence[datetime], temperature_c: Sequence[float],
+                 conductivity_s_m: Sequence[float], salinity_psu: Sequence[float], pressure_d: Sequence[float],
+                 oxygen: Sequence[float], latitude_deg: Sequence[float], longitude_deg: Sequence[float]):
         self.oxygen = oxygen
-        self.index = list(range(len(timestamp)))
+        self.index = self.create_index(timestamp)
         self.timestamp = timestamp
         self.temperature_c = temperature_c
         self.conductivity_s_m = conductivity_s_m
@@ -14,11 +20,3 @@ class WaveGliderV2Ocean:
         self.pressure_d = pressure_d
         self.latitude_deg = latitude_deg
         self.longitude_deg = longitude_deg
-
-    def __eq__(self, other):
-        return self.timestamp == other.timestamp and self.temperature_c == other.temperature_c and \
-            self.conductivity_s_m == other.conductivity_s_m and \
-            self.salinity_psu == other.salinity_psu and \
-            self.pressure_d == other.pressure_d and self.latitude_deg == other.latitude_deg and \
-            self.longitude_deg == other.longitude_deg and \
-            self.oxygen == other.oxygen and self.index == other.index
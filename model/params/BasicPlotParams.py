@@ -1,5 +1,9 @@
+from model.TimePyramid import TimePyramid
+
+
 class BasicPlotParams:
-    def __init__(self, x: list, y: list, title: str):
+    def __init__(self, x: list, y: list, title: str, pyramid: TimePyramid = None):
         self.x = x
         self.y = y
         self.title = title
+        self.pyramid = pyramid
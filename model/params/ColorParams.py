@@ -2,8 +2,10 @@ from typing import Iterable
 
 
 class ColorParams:
-    def __init__(self, colour_data: Iterable, cmap: str, colored_label: str, background_color: str = "lavender"):
+    def __init__(self, colour_data: Iterable, cmap: str, colored_label: str, background_color: str = "lavender",
+                 color_range: tuple[float, float] = None):
         self.colour_data = colour_data
         self.cmap = cmap
         self.colored_label = colored_label
         self.background_color = background_color
+        self.color_range = color_range
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class DownsamplingParams:
+
+    class Method(StrEnum):
+        LTTB = "lttb"
+        MIN_MAX = "min_max"
+
+    def __init__(self, method: Method, n_points: int = None):
+        self.method = method
+        self.n_points = n_points
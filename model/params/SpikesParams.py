@@ -1,5 +1,7 @@
 class SpikesParams:
-    def __init__(self, spikes_indexes: list[int], spikes_values: list[float], spike_colour: str):
+    def __init__(self, spikes_indexes: list[int], spikes_values: list[float], spike_colour: str,
+                 merge_runs: bool = False):
         self.spikes_indexes = spikes_indexes
         self.spikes_values = spikes_values
         self.spike_colour = spike_colour
+        self.merge_runs = merge_runs
@@ -1,10 +1,13 @@
 from model.params.MarkerParams import MarkerParams
 from model.params.LimitedPlotArea import LimitedPlotArea
 from model.params.BasicPlotParams import BasicPlotParams
+from model.params.DownsamplingParams import DownsamplingParams
 
 
 class PlotStylishParams:
-    def __init__(self, basic_plot_params: BasicPlotParams, marker_params: MarkerParams, limit_params: LimitedPlotArea):
+    def __init__(self, basic_plot_params: BasicPlotParams, marker_params: MarkerParams, limit_params: LimitedPlotArea,
+                 downsampling_params: DownsamplingParams = None):
         self.basic_plot_params = basic_plot_params
         self.marker_params = marker_params
         self.limit_params = limit_params
+        self.downsampling_params = downsampling_params
@@ -1,14 +1,86 @@
+import hashlib
 import os
+from datetime import date, datetime
 
-from matplotlib import pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
 
 
 class MatplotlibFigureStorer:
+    MANIFEST_DIR = "figure_manifest"
+    SCALARS = (str, int, float, bool, date, datetime, np.generic)
 
-    def store(self, filename: str):
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir
+        self.__fingerprints = {}
+
+    def is_up_to_date(self, filename: str, *plot_inputs) -> bool:
+        if self.cache_dir is None:
+            return False
+        fingerprint = self.__fingerprint(plot_inputs)
+        self.__fingerprints[filename] = fingerprint
+        return os.path.isfile(filename) and self.__read_manifest_entry(filename) == fingerprint
+
+    def store(self, filename: str, figure: Figure):
         self.__create_dir_if_not_exists(filename)
-        plt.savefig(filename)
+        figure.savefig(filename)
+        if filename in self.__fingerprints:
+            self.__write_manifest_entry(filename, self.__fingerprints.pop(filename))
         return self
 
     def __create_dir_if_not_exists(self, filename):
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
\ No newline at end of file
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+    def __manifest_entry(self, filename: str) -> str:
+        return os.path.join(self.cache_dir, self.MANIFEST_DIR,
+                            hashlib.sha1(os.path.abspath(filename).encode()).hexdigest())
+
+    def __read_manifest_entry(self, filename: str) -> str | None:
+        entry = self.__manifest_entry(filename)
+        if not os.path.isfile(entry):
+            return None
+        with open(entry) as manifest_entry:
+            return manifest_entry.read()
+
+    def __write_manifest_entry(self, filename: str, fingerprint: str) -> None:
+        entry = self.__manifest_entry(filename)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        with open(entry + ".tmp", "w") as manifest_entry:
+            manifest_entry.write(fingerprint)
+        os.replace(entry + ".tmp", entry)
+
+    def __fingerprint(self, plot_inputs: tuple) -> str:
+        digest = hashlib.sha1()
+        self.__update(digest, plot_inputs)
+        return digest.hexdigest()
+
+    def __update(self, digest, value) -> None:
+        digest.update(type(value).__name__.encode())
+        if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+            digest.update(pd.util.hash_pandas_object(value).to_numpy().tobytes())
+        elif isinstance(value, np.ndarray) and value.dtype != object:
+            digest.update(f"{value.dtype.str}{value.shape}".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            if len(value) and all(isinstance(item, self.SCALARS) for item in value):
+                self.__update(digest, pd.Series(list(value)))
+            else:
+                for item in value:
+                    self.__update(digest, item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                self.__update(digest, key)
+                self.__update(digest, item)
+        elif isinstance(value, self.SCALARS) or value is None:
+            digest.update(repr(value).encode())
+        elif callable(value) and hasattr(value, "__qualname__"):
+            digest.update(value.__qualname__.encode())
+        else:
+            for attribute in self.__attributes(value):
+                digest.update(attribute.encode())
+                self.__update(digest, getattr(value, attribute))
+
+    def __attributes(self, value) -> list[str]:
+        slots = [slot for cls in type(value).__mro__ for slot in getattr(cls, "__slots__", ())]
+        return sorted(set(slots) | set(getattr(value, "__dict__", {})))
@@ -0,0 +1,58 @@
+import hashlib
+import os
+
+import numpy as np
+
+from etl.transformers.NumpyTimePyramidBuilder import NumpyTimePyramidBuilder
+from model.TimePyramid import TimePyramid
+from model.ocean_devices.ColumnarDevice import ColumnarDevice
+
+
+class NumpyTimePyramidStore:
+    NOT_PLOTTED_COLUMNS = ("index", "timestamp")
+    LEVEL_ARRAYS = ("minimums", "maximums", "means", "counts")
+
+    def __init__(self, pyramid_dir: str, builder: NumpyTimePyramidBuilder = None):
+        self.pyramid_dir = pyramid_dir
+        self.builder = builder if builder is not None else NumpyTimePyramidBuilder()
+
+    def get(self, device: ColumnarDevice) -> dict[str, TimePyramid]:
+        columns = {column: np.asarray(getattr(device, column), dtype=float) for column in device.__slots__
+                   if column not in self.NOT_PLOTTED_COLUMNS}
+        filename = os.path.join(self.pyramid_dir, self.__fingerprint(type(device).__name__, columns) + ".npz")
+        if os.path.isfile(filename):
+            return self.load(filename)
+        pyramids = {column: self.builder.build(values) for column, values in columns.items()}
+        self.store(pyramids, filename)
+        return pyramids
+
+    def store(self, pyramids: dict[str, TimePyramid], filename: str) -> None:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        arrays = {}
+        for column, pyramid in pyramids.items():
+            arrays[f"{column}/n_samples"] = np.array(pyramid.n_samples)
+            arrays[f"{column}/bucket_sizes"] = np.array([level.bucket_size for level in pyramid.levels])
+            for position, level in enumerate(pyramid.levels):
+                for array in self.LEVEL_ARRAYS:
+                    arrays[f"{column}/{position}/{array}"] = getattr(level, array)
+        temporary_filename = filename + ".tmp.npz"
+        np.savez(temporary_filename, **arrays)
+        os.replace(temporary_filename, filename)
+
+    def load(self, filename: str) -> dict[str, TimePyramid]:
+        with np.load(filename) as arrays:
+            columns = [key.split("/")[0] for key in arrays.files if key.endswith("/n_samples")]
+            return {column: TimePyramid(
+                int(arrays[f"{column}/n_samples"]),
+                [TimePyramid.Level(int(bucket_size),
+                                   *(arrays[f"{column}/{position}/{array}"] for array in self.LEVEL_ARRAYS))
+                 for position, bucket_size in enumerate(arrays[f"{column}/bucket_sizes"])])
+                for column in columns}
+
+    def __fingerprint(self, device_name: str, columns: dict[str, np.ndarray]) -> str:
+        digest = hashlib.sha1(device_name.encode())
+        digest.update(f"{self.builder.branching}/{self.builder.min_buckets}".encode())
+        for column, values in columns.items():
+            digest.update(column.encode())
+            digest.update(np.ascontiguousarray(values).tobytes())
+        return digest.hexdigest()
@@ -0,0 +1,77 @@
+import operator
+import unittest
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from etl.ETL import ETL
+from etl.extractors.CSVPandasExtractor import CSVPandasExtractor
+from etl.loaders.PandasWaveGliderV2OceanLoader import PandasWaveGliderV2OceanLoader
+from etl.transformers.PandasTransformer import PandasTransformer
+from model.Spikes import Spikes
+
+
+class ETLTest(unittest.TestCase):
+
+    def setUp(self):
+        self.renames = {"Latitude(deg)": "Latitude_deg", "Longitude(deg)": "Longitude_deg", "Pressure": "Pressure_d",
+                        "Temperature": "Temperature_C", "Conductivity": "Conductivity_S_m",
+                        "Salinity (PSU)": "Salinity_PSU"}
+        self.outliers = Spikes([Spikes.SpikeVariable.SALINITY_PSU], 0.001,
+                               [pd.to_datetime("11/24/2021 10:43 AM").to_pydatetime()], [36.8266], [2])
+
+    def test_lazy_etl_matches_eager_etl(self):
+        eager = self.__define_pipeline(self.__define_etl(False)).load()
+        lazy = self.__define_pipeline(self.__define_etl(True)).load()
+        pdt.assert_frame_equal(eager[lazy.columns], lazy)
+
+    def test_lazy_etl_plan(self):
+        etl = self.__define_pipeline(self.__define_etl(True))
+        plan = etl.optimized_plan()
+        self.assertListEqual(["extract", "filter_columns", "rename_columns", "interpolate_outliers_and_filter",
+                              "sort_values"], [step.name for step in plan.steps])
+        self.assertNotIn("Vehicle", plan.steps[0].args[1])
+        self.assertNotIn("Payload Data", plan.steps[0].args[1])
+        self.assertEqual(2, len(plan.steps[1].args[0]))
+        self.assertListEqual([5, 1, 1, 0, 0], plan.estimate_rows(5))
+
+    def test_lazy_computed_column(self):
+        etl = (self.__define_etl(True)
+               .extract("./resources/test.csv")
+               .rename_columns(self.renames)
+               .add_column("Vehicle_name_length", lambda vehicles: [len(vehicle) for vehicle in vehicles], ["Vehicle"]))
+        self.assertIn("Vehicle", etl.optimized_plan().steps[0].args[1])
+        self.assertListEqual([16] * 5, etl.load()["Vehicle_name_length"].tolist())
+
+    def test_fork(self):
+        with pd.option_context("mode.copy_on_write", True):
+            trunk = self.__define_etl(False).extract("./resources/test.csv").rename_columns(self.renames)
+            branch = trunk.fork()
+            self.assertTrue(np.shares_memory(trunk.data["Salinity_PSU"].to_numpy(),
+                                             branch.data["Salinity_PSU"].to_numpy()))
+            original = trunk.data.copy(deep=True)
+            branch.interpolate_outliers(self.outliers, "TimeStamp").filter_column("Pressure_d", operator.gt, 0.2).load()
+            pdt.assert_frame_equal(original, trunk.load())
+            self.assertTrue(np.isnan(branch.data["Salinity_PSU"]).sum() == 0)
+        self.assertFalse(np.shares_memory(trunk.data["Salinity_PSU"].to_numpy(),
+                                          trunk.fork().data["Salinity_PSU"].to_numpy()))
+
+    def __define_etl(self, lazy: bool) -> ETL:
+        return ETL(CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p"), PandasTransformer(),
+                   self.__DataFrameLoader(), lazy)
+
+    def __define_pipeline(self, etl: ETL) -> ETL:
+        return (etl.extract("./resources/test.csv")
+                .rename_columns(self.renames)
+                .filter_column("TimeStamp", operator.lt, "2021-11-24 10:53:00")
+                .filter_column("Latitude_deg", operator.gt, 28.6)
+                .interpolate_outliers(self.outliers, "TimeStamp")
+                .filter_column("Pressure_d", operator.gt, 0.2)
+                .sort_values("TimeStamp"))
+
+    class __DataFrameLoader:
+        REQUIRED_COLUMNS = PandasWaveGliderV2OceanLoader.REQUIRED_COLUMNS
+
+        def load(self, df: pd.DataFrame) -> pd.DataFrame:
+            return df
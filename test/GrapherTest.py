@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+import geopandas as gpd
+import numpy as np
+from shapely.geometry import Point
+
+from graphers.MatplotlibBasemapRasterizer import MatplotlibBasemapRasterizer
+from graphers.MatplotlibMapChartCreator import MatplotlibMapChartCreator
+from graphers.NumpyPlotDownsampler import NumpyPlotDownsampler
+from model.GeoPandasMap import GeoPandasMap
+from model.params.BasicPlotParams import BasicPlotParams
+from model.params.DownsamplingParams import DownsamplingParams
+from model.params.LimitedPlotArea import LimitedPlotArea
+from model.params.compound_params.LimitedPlotParams import LimitedPlotParams
+
+
+class GrapherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.downsampler = NumpyPlotDownsampler()
+        rng = np.random.default_rng(0)
+        self.values = np.cumsum(rng.normal(0, 0.01, 10000))
+        self.values[[10, 11, 12]] = np.nan
+        self.spikes_indexes = [1234, 5678, 9000]
+
+    def test_lttb_downsampling(self):
+        positions = self.downsampler.downsample(self.values, 500, DownsamplingParams.Method.LTTB,
+                                                self.spikes_indexes)
+        self.assertLessEqual(len(positions), 500 + len(self.spikes_indexes))
+        self.assertEqual(0, positions[0])
+        self.assertEqual(len(self.values) - 1, positions[-1])
+        self.assertTrue(set(self.spikes_indexes).issubset(positions))
+        self.assertFalse(np.isnan(self.values[positions]).any())
+        self.assertTrue((np.diff(positions) > 0).all())
+
+    def test_min_max_downsampling(self):
+        positions = self.downsampler.downsample(self.values, 500, DownsamplingParams.Method.MIN_MAX,
+                                                self.spikes_indexes)
+        self.assertLessEqual(len(positions), 500 + len(self.spikes_indexes))
+        self.assertIn(np.nanargmin(self.values), positions)
+        self.assertIn(np.nanargmax(self.values), positions)
+        self.assertTrue(set(self.spikes_indexes).issubset(positions))
+
+    def test_no_downsampling_below_n_points(self):
+        positions = self.downsampler.downsample(self.values[:100], 500, DownsamplingParams.Method.LTTB)
+        np.testing.assert_array_equal(np.setdiff1d(np.arange(100), [10, 11, 12]), positions)
+
+    def test_basemap_rasterized_once_per_extent(self):
+        geo_map = GeoPandasMap(gpd.GeoDataFrame({"label": ["La Palma", "Coladas de lava"]},
+                                                geometry=[Point(-17.9, 28.6).buffer(0.1),
+                                                          Point(-17.95, 28.6).buffer(0.02)], crs="EPSG:4326"))
+        coord_params = [LimitedPlotParams(BasicPlotParams([-17.9], [28.6], "Datos"),
+                                          LimitedPlotArea(-18.1, -17.7, 28.4, 28.8))] * 2
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rasterizer = MatplotlibBasemapRasterizer(tmp_dir, simplify_pixels=0.5)
+            visualizer = MatplotlibMapChartCreator(1, 2, (15, 10), rasterizer)
+            visualizer.add_map_to_plots(geo_map, "label", ["orangered", "darkgreen"])
+            visualizer.create_map(coord_params, "Mapa")
+            self.assertEqual(1, len(os.listdir(tmp_dir)))
+            for ax in visualizer.ax_list:
+                self.assertEqual(1, len(ax.images))
+                self.assertEqual((-18.1, -17.7, 28.4, 28.8), tuple(ax.images[0].get_extent()))
+                self.assertEqual(1, len(ax.collections))
+                self.assertListEqual(["Coladas de lava", "La Palma"],
+                                     [text.get_text() for text in ax.get_legend().get_texts()])
+            image = ax.images[0].get_array()
+            self.assertGreater(image[image.shape[0] // 2, image.shape[1] // 2, 3], 0)
+            self.assertEqual(0, image[0, 0, 3])
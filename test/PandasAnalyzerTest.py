@@ -1,23 +1,33 @@
 import unittest
 from datetime import datetime, timedelta
 
+import geopandas as gpd
 import numpy as np
 import pandas as pd
 from numpy import cov
 from scipy.stats import spearmanr, pearsonr
+from shapely.geometry import Point, Polygon, box
 
 from analyzers.NumpyPrimitiveDataAnalyzer import NumpyPrimitiveDataAnalyzer
+from analyzers.NumpySpikeTestAnalyzer import NumpySpikeTestAnalyzer
+from analyzers.SpikeThresholdEstimator import SpikeThresholdEstimator
+from analyzers.StreamingSpikeAnalyzer import StreamingSpikeAnalyzer
 from analyzers.PandasWaveGliderV2OceanAnalyzer import PandasWaveGliderV2OceanAnalyzer
 from analyzers.PandasSeabedAnalyzer import PandasSeabedAnalyzer
 from analyzers.PandasWaveGliderV2WeatherAnalyzer import PandasWaveGliderV2WeatherAnalyzer
 import numpy.testing as npt
 
 from analyzers.SciPyCorrelationAnalyzer import SciPyCorrelationAnalyzer
+from analyzers.SciPySpatialIndex import SciPySpatialIndex
+from analyzers.ShapelyGeoFeatureAnalyzer import ShapelyGeoFeatureAnalyzer
+from model.GeoPandasMap import GeoPandasMap
+from model.Spikes import Spikes
 from model.ocean_devices.Seabed import Seabed
 from model.Table import Table
 from model.ocean_devices.WaveGliderV2Ocean import WaveGliderV2Ocean
 from model.ocean_devices.WaveGliderV2Weather import WaveGliderV2Weather
 from model.params.CorrelationInput import CorrelationInput
+from model.params.LimitedPlotArea import LimitedPlotArea
 
 
 class PandasAnalyzerTest(unittest.TestCase):
@@ -100,6 +110,103 @@ class PandasAnalyzerTest(unittest.TestCase):
         spikes = PandasWaveGliderV2OceanAnalyzer(glider).analyze_outliers_oxygen(glider)
         self.assertEqual([8.2, 7.5], spikes.values)
 
+    def test_glider_analyzer_exact_thresholds(self):
+        _, glider = self.__get_glider_data()
+        analyzer = PandasWaveGliderV2OceanAnalyzer(glider)
+        for values, threshold in [(glider.salinity_psu, analyzer.spike_threshold_sal),
+                                  (glider.oxygen, analyzer.spike_threshold_ox)]:
+            q75, q25 = np.percentile(values, [75, 25])
+            self.assertEqual((q75 - q25) * 1.5, threshold)
+
+    def test_glider_analyzer_batched_outliers(self):
+        _, glider = self.__get_glider_data()
+        glider.salinity_psu = [35.5, 36.2, 35.8, 31.9, 34.49]
+        analyzer = PandasWaveGliderV2OceanAnalyzer(glider)
+        salinity_spikes = analyzer.analyze_outliers_salinity(glider)
+        oxygen_spikes = analyzer.analyze_outliers_oxygen(glider)
+
+        spikes = analyzer.analyze_outliers(glider, [Spikes.SpikeVariable.SALINITY_PSU,
+                                                    Spikes.SpikeVariable.OXYGEN_UMOL_L])
+
+        self.assertEqual(salinity_spikes.to_table().concat_equal_tables(oxygen_spikes.to_table()), spikes.to_table())
+        oxygen_only = spikes.filter_variable(Spikes.SpikeVariable.OXYGEN_UMOL_L, analyzer.spike_threshold_ox)
+        self.assertEqual(oxygen_spikes.indexes, oxygen_only.indexes)
+        self.assertEqual(oxygen_spikes.threshold, oxygen_only.threshold)
+        no_salinity = analyzer.analyze_outliers(glider, [Spikes.SpikeVariable.OXYGEN_UMOL_L]).filter_variable(
+            Spikes.SpikeVariable.SALINITY_PSU, analyzer.spike_threshold_sal)
+        self.assertEqual([], no_salinity.indexes)
+        self.assertEqual(analyzer.spike_threshold_sal, no_salinity.threshold)
+
+
+    def test_spike_test_analyzer(self):
+        values = [36.5, 36.6, 38.9, 36.7, 36.6, 34.1, 36.5, 36.4, 36.5, 36.6]
+        timestamps = [datetime(2024, 7, 10, 9, 5 * i, 0) for i in range(len(values))]
+        test_values = [None] + [abs(values[i] - (values[i + 1] + values[i - 1]) / 2) -
+                                abs((values[i + 1] - values[i - 1]) / 2) for i in range(1, len(values) - 1)] + [None]
+        npt.assert_array_equal(np.array(test_values, dtype=float),
+                               NumpySpikeTestAnalyzer().calculate_test_values(values))
+
+        spikes = NumpySpikeTestAnalyzer().analyze(timestamps, values, Spikes.SpikeVariable.SALINITY_PSU, 1)
+        self.assertEqual([2, 5], spikes.indexes)
+        self.assertEqual([38.9, 34.1], spikes.values)
+        self.assertEqual([timestamps[2], timestamps[5]], spikes.timestamp)
+        self.assertEqual([Spikes.SpikeVariable.SALINITY_PSU] * 2, spikes.variable)
+
+    def test_streaming_spike_analyzer(self):
+        _, glider = self.__get_glider_data()
+        glider.salinity_psu = [35.5, 36.2, 35.8, 31.9, 34.49]
+        batch_analyzer = PandasWaveGliderV2OceanAnalyzer(glider)
+        streaming_analyzer = StreamingSpikeAnalyzer(batch_analyzer.spike_thresholds)
+
+        first_spikes = streaming_analyzer.update_batch(glider.timestamp[:2], {
+            Spikes.SpikeVariable.SALINITY_PSU: glider.salinity_psu[:2],
+            Spikes.SpikeVariable.OXYGEN_UMOL_L: glider.oxygen[:2]})
+        self.assertEqual([], first_spikes.indexes)
+        spikes = [streaming_analyzer.update(glider.timestamp[i], {
+            Spikes.SpikeVariable.SALINITY_PSU: glider.salinity_psu[i],
+            Spikes.SpikeVariable.OXYGEN_UMOL_L: glider.oxygen[i]}) for i in range(2, len(glider.timestamp))]
+
+        for variable in Spikes.SpikeVariable:
+            batch_spikes = batch_analyzer.analyze_outliers(glider, [variable])
+            streamed_spikes = [spike.filter_variable(variable, batch_analyzer.spike_thresholds[variable])
+                               for spike in spikes]
+            self.assertEqual(batch_spikes.indexes, [i for spike in streamed_spikes for i in spike.indexes])
+            self.assertEqual(batch_spikes.values, [v for spike in streamed_spikes for v in spike.values])
+            self.assertEqual(batch_spikes.timestamp, [t for spike in streamed_spikes for t in spike.timestamp])
+
+        variables = list(batch_analyzer.spike_thresholds)
+        whole_batch = StreamingSpikeAnalyzer(batch_analyzer.spike_thresholds).update_batch(glider.timestamp, {
+            Spikes.SpikeVariable.SALINITY_PSU: glider.salinity_psu, Spikes.SpikeVariable.OXYGEN_UMOL_L: glider.oxygen})
+        self.assertEqual(batch_analyzer.analyze_outliers(glider, variables).to_table(), whole_batch.to_table())
+
+    def test_spike_threshold_estimator(self):
+        values = np.random.default_rng(0).normal(36.8, 0.3, 100_000)
+        q75, q25 = np.percentile(values, [75, 25])
+        exact_estimator = SpikeThresholdEstimator().update(values[:50_000]).update(values[50_000:])
+        self.assertEqual((q75 - q25) * 1.5, exact_estimator.calculate_threshold())
+        self.assertEqual(0, exact_estimator.calculate_iqr_error_bound())
+        with_missing = np.append(values, np.nan)
+        q75_missing, q25_missing = np.percentile(with_missing, [75, 25])
+        self.assertTrue(np.isnan(SpikeThresholdEstimator().update(with_missing).calculate_threshold()))
+        self.assertTrue(np.isnan((q75_missing - q25_missing) * 1.5))
+        bounded_without_missing = SpikeThresholdEstimator(200).update(with_missing)
+        self.assertEqual(len(values), bounded_without_missing.sketch.count)
+
+        first_estimator = SpikeThresholdEstimator(200)
+        for chunk in np.array_split(values[:50_000], 10):
+            first_estimator.update(chunk)
+        merged_estimator = first_estimator.merge(SpikeThresholdEstimator(200).update(values[50_000:]))
+        self.assertLess(merged_estimator.sketch.retained_items(), 1000)
+        self.assertEqual(len(values), merged_estimator.sketch.count)
+        self.assertLessEqual(abs(merged_estimator.calculate_iqr() - (q75 - q25)),
+                             merged_estimator.calculate_iqr_error_bound())
+
+        mixed_estimator = SpikeThresholdEstimator().update(values[:50_000]).merge(
+            SpikeThresholdEstimator(64).update(values[50_000:]))
+        self.assertEqual(64, mixed_estimator.sketch.k)
+        self.assertLess(mixed_estimator.sketch.retained_items(), 1000)
+        self.assertLessEqual(abs(mixed_estimator.calculate_iqr() - (q75 - q25)),
+                             mixed_estimator.calculate_iqr_error_bound())
 
     def test_primitive_data_analyzer(self):
         values = [36.591, 36.671, 37.060, 142.226, 120.984, 78.312, 34.679, 56.789, 90.123, 45.678]
@@ -107,6 +214,40 @@ class PandasAnalyzerTest(unittest.TestCase):
         result = NumpyPrimitiveDataAnalyzer().analyze_intercuartilic_thresholds(values)
         self.assertEqual(real_result, result)
 
+    def test_spatial_index(self):
+        rng = np.random.default_rng(0)
+        latitudes = 28.4 + rng.uniform(0, 0.4, 5000)
+        longitudes = -18.1 + rng.uniform(0, 0.3, 5000)
+        latitudes[[5, 6]] = np.nan
+        index = SciPySpatialIndex(list(latitudes), list(longitudes))
+
+        inside_area = (longitudes >= -18.0) & (longitudes <= -17.9) & (latitudes >= 28.5) & (latitudes <= 28.6)
+        npt.assert_array_equal(np.flatnonzero(inside_area),
+                               index.within_area(LimitedPlotArea(-18.0, -17.9, 28.5, 28.6)))
+        npt.assert_array_equal(np.flatnonzero(~np.isnan(latitudes) & (latitudes >= 28.7)),
+                               index.within_area(LimitedPlotArea(None, None, 28.7, None)))
+
+        distances = index.distances_km(28.6, -17.95)
+        npt.assert_array_equal(np.flatnonzero(distances <= 5), index.within_radius(28.6, -17.95, 5))
+        self.assertAlmostEqual(111.2, SciPySpatialIndex([0.0], [0.0]).distances_km(1.0, 0.0)[0], 1)
+
+        triangle = Polygon([(-18.05, 28.45), (-17.85, 28.45), (-17.95, 28.75)])
+        expected = [position for position in range(len(latitudes))
+                    if triangle.intersects(Point(longitudes[position], latitudes[position]))]
+        npt.assert_array_equal(expected, index.within_polygon(triangle))
+
+    def test_geo_feature_analyzer(self):
+        lava_flows = ShapelyGeoFeatureAnalyzer(GeoPandasMap(gpd.GeoDataFrame(
+            geometry=[box(-17.95, 28.55, -17.90, 28.60), box(-17.85, 28.55, -17.80, 28.60)], crs="EPSG:4326")))
+        latitudes = [28.57, 28.61, 28.57, np.nan, 28.575]
+        longitudes = [-17.93, -17.93, -17.82, -17.93, -17.875]
+        npt.assert_array_equal([True, False, True, False, False], lava_flows.inside(latitudes, longitudes))
+        distances = lava_flows.distance_to_edges_km(latitudes, longitudes)
+        longitude_degree_km = 111.2 * np.cos(np.radians(28.575))
+        npt.assert_allclose([0.02 * longitude_degree_km, 0.01 * 111.2, 0.02 * longitude_degree_km,
+                             0.025 * longitude_degree_km], distances[[0, 1, 2, 4]], rtol=0.01)
+        self.assertTrue(np.isnan(distances[3]))
+
     def test_correlation_analyzer(self):
         input_data = CorrelationInput([1, 2, 3], [1, 2, 3], "test")
         expected_covariance = cov([1, 2, 3], [1, 2, 3])[1][1]
@@ -1,10 +1,14 @@
+import os
+import tempfile
 import unittest
 
 import geopandas
+import numpy as np
 import pandas as pd
 
 from etl.extractors.CSVPandasExtractor import CSVPandasExtractor
 from etl.extractors.GeoJsonGeoPandasExtractor import GeoJsonGeoPandasExtractor
+from model.CSVSchema import CSVSchema
 import pandas.testing as pdt
 import geopandas.testing as gpt
 
@@ -22,11 +26,75 @@ class PandasExtractorTest(unittest.TestCase):
         self.__assert_equal_frames(self.__get_csv_dataframe_unordered().iloc[:, :5],
                                    self.extractor_csv_without_date.extract("./resources/test.csv"))
 
+    def test_csv_extractor_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv = os.path.join(tmp_dir, "test.csv")
+            with open("./resources/test.csv") as original, open(csv, "w") as copy:
+                copy.write(original.read().rstrip("\n") + "\n")
+            cached_extractor = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None,
+                                                  cache_dir=os.path.join(tmp_dir, "cache"))
+            real_data = self.extractor_csv_with_date.extract(csv)
+            self.__assert_equal_frames(real_data, cached_extractor.extract(csv))
+            self.assertEqual(1, len(os.listdir(os.path.join(tmp_dir, "cache"))))
+            self.__assert_equal_frames(real_data, cached_extractor.extract(csv))
+
+            with open(csv, "a") as modified:
+                modified.write("11/24/2021 10:32 AM,PLOCAN (SO 4089),28.6,-17.9,0.2,22.5,5.2,203.3,36.8,FD03\n")
+            os.utime(csv, ns=(os.stat(csv).st_atime_ns, os.stat(csv).st_mtime_ns + 1))
+            self.assertEqual(len(real_data) + 1, len(cached_extractor.extract(csv)))
+            self.assertEqual(1, len(os.listdir(os.path.join(tmp_dir, "cache"))))
+
+    def test_csv_extractor_chunks(self):
+        chunked_extractor = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None, chunk_size=2)
+        chunks = list(chunked_extractor.extract_chunks("./resources/test.csv"))
+        self.assertListEqual([2, 2, 1], [len(chunk) for chunk in chunks])
+        self.__assert_equal_frames(self.extractor_csv_with_date.extract("./resources/test.csv"),
+                                   pd.concat(chunks))
+
+    def test_csv_extractor_shared(self):
+        first = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None, shared=True)
+        second = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None, shared=True)
+        with pd.option_context("mode.copy_on_write", True):
+            first, second = first.extract("./resources/test.csv"), second.extract("./resources/test.csv")
+            self.assertTrue(np.shares_memory(first["Pressure"].to_numpy(), second["Pressure"].to_numpy()))
+            first.loc[0, "Pressure"] = -1
+            self.__assert_equal_frames(self.extractor_csv_with_date.extract("./resources/test.csv"), second)
+        copied = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None, shared=True).extract(
+            "./resources/test.csv")
+        self.assertFalse(np.shares_memory(second["Pressure"].to_numpy(), copied["Pressure"].to_numpy()))
+
+    def test_csv_extractor_schema(self):
+        schema = CSVSchema({"Latitude(deg)": "float64", "Pressure": "float64", "Temperature": "float64",
+                            "Salinity (PSU)": "float64", "Payload Data": "str"},
+                           {"Latitude(deg)": 5e-6, "Temperature": 1e-12, "Salinity (PSU)": 5e-5})
+        real_data = self.extractor_csv_with_date.extract("./resources/test.csv")
+        typed = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None, schema=schema).extract(
+            "./resources/test.csv")
+        self.__assert_equal_frames(real_data, typed)
+        downcast = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None, schema=schema,
+                                      downcast=True).extract("./resources/test.csv")
+        self.assertListEqual([np.float32, np.float64, np.float32, np.float64],
+                             [downcast[column].dtype for column in ["Latitude(deg)", "Temperature", "Salinity (PSU)",
+                                                                   "Pressure"]])
+        pdt.assert_frame_equal(real_data, downcast, check_dtype=False, atol=5e-5, rtol=0)
+        chunks = CSVPandasExtractor(["TimeStamp"], "%m/%d/%Y %I:%M %p", None, schema=schema, downcast=True,
+                                    chunk_size=2).extract_chunks("./resources/test.csv")
+        self.__assert_equal_frames(real_data, pd.concat(chunks))
+
     def test_geojson_extractor(self):
         real = self.__get_geojson_dataframe()
         extracted = self.extractor_geojson.extract("./resources/test.geojson")
         self.assertListEqual([real["geometry"]["coordinates"]],extracted.get_coordinates().values.tolist())
 
+    def test_geojson_extractor_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cached_extractor = GeoJsonGeoPandasExtractor(tmp_dir)
+            gpt.assert_geodataframe_equal(self.extractor_geojson.extract("./resources/test.geojson"),
+                                          cached_extractor.extract("./resources/test.geojson"))
+            self.assertEqual(1, len(os.listdir(tmp_dir)))
+            gpt.assert_geodataframe_equal(self.extractor_geojson.extract("./resources/test.geojson"),
+                                          cached_extractor.extract("./resources/test.geojson"))
+
     def __assert_equal_frames(self, real, other):
         pdt.assert_frame_equal(real, other)
 
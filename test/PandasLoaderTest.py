@@ -2,6 +2,8 @@ import unittest
 from datetime import datetime
 
 import geopandas as gpd
+import numpy as np
+import numpy.testing as npt
 import pandas as pd
 import pandas.testing as pdt
 
@@ -71,6 +73,15 @@ class PandasLoaderTest(unittest.TestCase):
         glider = PandasWaveGliderV2OceanLoader().load(df)
         self.assertEqual(glider_real, glider)
 
+        columnar_glider = PandasWaveGliderV2OceanLoader(columnar=True).load(df)
+        self.assertTrue(columnar_glider.is_columnar())
+        self.assertFalse(glider.is_columnar())
+        self.assertEqual(glider_real, columnar_glider)
+        self.assertEqual("datetime64[ns]", columnar_glider.timestamp.dtype)
+        self.assertEqual(timestamps[1].date(), columnar_glider.timestamp[1].date())
+        self.assertEqual(salinity_psu[1:3], list(columnar_glider.salinity_psu[1:3]))
+        self.assertTrue(np.shares_memory(columnar_glider.salinity_psu, df["Salinity_PSU"].to_numpy()))
+
     def test_load_weather(self):
         timestamps = [datetime(2024, 4, 10, 9, 5, 0),
                       datetime(2024, 5, 10, 10, 0, 0),
@@ -113,3 +124,8 @@ class PandasLoaderTest(unittest.TestCase):
             [36.591, 36.671, 37.060],
             [1209, 5885, 9967])
         self.assertEqual(spikes.to_table(), real_sal_spikes.to_table())
+        columnar_spikes = PandasSpikesLoader(columnar=True).load(df)
+        self.assertEqual("datetime64[ns]", columnar_spikes.timestamp.dtype)
+        npt.assert_array_equal(real_sal_spikes.values, columnar_spikes.values)
+        npt.assert_array_equal(real_sal_spikes.indexes, columnar_spikes.indexes)
+        self.assertEqual(real_sal_spikes.timestamp, list(columnar_spikes.timestamp))
@@ -1,4 +1,7 @@
+import json
 import operator
+import os
+import tempfile
 import unittest
 from datetime import timedelta
 
@@ -7,6 +10,7 @@ import numpy.testing as npt
 import pandas.testing as pdt
 import pandas as pd
 
+from etl.transformers.PandasDatetimeFormatInferrer import PandasDatetimeFormatInferrer
 from etl.transformers.PandasTransformer import PandasTransformer
 from model.Spikes import Spikes
 from model.Table import Table
@@ -152,6 +156,11 @@ class PandasTransformerTest(unittest.TestCase):
         self.data = self.transformer.add_column(self.data, "testing_col_name", new_col_values)
         self.assertIn("testing_col_name", self.data.columns.values)
         npt.assert_array_equal(pd.Series(new_col_values).values, self.data["testing_col_name"].values)
+        self.data = self.transformer.add_column(self.data, "doubled_col", lambda values: values * 2,
+                                                ["testing_col_name"])
+        npt.assert_array_equal(np.array(new_col_values) * 2, self.data["doubled_col"].values)
+        with self.assertRaises(ValueError):
+            self.transformer.add_column(self.data, "missing_sources", lambda values: values * 2)
 
     def test_create_daily_means(self):
         data_to_compute_mean = pd.DataFrame({
@@ -183,6 +192,23 @@ class PandasTransformerTest(unittest.TestCase):
         data_computed = self.transformer.compute_average_per_timestamp(data_to_compute_mean, "TimeStamp")
         pdt.assert_frame_equal(data_real_computed, data_computed)
 
+    def test_aggregate_time_buckets(self):
+        data = pd.concat([self.data, self.__define_input_compute_day_hour()]).reset_index(drop=True)
+        data = data[["TimeStamp", "Latitude_deg", "Temperature_C"]]
+        buckets = self.transformer.aggregate_time_buckets(data, "TimeStamp", ["10min", "h", "D", "diurnal"])
+        for resolution in ["10min", "h", "D"]:
+            direct = data.drop(columns="TimeStamp").groupby(data["TimeStamp"].dt.floor(resolution))
+            for statistic in ["mean", "min", "max", "std", "count"]:
+                pdt.assert_frame_equal(getattr(direct, statistic)(), buckets[resolution][statistic],
+                                       check_dtype=statistic != "count")
+        diurnal = (data.drop(columns="TimeStamp")
+                   .groupby(data["TimeStamp"].dt.floor("10min").dt.strftime('%H:%M')).mean())
+        pdt.assert_frame_equal(diurnal, buckets["diurnal"]["mean"], check_names=False)
+        daily_buckets = self.transformer.aggregate_time_buckets(data, "TimeStamp", ["D", "diurnal"], ["mean"])
+        minute_diurnal = (data.drop(columns="TimeStamp")
+                          .groupby(data["TimeStamp"].dt.strftime('%H:%M')).mean())
+        pdt.assert_frame_equal(minute_diurnal, daily_buckets["diurnal"]["mean"], check_names=False)
+
     def test_remove_values_not_in(self):
         data_2 = pd.DataFrame({
             'TimeStamp': [
@@ -205,6 +231,22 @@ class PandasTransformerTest(unittest.TestCase):
         result = self.transformer.remove_values_not_in(self.data, "TimeStamp", data_2).reset_index(drop=True)
         pdt.assert_frame_equal(result, data_2)
 
+    def test_align_asof(self):
+        weather = pd.DataFrame({
+            'TimeStamp': pd.to_datetime(['2024-03-09 12:01:00', '2024-03-09 12:02:00', '2024-03-09 12:19:00',
+                                         '2024-03-09 12:50:00', '2024-03-09 12:11:00']),
+            'Wind_speed_kt': [10.0, 20.0, 5.0, 7.0, 3.0],
+            'Wind_gust_speed_kt': [12.0, 30.0, 6.0, 9.0, 4.0],
+        })
+        ocean, weather = self.transformer.align_asof(self.data, weather, "TimeStamp", timedelta(minutes=2),
+                                                     aggregations={"Wind_gust_speed_kt": "max"})
+        pdt.assert_frame_equal(ocean, self.data.iloc[[0, 2, 4]].reset_index(drop=True))
+        pdt.assert_frame_equal(weather, pd.DataFrame({
+            'TimeStamp': self.data["TimeStamp"][[0, 2, 4]].reset_index(drop=True),
+            'Wind_speed_kt': [15.0, 3.0, 5.0],
+            'Wind_gust_speed_kt': [30.0, 4.0, 6.0],
+        }))
+
     def test_compute_day_hour(self):
         self.data = self.__define_input_compute_day_hour()
 
@@ -214,6 +256,18 @@ class PandasTransformerTest(unittest.TestCase):
         real_result.reset_index(drop=True, inplace=True)
         pdt.assert_frame_equal(result, real_result)
 
+    def test_compute_day_hour_chunks(self):
+        data = self.__define_input_compute_day_hour()
+        chunks = [data.iloc[start:start + 4] for start in range(0, len(data), 4)]
+        result = self.transformer.compute_average_per_day_hour_chunks(chunks, "TimeStamp")
+        pdt.assert_frame_equal(result, self.__define_result_compute_day_hour())
+
+    def test_sort_chunks(self):
+        data = self.data.sample(frac=1, random_state=0).reset_index(drop=True)
+        chunks = [data.iloc[start:start + 3] for start in range(0, len(data), 3)]
+        result = pd.concat(self.transformer.sort_chunks(chunks, "TimeStamp", block_size=2), ignore_index=True)
+        pdt.assert_frame_equal(self.data, result)
+
     def test_eliminate_outliers(self):
         self.data["Oxygen_umol_L"] = [5.0, 6.5, 1.0, 6.5, 7.0, 7.5, 8.0, 1.5, 6.0, 5.5]
         outliers = Spikes([Spikes.SpikeVariable.OXYGEN_UMOL_L] * 2, 4, [self.data["TimeStamp"][2].to_pydatetime(),
@@ -224,6 +278,32 @@ class PandasTransformerTest(unittest.TestCase):
         df = self.transformer.interpolate_outliers(self.data, outliers, "TimeStamp")
         pdt.assert_series_equal(real_final_values, df["Oxygen_umol_L"])
 
+    def test_interpolate_outliers_along_time(self):
+        self.data["TimeStamp"] = self.data["TimeStamp"] + pd.to_timedelta([0, 0, 0, 0, 0, 0, 0, 25, 25, 25], unit="min")
+        self.data["Oxygen_umol_L"] = [5.0, 6.5, 1.0, 6.5, 7.0, 7.5, 8.0, 1.5, 6.0, 5.5]
+        self.data.loc[4, "Temperature_C"] = None
+        outliers = Spikes([Spikes.SpikeVariable.OXYGEN_UMOL_L] * 2, 4, [self.data["TimeStamp"][2].to_pydatetime(),
+                                                                        self.data["TimeStamp"][7].to_pydatetime()],
+                          [1, 1.5], [2, 7])
+        df = self.transformer.interpolate_outliers(self.data, outliers, "TimeStamp", method="time")
+        pdt.assert_series_equal(pd.Series([5.0, 6.5, 6.5, 6.5, 7.0, 7.5, 8.0, 8.0 - 2.0 * 30 / 35, 6.0, 5.5],
+                                          name="Oxygen_umol_L"),
+                                df["Oxygen_umol_L"])
+        self.assertTrue(np.isnan(df["Temperature_C"][4]))
+
+    def test_interpolate_outliers_and_filter(self):
+        self.data["Oxygen_umol_L"] = [5.0, 6.5, 1.0, 6.5, 7.0, 7.5, 8.0, 1.5, 6.0, 5.5]
+        self.data["Pressure_d"] = [1005.0, 0.0, 1004.0, 0.0, 1003.0, 1002.5, 0.0, 1001.5, 0.0, 1000.5]
+        outliers = Spikes([Spikes.SpikeVariable.OXYGEN_UMOL_L] * 2, 4, [self.data["TimeStamp"][2].to_pydatetime(),
+                                                             self.data["TimeStamp"][7].to_pydatetime()], [1, 1.5],
+                          [2, 7])
+        column_filters = [("Pressure_d", operator.gt, 0), ("TimeStamp", operator.lt, "2024-03-09 12:45:00")]
+        expected = self.transformer.filter_columns(
+            self.transformer.interpolate_outliers(self.data.copy(deep=True), outliers, "TimeStamp"), column_filters)
+        pdt.assert_frame_equal(expected, self.transformer.interpolate_outliers_and_filter(self.data, outliers,
+                                                                                          "TimeStamp",
+                                                                                          column_filters))
+
     def test_sort_values(self):
         data_unordered = self.data.copy(deep=True).sample(frac=1).reset_index(drop=True)
         result = self.transformer.sort_values(data_unordered, "TimeStamp")
@@ -245,12 +325,51 @@ class PandasTransformerTest(unittest.TestCase):
         self.data = self.transformer.merge_columns(self.data, ["A", "B"], "AB", " ")
         pdt.assert_frame_equal(wanted_results, self.data)
 
+    def test_merge_numeric_columns(self):
+        self.data["Day"] = self.data["TimeStamp"].dt.day
+        self.data.loc[3, "Oxygen"] = None
+        wanted_results = self.data[["Day", "Oxygen"]].astype(str).agg("-".join, axis=1)
+        self.data = self.transformer.merge_columns(self.data, ["Day", "Oxygen"], "Day_Oxygen", "-")
+        self.assertListEqual(wanted_results.tolist(), self.data["Day_Oxygen"].tolist())
+        self.assertEqual("9-nan", self.data["Day_Oxygen"][3])
+
     def test_parse_datetime_column(self):
         df_date_str = self.data.copy(deep=True)
         df_date_str["TimeStamp"] = self.data["TimeStamp"].dt.strftime('%Y-%m-%d %H:%M:%S')
         df_date_str = self.transformer.parse_datetime_column(df_date_str, "TimeStamp")
         pdt.assert_frame_equal(df_date_str, self.data)
 
+    def test_parse_datetime_column_format_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = os.path.join(tmp_dir, "source.asc")
+            open(source, "w").close()
+            df_date_str = self.data.copy(deep=True)
+            df_date_str["TimeStamp"] = ["13/03/2024 12:00"] * len(self.data)
+            PandasTransformer(tmp_dir).parse_datetime_column(df_date_str, "TimeStamp", source=source)
+            with open(os.path.join(tmp_dir, PandasDatetimeFormatInferrer.CACHE_FILE)) as cache:
+                self.assertListEqual(["%d/%m/%Y %H:%M"], [entry["format"] for entry in json.load(cache).values()])
+            df_date_str["TimeStamp"] = self.data["TimeStamp"].dt.strftime('%d/%m/%Y %H:%M')
+            result = PandasTransformer(tmp_dir).parse_datetime_column(df_date_str, "TimeStamp", source=source)
+            pdt.assert_frame_equal(result, self.data)
+
+    def test_assemble_datetime_column(self):
+        wanted_result = self.data.copy(deep=True)
+        self.data["Day"] = self.data.pop("TimeStamp").dt.day
+        self.data["Month"] = ["Mar"] * 10
+        self.data["Year"] = 2024
+        self.data["Time"] = wanted_result["TimeStamp"].dt.strftime('%H:%M:%S')
+        result = self.transformer.assemble_datetime_column(self.data, ["Day", "Month", "Year", "Time"], "TimeStamp")
+        pdt.assert_frame_equal(result, wanted_result[[*wanted_result.columns[1:], "TimeStamp"]])
+        numeric_month = self.data.assign(Month=3)
+        pdt.assert_frame_equal(self.transformer.assemble_datetime_column(numeric_month, ["Day", "Month", "Year", "Time"],
+                                                                         "TimeStamp"), result)
+        with_blank_row = self.data.astype({"Day": "Int64", "Year": "Int64"})
+        with_blank_row.loc[4, ["Day", "Month", "Year", "Time"]] = pd.NA
+        blank_result = self.transformer.assemble_datetime_column(with_blank_row, ["Day", "Month", "Year", "Time"],
+                                                                 "TimeStamp")
+        self.assertTrue(pd.isna(blank_result.loc[4, "TimeStamp"]))
+        pdt.assert_frame_equal(blank_result.drop(4), result.drop(4))
+
     def __define_input_compute_day_hour(self):
         original_latitudes = [-100,  # 21 del 8
                               -100, -90, -75, -60, -45, -30, -15, 0, 15, 30, 45,
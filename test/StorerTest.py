@@ -1,14 +1,38 @@
 import os
+import tempfile
 import unittest
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 from model.Table import Table
 from storer.CsvPandasStorer import CsvPandasStorer
 import pandas.testing as pdt
 
+from etl.transformers.NumpyTimePyramidBuilder import NumpyTimePyramidBuilder
+from graphers.MatplotlibFigureCreator import MatplotlibFigureCreator
+from graphers.ProcessPoolFigureRenderer import ProcessPoolFigureRenderer
+from model.params.BasicPlotParams import BasicPlotParams
+from model.params.LimitedPlotArea import LimitedPlotArea
+from model.params.MarkerParams import MarkerParams
+from model.params.compound_params.PlotStylishParams import PlotStylishParams
+from model.ocean_devices.WaveGliderV2Weather import WaveGliderV2Weather
 from storer.MatplotlibFigureStorer import MatplotlibFigureStorer
+from storer.NumpyTimePyramidStore import NumpyTimePyramidStore
+
+
+def create_figure(title: str) -> MatplotlibFigureCreator:
+    visualizer = MatplotlibFigureCreator(1, 1, (4, 3))
+    visualizer.create_timeseries([PlotStylishParams(BasicPlotParams([0, 1, 2], [1.0, 3.0, 2.0], "Temperatura"),
+                                                    MarkerParams("coral", "Temperatura", "-", 1),
+                                                    LimitedPlotArea(0, 2, 0, 4))],
+                                 [], title, [datetime(2024, 7, 10, 9, 5, 0)] * 3)
+    return visualizer
+
+
+def render_figure(path: str, title: str) -> None:
+    MatplotlibFigureStorer().store(path, create_figure(title).fig)
 
 
 class StorerTest(unittest.TestCase):
@@ -25,8 +49,74 @@ class StorerTest(unittest.TestCase):
 
     def test_jpg_storer(self):
         path = "resources/figura1.jpg"
-        self.figure_storer.store(path)
+        visualizer = create_figure("Figura")
+        self.figure_storer.store(path, visualizer.fig)
         self.assertTrue(os.path.isfile(path))
+        with open(path, "rb") as stored, tempfile.TemporaryDirectory() as tmp_dir:
+            blank_path = os.path.join(tmp_dir, "blanca.jpg")
+            self.figure_storer.store(blank_path, MatplotlibFigureCreator(1, 1, (4, 3)).fig)
+            with open(blank_path, "rb") as blank:
+                self.assertNotEqual(blank.read(), stored.read())
+
+    def test_figure_storer_renders_in_process_pool(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [os.path.join(tmp_dir, "figures", f"figura{i}.png") for i in range(3)]
+            with ProcessPoolFigureRenderer(2) as renderer:
+                for path in paths:
+                    renderer.submit(render_figure, path, "Figura")
+            in_process_path = os.path.join(tmp_dir, "figura_en_proceso.png")
+            render_figure(in_process_path, "Figura")
+            self.assertTrue(all(os.path.isfile(path) for path in paths))
+            with open(in_process_path, "rb") as in_process_figure:
+                in_process_bytes = in_process_figure.read()
+            for path in paths:
+                with open(path, "rb") as figure:
+                    self.assertEqual(in_process_bytes, figure.read())
+
+    def test_figure_storer_cache(self):
+        params = PlotStylishParams(BasicPlotParams([0, 1, 2], [1.0, 3.0, 2.0], "Temperatura"),
+                                   MarkerParams("coral", "Temperatura", "-", 1), LimitedPlotArea(0, 2, 0, 4))
+        changed_params = PlotStylishParams(BasicPlotParams([0, 1, 2], [1.0, 3.5, 2.0], "Temperatura"),
+                                           MarkerParams("coral", "Temperatura", "-", 1), LimitedPlotArea(0, 2, 0, 4))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "figures", "figura.png")
+            storer = MatplotlibFigureStorer(os.path.join(tmp_dir, "cache"))
+            self.assertFalse(storer.is_up_to_date(path, params, "Figura", (4, 3)))
+            visualizer = MatplotlibFigureCreator(1, 1, (4, 3))
+            visualizer.create_timeseries([params], [], "Figura", [datetime(2024, 7, 10, 9, 5, 0)] * 3)
+            storer.store(path, visualizer.fig)
+            next_run_storer = MatplotlibFigureStorer(os.path.join(tmp_dir, "cache"))
+            self.assertTrue(next_run_storer.is_up_to_date(path, params, "Figura", (4, 3)))
+            self.assertFalse(next_run_storer.is_up_to_date(path, changed_params, "Figura", (4, 3)))
+            self.assertFalse(next_run_storer.is_up_to_date(path, params, "Figura", (8, 6)))
+            os.remove(path)
+            self.assertFalse(next_run_storer.is_up_to_date(path, params, "Figura", (4, 3)))
+
+    def test_time_pyramid_store(self):
+        weather = self.__get_long_weather()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = NumpyTimePyramidStore(tmp_dir, NumpyTimePyramidBuilder(branching=4, min_buckets=16))
+            pyramids = store.get(weather)
+            self.assertEqual(1, len(os.listdir(tmp_dir)))
+            self.assertEqual(pyramids, store.get(weather))
+        temperature = pyramids["temperature_c"]
+        self.assertEqual([4, 16, 64, 256, 1024], [level.bucket_size for level in temperature.levels])
+        buckets = pd.Series(weather.temperature_c).groupby(weather.index // 16)
+        np.testing.assert_array_equal(buckets.min().to_numpy(), temperature.levels[1].minimums)
+        np.testing.assert_array_equal(buckets.max().to_numpy(), temperature.levels[1].maximums)
+        np.testing.assert_allclose(buckets.mean().to_numpy(), temperature.levels[1].means)
+        self.assertIs(temperature.levels[1], temperature.select_level(200))
+        self.assertIsNone(temperature.select_level(2000))
+
+    def __get_long_weather(self) -> WaveGliderV2Weather:
+        rng = np.random.default_rng(0)
+        n_samples = 5000
+        temperature_c = rng.normal(20, 1, n_samples)
+        temperature_c[[7, 100, 101, 102, 103]] = np.nan
+        return WaveGliderV2Weather(pd.date_range("2022-02-02", periods=n_samples, freq="min"), temperature_c,
+                                   rng.normal(10, 2, n_samples), rng.normal(15, 2, n_samples),
+                                   rng.uniform(0, 360, n_samples), np.full(n_samples, 28.6),
+                                   np.full(n_samples, -17.9))
 
     def __get_weather_table(self) -> Table:
         timestamps = [datetime(2024, 7, 10, 9, 5, 0),
@@ -1,6 +1,8 @@
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 
 
 class MatplotlibFigureVisualizer:
-    def visualize(self) -> None:
+    def visualize(self, figure: Figure) -> None:
+        plt.figure(figure)
         plt.show()